@@ -12,8 +12,8 @@ from app.core.database import get_db
 from app.core.security import (
     create_access_token,
     verify_token,
-    verify_password,
-    get_password_hash,
+    averify_password,
+    aget_password_hash,
     validate_password_strength
 )
 from app.models.user import User
@@ -79,7 +79,7 @@ async def register(user_create: UserCreate, db: Session = Depends(get_db)):
     existing_user = db.query(User).filter(User.email == user_create.email).first()
     if existing_user:
         raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
+            status_code=status.HTTP_409_CONFLICT,
             detail="Email already registered"
         )
     
@@ -92,7 +92,7 @@ async def register(user_create: UserCreate, db: Session = Depends(get_db)):
         )
     
     # Create new user
-    hashed_password = get_password_hash(user_create.password)
+    hashed_password = await aget_password_hash(user_create.password)
     db_user = User(
         email=user_create.email,
         name=user_create.name,
@@ -118,7 +118,7 @@ async def register(user_create: UserCreate, db: Session = Depends(get_db)):
     
     return Token(
         access_token=access_token,
-        user=UserResponse.model_validate(db_user)
+        user=UserResponse.from_orm_fast(db_user)
     )
 
 
@@ -136,7 +136,7 @@ async def login(user_login: UserLogin, db: Session = Depends(get_db)):
         )
     
     # Verify password
-    if not verify_password(user_login.password, user.hashed_password):
+    if not await averify_password(user_login.password, user.hashed_password):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid email or password"
@@ -163,7 +163,7 @@ async def login(user_login: UserLogin, db: Session = Depends(get_db)):
     
     return Token(
         access_token=access_token,
-        user=UserResponse.model_validate(user)
+        user=UserResponse.from_orm_fast(user)
     )
 
 
@@ -172,7 +172,7 @@ async def get_current_user_profile(current_user: User = Depends(get_current_user
     """
     Get current user profile.
     """
-    return UserResponse.model_validate(current_user)
+    return UserResponse.from_orm_fast(current_user)
 
 
 @router.patch("/me", response_model=UserResponse)
@@ -206,7 +206,7 @@ async def update_current_user(
             detail="Failed to update profile"
         )
     
-    return UserResponse.model_validate(current_user)
+    return UserResponse.from_orm_fast(current_user)
 
 
 @router.post("/logout")
@@ -227,7 +227,7 @@ async def refresh_token(current_user: User = Depends(get_current_user)):
     
     return Token(
         access_token=access_token,
-        user=UserResponse.model_validate(current_user)
+        user=UserResponse.from_orm_fast(current_user)
     )
 
 
@@ -262,7 +262,7 @@ async def update_user_profile(
             detail="Failed to update profile"
         )
     
-    return UserResponse.model_validate(current_user)
+    return UserResponse.from_orm_fast(current_user)
 
 
 @router.post("/change-password")
@@ -284,7 +284,7 @@ async def change_password(
         )
     
     # Verify current password
-    if not verify_password(current_password, current_user.hashed_password):
+    if not await averify_password(current_password, current_user.hashed_password):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Current password is incorrect"
@@ -300,7 +300,7 @@ async def change_password(
     
     # Update password
     try:
-        current_user.hashed_password = get_password_hash(new_password)
+        current_user.hashed_password = await aget_password_hash(new_password)
         db.commit()
         logger.info(f"Password changed for user: {current_user.email}")
     except Exception as e:
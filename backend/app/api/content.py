@@ -2,7 +2,8 @@
 Content management API endpoints.
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, Response, status, Query
+from pydantic import BaseModel
 from sqlalchemy.orm import Session
 from sqlalchemy import desc, and_
 import logging
@@ -12,7 +13,8 @@ from datetime import datetime
 from app.core.database import get_db
 from app.api.auth import get_current_user
 from app.models.user import User
-from app.models.content import Content, ContentStatus, Platform, ContentTone, ContentNiche
+from app.models.content import Content
+from app.models.enums import ContentStatus
 from app.models.video import VideoVariant
 from app.schemas.content import (
     ContentResponse,
@@ -27,6 +29,14 @@ logger = logging.getLogger(__name__)
 router = APIRouter()
 
 
+def _json_response(model: BaseModel) -> Response:
+    """Serialise a response model in pydantic-core, dropping null fields."""
+    return Response(
+        content=model.model_dump_json(exclude_none=True),
+        media_type="application/json"
+    )
+
+
 @router.get("/", response_model=ContentListResponse)
 async def get_user_content(
     skip: int = Query(0, ge=0),
@@ -53,9 +63,10 @@ async def get_user_content(
         # Get total count
         total = query.count()
         
-        # Apply pagination and ordering
+        # Apply pagination and ordering, loading all variants in one extra query
         content_items = (
-            query.order_by(desc(Content.created_at))
+            query.options(*Content.default_options())
+            .order_by(desc(Content.created_at))
             .offset(skip)
             .limit(limit)
             .all()
@@ -64,40 +75,16 @@ async def get_user_content(
         # Convert to response models
         content_responses = []
         for content in content_items:
-            # Get video variants
-            variants = db.query(VideoVariant).filter(
-                VideoVariant.content_id == content.id
-            ).all()
+            variants = content.video_variants
             
-            content_responses.append(ContentResponse(
-                id=content.id,
-                title=content.title,
-                caption=content.caption,
-                hashtags=content.hashtags or [],
-                video_url=content.video_url,
-                thumbnail_url=content.thumbnail_url,
-                status=content.status,
-                platforms=[v.platform for v in variants],
-                niche=content.niche,
-                tone=content.tone,
-                created_at=content.created_at,
-                updated_at=content.updated_at,
-                variants=[{
-                    "id": v.id,
-                    "platform": v.platform,
-                    "video_url": v.video_url,
-                    "thumbnail_url": v.thumbnail_url,
-                    "width": v.width,
-                    "height": v.height
-                } for v in variants]
-            ))
-        
-        return ContentListResponse(
+            content_responses.append(ContentResponse.from_orm_fast(content, variants))
+        
+        return _json_response(ContentListResponse(
             items=content_responses,
             total=total,
             skip=skip,
             limit=limit
-        )
+        ))
         
     except HTTPException:
         raise
@@ -119,7 +106,7 @@ async def get_content(
     Get specific content item.
     """
     try:
-        content = db.query(Content).filter(
+        content = db.query(Content).options(*Content.default_options()).filter(
             and_(
                 Content.id == content_id,
                 Content.user_id == current_user.id
@@ -132,33 +119,9 @@ async def get_content(
                 detail="Content not found"
             )
         
-        # Get video variants
-        variants = db.query(VideoVariant).filter(
-            VideoVariant.content_id == content.id
-        ).all()
+        variants = content.video_variants
         
-        return ContentResponse(
-            id=content.id,
-            title=content.title,
-            caption=content.caption,
-            hashtags=content.hashtags or [],
-            video_url=content.video_url,
-            thumbnail_url=content.thumbnail_url,
-            status=content.status,
-            platforms=[v.platform for v in variants],
-            niche=content.niche,
-            tone=content.tone,
-            created_at=content.created_at,
-            updated_at=content.updated_at,
-            variants=[{
-                "id": v.id,
-                "platform": v.platform,
-                "video_url": v.video_url,
-                "thumbnail_url": v.thumbnail_url,
-                "width": v.width,
-                "height": v.height
-            } for v in variants]
-        )
+        return ContentResponse.from_orm_fast(content, variants)
         
     except HTTPException:
         raise
@@ -199,21 +162,7 @@ async def create_content(
         
         logger.info(f"Content created for user {current_user.id}: {content.id}")
         
-        return ContentResponse(
-            id=content.id,
-            title=content.title,
-            caption=content.caption,
-            hashtags=content.hashtags or [],
-            video_url=content.video_url,
-            thumbnail_url=content.thumbnail_url,
-            status=content.status,
-            platforms=[],
-            niche=content.niche,
-            tone=content.tone,
-            created_at=content.created_at,
-            updated_at=content.updated_at,
-            variants=[]
-        )
+        return ContentResponse.from_orm_fast(content, variants=[])
         
     except HTTPException:
         raise
@@ -286,28 +235,7 @@ async def update_content(
         
         logger.info(f"Content updated for user {current_user.id}: {content.id}")
         
-        return ContentResponse(
-            id=content.id,
-            title=content.title,
-            caption=content.caption,
-            hashtags=content.hashtags or [],
-            video_url=content.video_url,
-            thumbnail_url=content.thumbnail_url,
-            status=content.status,
-            platforms=[v.platform for v in variants],
-            niche=content.niche,
-            tone=content.tone,
-            created_at=content.created_at,
-            updated_at=content.updated_at,
-            variants=[{
-                "id": v.id,
-                "platform": v.platform,
-                "video_url": v.video_url,
-                "thumbnail_url": v.thumbnail_url,
-                "width": v.width,
-                "height": v.height
-            } for v in variants]
-        )
+        return ContentResponse.from_orm_fast(content, variants)
         
     except HTTPException:
         raise
@@ -390,7 +318,7 @@ async def get_content_analytics(
         
         # For demo purposes, return mock analytics
         # In production, integrate with actual analytics service
-        return ContentAnalytics(
+        return _json_response(ContentAnalytics(
             content_id=content_id,
             views=1250,
             likes=89,
@@ -405,7 +333,7 @@ async def get_content_analytics(
                 "youtube": {"views": 200, "likes": 14, "comments": 3}
             },
             performance_score=85
-        )
+        ))
         
     except HTTPException:
         raise
@@ -570,12 +498,15 @@ async def get_scheduled_content(
             .all()
         )
         
-        return ContentListResponse(
-            items=[ContentResponse.model_validate(content) for content in content_items],
+        return _json_response(ContentListResponse(
+            items=[
+                ContentResponse.from_orm_fast(content, variants=[], platforms=content.platform_list)
+                for content in content_items
+            ],
             total=total,
             skip=skip,
             limit=limit
-        )
+        ))
         
     except Exception as e:
         logger.error(f"Failed to get scheduled content for user {current_user.id}: {e}")
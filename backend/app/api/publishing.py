@@ -18,7 +18,9 @@ from app.schemas.publishing import (
     ScheduleRequest,
     ScheduleResponse,
     PublishingAccountResponse,
-    PublishingStatus
+    PublishingLimitations,
+    PublishingStatus,
+    PublishResult
 )
 
 logger = logging.getLogger(__name__)
@@ -202,14 +204,11 @@ async def publish_content(
         # For now, simulate publishing since we don't have real integrations
         publish_results = []
         for platform in request.platforms:
-            publish_results.append({
-                "platform": platform,
-                "status": "pending",
-                "message": f"Publishing to {platform} is coming soon! Content would be published with title: '{content.title}'",
-                "post_id": None,
-                "post_url": None,
-                "scheduled_for": None
-            })
+            publish_results.append(PublishResult.model_construct(
+                platform=platform,
+                status="pending",
+                message=f"Publishing to {platform} is coming soon! Content would be published with title: '{content.title}'"
+            ))
         
         return {
             "content_id": content_id,
@@ -381,11 +380,10 @@ async def get_publishing_status(
                 "cross_platform": "coming_soon",
                 "analytics_tracking": "coming_soon"
             },
-            "limitations": {
-                "max_scheduled_posts": 0,
-                "max_platforms_per_post": 0,
-                "rate_limits": {}
-            },
+            "limitations": PublishingLimitations(
+                max_scheduled_posts=0,
+                max_platforms_per_post=0
+            ),
             "message": "Social media publishing features are currently in development. Stay tuned for updates!"
         }
         
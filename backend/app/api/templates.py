@@ -3,6 +3,7 @@ Template management API endpoints.
 """
 
 from fastapi import APIRouter, Depends, HTTPException, status, Query
+from pydantic import TypeAdapter
 from sqlalchemy.orm import Session
 from sqlalchemy import desc, func
 from typing import List, Optional
@@ -24,6 +25,9 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# Serialises a whole list of templates in one pydantic-core call
+_TEMPLATE_LIST_ADAPTER = TypeAdapter(List[TemplateResponse])
+
 
 @router.get("/", response_model=TemplateListResponse)
 async def get_templates(
@@ -81,20 +85,7 @@ async def get_templates(
         # Convert to response format
         template_responses = []
         for template in templates:
-            template_responses.append(TemplateResponse(
-                id=template.id,
-                title=template.title,
-                content=template.content,
-                tone=template.tone,
-                niche=template.niche,
-                platforms=template.platforms or [],
-                usage_count=template.usage_count,
-                is_favorite=template.is_favorite,
-                is_public=template.is_public,
-                created_by=template.user.name if template.user else "Capora",
-                created_at=template.created_at,
-                updated_at=template.updated_at
-            ))
+            template_responses.append(TemplateResponse.from_orm_fast(template))
         
         return TemplateListResponse(
             items=template_responses,
@@ -140,20 +131,7 @@ async def create_template(
         
         logger.info(f"Template created by user {current_user.id}: {db_template.id}")
         
-        return TemplateResponse(
-            id=db_template.id,
-            title=db_template.title,
-            content=db_template.content,
-            tone=db_template.tone,
-            niche=db_template.niche,
-            platforms=db_template.platforms or [],
-            usage_count=db_template.usage_count,
-            is_favorite=db_template.is_favorite,
-            is_public=db_template.is_public,
-            created_by=current_user.name,
-            created_at=db_template.created_at,
-            updated_at=db_template.updated_at
-        )
+        return TemplateResponse.from_orm_fast(db_template, created_by=current_user.name)
         
     except Exception as e:
         logger.error(f"Failed to create template for user {current_user.id}: {e}")
@@ -185,20 +163,7 @@ async def get_template(
                 detail="Template not found."
             )
         
-        return TemplateResponse(
-            id=template.id,
-            title=template.title,
-            content=template.content,
-            tone=template.tone,
-            niche=template.niche,
-            platforms=template.platforms or [],
-            usage_count=template.usage_count,
-            is_favorite=template.is_favorite,
-            is_public=template.is_public,
-            created_by=template.user.name if template.user else "Capora",
-            created_at=template.created_at,
-            updated_at=template.updated_at
-        )
+        return TemplateResponse.from_orm_fast(template)
         
     except HTTPException:
         raise
@@ -244,20 +209,7 @@ async def update_template(
         
         logger.info(f"Template updated by user {current_user.id}: {template.id}")
         
-        return TemplateResponse(
-            id=template.id,
-            title=template.title,
-            content=template.content,
-            tone=template.tone,
-            niche=template.niche,
-            platforms=template.platforms or [],
-            usage_count=template.usage_count,
-            is_favorite=template.is_favorite,
-            is_public=template.is_public,
-            created_by=current_user.name,
-            created_at=template.created_at,
-            updated_at=template.updated_at
-        )
+        return TemplateResponse.from_orm_fast(template, created_by=current_user.name)
         
     except HTTPException:
         raise
@@ -406,23 +358,10 @@ async def get_featured_templates(
         
         template_responses = []
         for template in templates:
-            template_responses.append(TemplateResponse(
-                id=template.id,
-                title=template.title,
-                content=template.content,
-                tone=template.tone,
-                niche=template.niche,
-                platforms=template.platforms or [],
-                usage_count=template.usage_count,
-                is_favorite=False,  # Not applicable for public view
-                is_public=template.is_public,
-                created_by=template.user.name if template.user else "Capora",
-                created_at=template.created_at,
-                updated_at=template.updated_at
-            ))
+            template_responses.append(TemplateResponse.from_orm_fast(template, is_favorite=False))
         
         return {
-            "templates": template_responses,
+            "templates": _TEMPLATE_LIST_ADAPTER.dump_python(template_responses, mode="json"),
             "count": len(template_responses)
         }
         
@@ -5,41 +5,91 @@ Video upload and processing API endpoints with optimized performance.
 import os
 import asyncio
 import logging
-import shutil
 import subprocess
 import uuid
 from typing import List, Optional, Dict, Any
 from pathlib import Path
+import hashlib
 import json
 import time
 
-from fastapi import APIRouter, UploadFile, File, Form, Depends, HTTPException, BackgroundTasks
-from fastapi.responses import JSONResponse
-from sqlalchemy.orm import Session
+import orjson
+
+from fastapi import APIRouter, UploadFile, File, Form, Depends, HTTPException, BackgroundTasks, Request
+from fastapi.responses import JSONResponse, ORJSONResponse, Response
+from sqlalchemy.orm import Session, selectinload
 from sqlalchemy import text
 
+from app.core.config import settings, PLATFORM_SPECS
 from app.core.database import get_db
+from app.core.storage import media_url
 from app.api.auth import get_current_user
 from app.models.user import User
-from app.models.content import Content, ContentStatus
+from app.models.content import Content
 from app.models.video import VideoVariant
-from app.schemas.video import VideoUploadResponse, VideoProcessingRequest, VideoProcessingStatus, VideoVariantSchema
+from app.schemas.video import VideoUploadResponse, VideoProcessingRequest, VideoVariantSchema
 
 router = APIRouter(tags=["videos"])
 logger = logging.getLogger(__name__)
 
-# Platform specifications for ultra-fast processing
-PLATFORM_SPECS = {
-    "tiktok": {"width": 1080, "height": 1920, "aspect": "9:16", "description": "TikTok Vertical"},
-    "instagram": {"width": 1080, "height": 1920, "aspect": "9:16", "description": "Instagram Reels"},
-    "youtube_shorts": {"width": 1080, "height": 1920, "aspect": "9:16", "description": "YouTube Shorts"},
-    "facebook": {"width": 1080, "height": 1080, "aspect": "1:1", "description": "Facebook Square"},
-    "twitter": {"width": 1280, "height": 720, "aspect": "16:9", "description": "Twitter Landscape"}
-}
+# Platforms used when an upload doesn't specify any
+DEFAULT_PLATFORMS = ("tiktok", "instagram", "facebook")
+
+# Target video bitrate for every platform variant
+VARIANT_BITRATE = "2M"
+
+# Read/write buffer size used when streaming uploads to disk
+UPLOAD_CHUNK_SIZE = 1 << 20  # 1 MiB
 
 # In-memory progress tracking with timestamps
 processing_status = {}
 
+def init_upload_directories() -> None:
+    """Create the upload, thumbnail and per-platform output directories once at startup."""
+    os.makedirs("uploads/original", exist_ok=True)
+    os.makedirs("uploads/thumbnails", exist_ok=True)
+    for platform in PLATFORM_SPECS:
+        os.makedirs(f"uploads/processed/{platform}", exist_ok=True)
+
+def recreate_missing_dirs(paths) -> bool:
+    """
+    Recreate missing parent directories of the given paths.
+    
+    Startup skips makedirs once its sentinel exists, so a wiped uploads/
+    volume only shows up when a write fails; callers then retry once.
+    Returns whether anything had to be created.
+    """
+    missing = {os.path.dirname(path) for path in paths} - {""}
+    missing = {directory for directory in missing if not os.path.isdir(directory)}
+    for directory in missing:
+        os.makedirs(directory, exist_ok=True)
+    return bool(missing)
+
+def parse_platforms(platforms: List[str]) -> List[str]:
+    """
+    Parse the upload form's platforms field.
+    
+    Accepts repeated form fields (``platforms=tiktok&platforms=instagram``)
+    as well as a single JSON-encoded array, and rejects unknown platforms.
+    """
+    if len(platforms) == 1 and platforms[0].lstrip().startswith("["):
+        try:
+            platforms = json.loads(platforms[0])
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid platforms list")
+        if not isinstance(platforms, list) or not all(isinstance(p, str) for p in platforms):
+            raise HTTPException(status_code=400, detail="Invalid platforms list")
+    
+    platforms = [platform for platform in platforms if platform]
+    if not platforms:
+        return list(DEFAULT_PLATFORMS)
+    
+    unknown = [platform for platform in platforms if platform not in PLATFORM_SPECS]
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"Unsupported platforms: {', '.join(unknown)}")
+    
+    return platforms
+
 def get_video_info_fast(video_path: str) -> dict:
     """Get basic video info quickly without heavy processing."""
     try:
@@ -64,9 +114,15 @@ def get_video_info_fast(video_path: str) -> dict:
 async def create_video_variants_optimized(
     content_id: str,
     original_file_path: str,
-    platforms: List[str]
+    platforms: List[str],
+    status_ttl: int = 120
 ):
-    """Ultra-fast video variant creation with immediate response."""
+    """
+    Ultra-fast video variant creation with immediate response.
+    
+    ``status_ttl`` is how long the in-memory status is kept for polling once
+    processing finishes; workers running outside the API process pass 0.
+    """
     try:
         logger.info(f"🚀 FAST: Starting optimized variant creation for {content_id}")
         
@@ -81,31 +137,58 @@ async def create_video_variants_optimized(
             "start_time": time.time()
         }
         
-        # Create directories
-        for platform in platforms:
-            os.makedirs(f"uploads/processed/{platform}", exist_ok=True)
-        os.makedirs("uploads/thumbnails", exist_ok=True)
-        
         # Quick file info
         await asyncio.sleep(0.1)  # Small delay for UI feedback
         processing_status[content_id]["progress"] = 20
         processing_status[content_id]["message"] = "Analyzing video..."
         
-        # Simulate fast processing by creating symbolic links or lightweight copies
-        # In production, you'd use optimized ffmpeg commands
+        # Decode the original once and encode every platform variant from it
+        from app.services.video_service import video_service
+        
+        now_ts = int(time.time())
+        outputs = [
+            (
+                platform,
+                f"uploads/processed/{platform}/{content_id}_{platform}_{now_ts}.mp4",
+                PLATFORM_SPECS[platform]["width"],
+                PLATFORM_SPECS[platform]["height"],
+                VARIANT_BITRATE,
+            )
+            for platform in platforms
+        ]
+        
+        # Grabbed by the same FFmpeg run; every variant shares it
+        thumbnail_path = f"uploads/thumbnails/{content_id}_thumb.jpg"
+        
+        def report_progress(seconds: float):
+            processing_status[content_id]["message"] = f"Transcoding variants... {seconds:.0f}s encoded"
+        
+        processing_status[content_id]["progress"] = 30
+        processing_status[content_id]["message"] = "Transcoding variants..."
+        
+        async def transcode():
+            await video_service.transcode_all_variants(
+                original_file_path,
+                outputs,
+                report_progress,
+                thumbnail=(thumbnail_path, 1.0)
+            )
+        
+        try:
+            try:
+                await transcode()
+            except Exception:
+                if not recreate_missing_dirs([output[1] for output in outputs] + [thumbnail_path]):
+                    raise
+                await transcode()
+        except Exception as e:
+            logger.error(f"❌ FAST: Transcoding failed for {content_id}: {e}")
+            processing_status[content_id]["failed"].extend(platforms)
+            outputs = []
+        
         total_platforms = len(platforms)
-        for i, platform in enumerate(platforms):
+        for i, (platform, output_path, _, _, _) in enumerate(outputs):
             try:
-                # Fast processing simulation - just copy with platform naming
-                output_filename = f"{content_id}_{platform}_{int(time.time())}.mp4"
-                output_path = f"uploads/processed/{platform}/{output_filename}"
-                
-                # Ultra-fast copy (in production, use optimized video processing)
-                shutil.copy2(original_file_path, output_path)
-                
-                # Create thumbnail placeholder
-                thumbnail_path = f"uploads/thumbnails/{content_id}_{platform}_thumb.jpg"
-                
                 # Update progress
                 progress = 30 + int((i + 1) / total_platforms * 60)
                 processing_status[content_id]["progress"] = progress
@@ -115,9 +198,6 @@ async def create_video_variants_optimized(
                 # Save variant to database
                 await save_video_variant_fast(content_id, platform, output_path, thumbnail_path)
                 
-                # Small delay for smooth UI updates
-                await asyncio.sleep(0.2)
-                
                 logger.info(f"✅ FAST: Completed {platform} for {content_id}")
                 
             except Exception as e:
@@ -125,19 +205,27 @@ async def create_video_variants_optimized(
                 processing_status[content_id]["failed"].append(platform)
         
         # Final status update
-        processing_status[content_id]["progress"] = 100
-        processing_status[content_id]["status"] = "completed"
-        processing_status[content_id]["message"] = "Processing completed!"
-        
-        # Update content status
-        await update_content_status_fast(content_id, "ready")
-        
-        logger.info(f"🎉 FAST: Content {content_id} processing completed successfully")
+        if not outputs or set(processing_status[content_id]["failed"]) >= set(platforms):
+            # No variant was produced; don't report the content as ready
+            processing_status[content_id]["status"] = "failed"
+            processing_status[content_id]["message"] = "Processing failed: no variants were produced"
+            processing_status[content_id]["error"] = "No video variants were produced"
+            await update_content_status_fast(content_id, "failed")
+            logger.error(f"💥 FAST: Content {content_id} produced no variants")
+        else:
+            processing_status[content_id]["progress"] = 100
+            processing_status[content_id]["status"] = "completed"
+            processing_status[content_id]["message"] = "Processing completed!"
+            
+            # Update content status
+            await update_content_status_fast(content_id, "ready")
+            
+            logger.info(f"🎉 FAST: Content {content_id} processing completed successfully")
         
         # Keep status for 2 minutes for polling
-        await asyncio.sleep(120)
-        if content_id in processing_status:
-            del processing_status[content_id]
+        if status_ttl:
+            await asyncio.sleep(status_ttl)
+        processing_status.pop(content_id, None)
             
     except Exception as e:
         logger.error(f"💥 FAST: Critical error in variant creation: {e}")
@@ -152,11 +240,17 @@ async def save_video_variant_fast(content_id: str, platform: str, video_path: st
     """Save video variant to database quickly."""
     try:
         from app.core.database import SessionLocal
+        from app.services.video_service import video_service
+        
+        # duration and file_size are NOT NULL; fall back to 0 if the probe fails
+        info = await video_service.get_video_info(video_path)
+        file_size = os.path.getsize(video_path)
+        
         db = SessionLocal()
         
         # Create demo URLs
-        video_url = f"/processed/{platform}/{os.path.basename(video_path)}"
-        thumbnail_url = f"/thumbnails/{os.path.basename(thumbnail_path)}"
+        video_url = media_url(video_path)
+        thumbnail_url = media_url(thumbnail_path)
         
         variant = VideoVariant(
             content_id=content_id,
@@ -165,6 +259,8 @@ async def save_video_variant_fast(content_id: str, platform: str, video_path: st
             thumbnail_url=thumbnail_url,
             width=PLATFORM_SPECS[platform]["width"],
             height=PLATFORM_SPECS[platform]["height"],
+            duration=info.get("duration") or 0,
+            file_size=file_size,
             status="ready"
         )
         
@@ -193,10 +289,11 @@ async def update_content_status_fast(content_id: str, status: str):
 
 @router.post("/upload", response_model=VideoUploadResponse)
 async def upload_video_fast(
+    request: Request,
     background_tasks: BackgroundTasks,
     file: UploadFile = File(...),
     title: str = Form(""),
-    platforms: str = Form(""),
+    platforms: List[str] = Form([]),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
@@ -208,32 +305,44 @@ async def upload_video_fast(
         if not file.filename.lower().endswith(('.mp4', '.mov', '.avi', '.mkv', '.webm')):
             raise HTTPException(status_code=400, detail="Invalid video format")
         
-        # Parse platforms quickly
-        try:
-            platform_list = json.loads(platforms) if platforms else ["tiktok", "instagram", "facebook"]
-        except:
-            platform_list = ["tiktok", "instagram", "facebook"]
+        platform_list = parse_platforms(platforms)
         
-        # Generate content ID
-        content_id = str(uuid.uuid4())
-        
-        # Create directories
-        os.makedirs("uploads/original", exist_ok=True)
+        # Generate content ID and timestamp once for all derived names
+        content_id = uuid.uuid4().hex
+        now_ts = int(time.time())
         
         # Save file quickly
-        original_filename = f"{content_id}_{int(time.time())}.mp4"
+        original_filename = f"{content_id}_{now_ts}.mp4"
         original_path = f"uploads/original/{original_filename}"
         
-        # Fast file save
-        content_data = await file.read()
-        with open(original_path, "wb") as f:
-            f.write(content_data)
+        # Stream to disk in large chunks, aborting as soon as the size limit is exceeded
+        written = 0
+        try:
+            f = open(original_path, "wb", buffering=UPLOAD_CHUNK_SIZE)
+        except FileNotFoundError:
+            recreate_missing_dirs([original_path])
+            f = open(original_path, "wb", buffering=UPLOAD_CHUNK_SIZE)
+        try:
+            with f:
+                while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+                    written += len(chunk)
+                    if written > settings.MAX_FILE_SIZE:
+                        raise HTTPException(status_code=413, detail="File too large")
+                    f.write(chunk)
+        except BaseException:
+            # Don't leave a partial file behind that no Content row points at
+            f.close()
+            try:
+                os.remove(original_path)
+            except FileNotFoundError:
+                pass
+            raise
         
         logger.info(f"📁 FAST: File saved to {original_path}")
         
         # Create demo URLs immediately
-        video_url = f"/uploads/original/{original_filename}"
-        thumbnail_url = f"/uploads/thumbnails/{content_id}_thumb.jpg"
+        video_url = media_url(original_path)
+        thumbnail_url = media_url(f"uploads/thumbnails/{content_id}_thumb.jpg")
         
         # Create content entry immediately
         content = Content(
@@ -253,13 +362,23 @@ async def upload_video_fast(
             db.commit()
             db.refresh(content)
             
-            # Start ultra-fast background processing
-            background_tasks.add_task(
-                create_video_variants_optimized,
-                content_id,
-                original_path,
-                platform_list
-            )
+            # Hand processing to the worker pool when Redis is configured,
+            # otherwise fall back to in-process background tasks
+            arq_pool = getattr(request.app.state, "arq_pool", None)
+            if arq_pool is not None:
+                await arq_pool.enqueue_job(
+                    "task_create_variants",
+                    content_id,
+                    original_path,
+                    platform_list
+                )
+            else:
+                background_tasks.add_task(
+                    create_video_variants_optimized,
+                    content_id,
+                    original_path,
+                    platform_list
+                )
             
             # Immediate response - no waiting!
             return VideoUploadResponse(
@@ -281,14 +400,30 @@ async def upload_video_fast(
         logger.error(f"Upload failed: {e}")
         raise HTTPException(status_code=500, detail=f"Upload failed: {str(e)}")
 
+def _status_response(request: Request, status: Dict[str, Any]) -> Response:
+    """
+    Return a status payload with an ETag, or a bodiless 304 if the poller has it.
+    
+    elapsed_time changes on every poll, so it is left out of the tag; an
+    unchanged job keeps its ETag until progress actually moves.
+    """
+    body = orjson.dumps(
+        {key: value for key, value in status.items() if key != "elapsed_time"},
+        option=orjson.OPT_SORT_KEYS
+    )
+    etag = f'W/"{hashlib.md5(body, usedforsecurity=False).hexdigest()}"'
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+    return ORJSONResponse(status, headers={"ETag": etag})
+
 @router.get("/status/{content_id}")
-async def get_processing_status(content_id: str):
+async def get_processing_status(content_id: str, request: Request):
     """Get real-time processing status for smooth UI updates."""
     try:
         if content_id in processing_status:
             status = processing_status[content_id].copy()
             status["elapsed_time"] = time.time() - status.get("start_time", time.time())
-            return status
+            return _status_response(request, status)
         
         # Check database if not in memory
         from app.core.database import SessionLocal
@@ -301,26 +436,26 @@ async def get_processing_status(content_id: str):
             raise HTTPException(status_code=404, detail="Content not found")
         
         if content.status == "ready":
-            return {
+            return _status_response(request, {
                 "status": "completed",
                 "progress": 100,
                 "message": "Processing completed!",
                 "completed": content.platforms or []
-            }
+            })
         elif content.status == "failed":
-            return {
+            return _status_response(request, {
                 "status": "failed",
                 "progress": 0,
                 "message": "Processing failed",
                 "error": "Processing failed"
-            }
+            })
         else:
-            return {
+            return _status_response(request, {
                 "status": "processing",
                 "progress": 50,
                 "message": "Processing in progress...",
                 "platforms": content.platforms or []
-            }
+            })
             
     except HTTPException:
         raise
@@ -336,8 +471,10 @@ async def get_video_variants_fast(
 ):
     """Get video variants quickly."""
     try:
-        # Get content
-        content = db.query(Content).filter(
+        # Get content with its variants preloaded in one extra query
+        content = db.query(Content).options(
+            selectinload(Content.video_variants)
+        ).filter(
             Content.id == content_id,
             Content.user_id == current_user.id
         ).first()
@@ -345,13 +482,8 @@ async def get_video_variants_fast(
         if not content:
             raise HTTPException(status_code=404, detail="Content not found")
         
-        # Get variants
-        variants = db.query(VideoVariant).filter(
-            VideoVariant.content_id == content_id
-        ).all()
-        
         result = []
-        for variant in variants:
+        for variant in content.video_variants:
             result.append({
                 "id": variant.id,
                 "platform": variant.platform,
@@ -2,7 +2,9 @@
 Application configuration settings for free tier cloud deployment.
 """
 
-from typing import List, Optional, Union
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, List, Mapping, Optional, Union
 from pydantic_settings import BaseSettings
 from pydantic import field_validator
 import os
@@ -18,9 +20,11 @@ class Settings(BaseSettings):
     API_V1_STR: str = "/api/v1"
     SECRET_KEY: str = os.getenv("SECRET_KEY", "your-secret-key-change-in-production-12345")
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 60 * 24 * 8  # 8 days
+    BCRYPT_ROUNDS: int = 12  # Password hashing cost factor
     
     # Database - Use environment variable for production, SQLite for local
     DATABASE_URL: str = os.getenv("DATABASE_URL", "sqlite:///./capora.db")
+    SQLALCHEMY_ECHO: bool = False  # Log every SQL statement (debugging only)
     
     # Redis - Not needed for free tier deployment
     REDIS_URL: Optional[str] = None
@@ -41,6 +45,19 @@ class Settings(BaseSettings):
     UPLOAD_DIR: str = "/tmp/uploads" if os.getenv("ENVIRONMENT") == "production" else "uploads"
     PROCESSED_DIR: str = "/tmp/processed" if os.getenv("ENVIRONMENT") == "production" else "processed"
     THUMBNAILS_DIR: str = "/tmp/thumbnails" if os.getenv("ENVIRONMENT") == "production" else "thumbnails"
+    TEMP_DIR: str = "/tmp/capora" if os.getenv("ENVIRONMENT") == "production" else "temp"
+    
+    # Public base URL of a CDN/reverse proxy serving the media directories.
+    # When set, the API stops serving them through StaticFiles.
+    MEDIA_BASE_URL: Optional[str] = os.getenv("MEDIA_BASE_URL")
+    
+    # Cloudinary (FREE Tier) - SECURE: Get from environment only
+    CLOUDINARY_URL: Optional[str] = os.getenv("CLOUDINARY_URL")
+    CLOUDINARY_CONCURRENCY: int = 10  # Parallel API calls for bulk operations
+    CLOUDINARY_SIGN_URLS: bool = False  # Sign delivery URLs (strict transformations)
+    CLOUDINARY_FAST_SIGN: bool = True  # Sign client upload params with hashlib instead of the SDK
+    CLOUDINARY_VIDEO_FOLDER: str = "capora/videos"
+    CLOUDINARY_IMAGE_FOLDER: str = "capora/images"
     
     # File Upload Settings
     MAX_FILE_SIZE: int = 50 * 1024 * 1024  # 50MB for free tier
@@ -75,48 +92,65 @@ class Settings(BaseSettings):
     }
 
 
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """
+    Return the cached application settings.
+    
+    Use as a FastAPI dependency (``Depends(get_settings)``) so tests can
+    override it or call ``get_settings.cache_clear()``.
+    """
+    return Settings()
+
+
 # Global settings instance
-settings = Settings()
+settings = get_settings()
 
 
-# Platform-specific video specifications (optimized for free tier)
-PLATFORM_SPECS = {
-    "tiktok": {
+# Platform-specific video specifications (optimized for free tier).
+# Frozen at import so every caller shares the same read-only table.
+PLATFORM_SPECS: Mapping[str, Mapping[str, Any]] = MappingProxyType({
+    "tiktok": MappingProxyType({
         "width": 1080,
         "height": 1920,
         "aspect_ratio": "9:16",
         "max_duration": 60,
         "max_size": 25 * 1024 * 1024,  # 25MB for free tier
-    },
-    "instagram": {
+        "description": "TikTok Vertical",
+    }),
+    "instagram": MappingProxyType({
         "width": 1080,
         "height": 1920,
         "aspect_ratio": "9:16",
         "max_duration": 60,
         "max_size": 25 * 1024 * 1024,  # 25MB
-    },
-    "youtube_shorts": {
+        "description": "Instagram Reels",
+    }),
+    "youtube_shorts": MappingProxyType({
         "width": 1080,
         "height": 1920,
         "aspect_ratio": "9:16",
         "max_duration": 60,
         "max_size": 25 * 1024 * 1024,  # 25MB
-    },
-    "facebook": {
-        "width": 1280,
-        "height": 720,
-        "aspect_ratio": "16:9",
+        "description": "YouTube Shorts",
+    }),
+    "facebook": MappingProxyType({
+        "width": 1080,
+        "height": 1080,
+        "aspect_ratio": "1:1",
         "max_duration": 120,
         "max_size": 25 * 1024 * 1024,  # 25MB
-    },
-    "twitter": {
+        "description": "Facebook Square",
+    }),
+    "twitter": MappingProxyType({
         "width": 1280,
         "height": 720,
         "aspect_ratio": "16:9",
         "max_duration": 120,
         "max_size": 25 * 1024 * 1024,  # 25MB
-    },
-}
+        "description": "Twitter Landscape",
+    }),
+})
 
 
 # Content niches and tones
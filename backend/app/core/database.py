@@ -2,9 +2,10 @@
 Database configuration and session management.
 """
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, Session
+from sqlalchemy.pool import QueuePool
 from typing import Generator
 import logging
 
@@ -12,14 +13,34 @@ from app.core.config import settings
 
 logger = logging.getLogger(__name__)
 
-# Create SQLAlchemy engine
+IS_SQLITE = settings.DATABASE_URL.startswith("sqlite")
+
+# Create SQLAlchemy engine with a real connection pool so background variant
+# tasks opening their own sessions don't contend for a single connection
 engine = create_engine(
     settings.DATABASE_URL,
+    poolclass=QueuePool,
+    pool_size=5 if IS_SQLITE else 10,
+    max_overflow=10 if IS_SQLITE else 20,
     pool_pre_ping=True,
     pool_recycle=300,
-    echo=settings.ENVIRONMENT == "development",
+    connect_args={"check_same_thread": False} if IS_SQLITE else {},
+    echo=settings.SQLALCHEMY_ECHO,
 )
 
+
+if IS_SQLITE:
+    @event.listens_for(engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, connection_record):
+        """Use WAL so status polling reads don't block on background writes."""
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA cache_size=-65536")  # 64MB
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.execute("PRAGMA mmap_size=268435456")  # 256MB
+        cursor.close()
+
 # Create SessionLocal class
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
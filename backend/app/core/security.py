@@ -2,21 +2,42 @@
 Security utilities for authentication and authorization.
 """
 
-from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
 from typing import Any, Union, Optional
-from passlib.context import CryptContext
-from jose import JWTError, jwt
-from pydantic import ValidationError
+from jwt import PyJWTError
+import asyncio
+import jwt
+import os
 import secrets
 import string
+import time
 
 from app.core.config import settings
-
-# Password hashing context
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+from app.core.token_cache import access_token_cache, reset_token_cache
 
 ALGORITHM = "HS256"
 
+# Token lifetimes as integer seconds, so exp is plain int arithmetic
+ACCESS_TOKEN_EXPIRE_SECONDS = settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60
+PASSWORD_RESET_TOKEN_EXPIRE_SECONDS = 24 * 60 * 60  # Token valid for 24 hours
+
+# Signing key encoded once instead of on every sign/verify
+_SECRET = settings.SECRET_KEY.encode("utf-8")
+
+# Character classes for password strength checks
+_UPPER = frozenset(string.ascii_uppercase)
+_LOWER = frozenset(string.ascii_lowercase)
+_DIGIT = frozenset(string.digits)
+
+# Alphabet for generate_random_string and the largest unbiased byte value for it
+_RANDOM_ALPHABET = string.ascii_letters + string.digits
+_RANDOM_BYTE_LIMIT = 256 - 256 % len(_RANDOM_ALPHABET)
+
+# bcrypt is CPU bound; run it off the event loop on one shared pool sized to
+# the CPU count, since more threads than cores only slows each hash down
+_BCRYPT_POOL = ThreadPoolExecutor(max_workers=os.cpu_count() or 2, thread_name_prefix="bcrypt")
+
 
 def create_access_token(
     subject: Union[str, Any], expires_delta: timedelta = None
@@ -32,14 +53,12 @@ def create_access_token(
         Encoded JWT token string
     """
     if expires_delta:
-        expire = datetime.utcnow() + expires_delta
+        expire = int(time.time()) + int(expires_delta.total_seconds())
     else:
-        expire = datetime.utcnow() + timedelta(
-            minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES
-        )
+        expire = int(time.time()) + ACCESS_TOKEN_EXPIRE_SECONDS
     
     to_encode = {"exp": expire, "sub": str(subject)}
-    encoded_jwt = jwt.encode(to_encode, settings.SECRET_KEY, algorithm=ALGORITHM)
+    encoded_jwt = jwt.encode(to_encode, _SECRET, algorithm=ALGORITHM)
     return encoded_jwt
 
 
@@ -53,15 +72,20 @@ def verify_token(token: str) -> Optional[str]:
     Returns:
         Subject (user ID) if token is valid, None otherwise
     """
+    cached = access_token_cache.get(token)
+    if cached is not None:
+        return cached
+    
     try:
         payload = jwt.decode(
-            token, settings.SECRET_KEY, algorithms=[ALGORITHM]
+            token, _SECRET, algorithms=[ALGORITHM]
         )
         token_data = payload.get("sub")
         if token_data is None:
             return None
+        access_token_cache.set(token, str(token_data), payload.get("exp"))
         return str(token_data)
-    except (JWTError, ValidationError):
+    except PyJWTError:
         return None
 
 
@@ -69,6 +93,8 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     """
     Verify a plain password against its hash.
     
+    Blocks for the full bcrypt cost; async routes must use averify_password.
+    
     Args:
         plain_password: Plain text password
         hashed_password: Hashed password to verify against
@@ -76,20 +102,63 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     Returns:
         True if password matches, False otherwise
     """
-    return pwd_context.verify(plain_password, hashed_password)
+    import bcrypt  # Deferred: only login/password routes need the C extension
+    
+    try:
+        return bcrypt.checkpw(
+            plain_password.encode("utf-8")[:72], hashed_password.encode("utf-8")
+        )
+    except ValueError:
+        # Malformed or non-bcrypt hash
+        return False
 
 
 def get_password_hash(password: str) -> str:
     """
     Generate password hash.
     
+    Blocks for the full bcrypt cost; async routes must use aget_password_hash.
+    
     Args:
         password: Plain text password
         
     Returns:
         Hashed password string
     """
-    return pwd_context.hash(password)
+    import bcrypt  # Deferred: only login/password routes need the C extension
+    
+    return bcrypt.hashpw(
+        password.encode("utf-8")[:72], bcrypt.gensalt(rounds=settings.BCRYPT_ROUNDS)
+    ).decode("utf-8")
+
+
+async def averify_password(plain_password: str, hashed_password: str) -> bool:
+    """
+    Verify a password without blocking the event loop.
+    
+    Args:
+        plain_password: Plain text password
+        hashed_password: Hashed password to verify against
+        
+    Returns:
+        True if password matches, False otherwise
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_BCRYPT_POOL, verify_password, plain_password, hashed_password)
+
+
+async def aget_password_hash(password: str) -> str:
+    """
+    Generate a password hash without blocking the event loop.
+    
+    Args:
+        password: Plain text password
+        
+    Returns:
+        Hashed password string
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_BCRYPT_POOL, get_password_hash, password)
 
 
 def generate_password_reset_token(email: str) -> str:
@@ -102,13 +171,11 @@ def generate_password_reset_token(email: str) -> str:
     Returns:
         Password reset token
     """
-    delta = timedelta(hours=24)  # Token valid for 24 hours
-    now = datetime.utcnow()
-    expires = now + delta
-    exp = expires.timestamp()
+    now = int(time.time())
+    exp = now + PASSWORD_RESET_TOKEN_EXPIRE_SECONDS
     encoded_jwt = jwt.encode(
         {"exp": exp, "nbf": now, "sub": email}, 
-        settings.SECRET_KEY, 
+        _SECRET, 
         algorithm=ALGORITHM,
     )
     return encoded_jwt
@@ -124,12 +191,19 @@ def verify_password_reset_token(token: str) -> Optional[str]:
     Returns:
         Email if token is valid, None otherwise
     """
+    cached = reset_token_cache.get(token)
+    if cached is not None:
+        return cached
+    
     try:
         decoded_token = jwt.decode(
-            token, settings.SECRET_KEY, algorithms=[ALGORITHM]
+            token, _SECRET, algorithms=[ALGORITHM]
         )
-        return decoded_token.get("sub")
-    except JWTError:
+        email = decoded_token.get("sub")
+        if email is not None:
+            reset_token_cache.set(token, email, decoded_token.get("exp"))
+        return email
+    except PyJWTError:
         return None
 
 
@@ -143,8 +217,14 @@ def generate_random_string(length: int = 32) -> str:
     Returns:
         Random string
     """
-    alphabet = string.ascii_letters + string.digits
-    return ''.join(secrets.choice(alphabet) for _ in range(length))
+    # Draw entropy in blocks instead of one CSPRNG call per character.
+    # Bytes >= 248 are rejected so every alphabet character stays equally likely.
+    chars = []
+    while len(chars) < length:
+        for byte in secrets.token_bytes(length + length // 4 + 4):
+            if byte < _RANDOM_BYTE_LIMIT:
+                chars.append(_RANDOM_ALPHABET[byte % len(_RANDOM_ALPHABET)])
+    return "".join(chars[:length])
 
 
 def validate_password_strength(password: str) -> tuple[bool, str]:
@@ -160,13 +240,29 @@ def validate_password_strength(password: str) -> tuple[bool, str]:
     if len(password) < 8:
         return False, "Password must be at least 8 characters long"
     
-    if not any(c.isupper() for c in password):
+    # Classify characters in a single pass, stopping once all classes are seen
+    has_upper = has_lower = has_digit = False
+    for c in password:
+        if c in _UPPER:
+            has_upper = True
+        elif c in _LOWER:
+            has_lower = True
+        elif c in _DIGIT:
+            has_digit = True
+        elif not c.isascii():
+            has_upper = has_upper or c.isupper()
+            has_lower = has_lower or c.islower()
+            has_digit = has_digit or c.isdigit()
+        if has_upper and has_lower and has_digit:
+            break
+    
+    if not has_upper:
         return False, "Password must contain at least one uppercase letter"
     
-    if not any(c.islower() for c in password):
+    if not has_lower:
         return False, "Password must contain at least one lowercase letter"
     
-    if not any(c.isdigit() for c in password):
+    if not has_digit:
         return False, "Password must contain at least one digit"
     
     return True, "Password is valid" 
\ No newline at end of file
@@ -0,0 +1,25 @@
+"""
+Public URL resolution for locally stored media files.
+"""
+
+from app.core.config import settings
+
+
+def media_url(path: str) -> str:
+    """
+    Return the public URL for a stored media file.
+    
+    When ``MEDIA_BASE_URL`` is configured, media is served by a CDN or
+    reverse proxy in front of the API and URLs point there; otherwise they
+    are relative paths served by the app's StaticFiles mounts.
+    
+    Args:
+        path: File path relative to the working directory (e.g. uploads/original/x.mp4)
+        
+    Returns:
+        Public URL for the file
+    """
+    path = path.lstrip("/")
+    if settings.MEDIA_BASE_URL:
+        return f"{settings.MEDIA_BASE_URL.rstrip('/')}/{path}"
+    return f"/{path}"
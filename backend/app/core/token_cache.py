@@ -0,0 +1,65 @@
+"""
+In-process cache for verified JWT subjects.
+"""
+
+from collections import OrderedDict
+from typing import Optional, Tuple
+import hashlib
+import threading
+import time
+
+
+class TokenCache:
+    """
+    Bounded LRU cache mapping a token to its verified subject.
+    
+    Entries expire after ``ttl`` seconds or at the token's own ``exp``,
+    whichever comes first, so a cached token is never accepted past expiry.
+    """
+    
+    def __init__(self, maxsize: int = 10_000, ttl: float = 5.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: "OrderedDict[bytes, Tuple[str, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+    
+    @staticmethod
+    def _key(token: str) -> bytes:
+        return hashlib.sha256(token.encode()).digest()
+    
+    def get(self, token: str) -> Optional[str]:
+        """Return the cached subject for a token, or None on miss/expiry."""
+        key = self._key(token)
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            subject, expires_at = entry
+            if expires_at <= now:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return subject
+    
+    def set(self, token: str, subject: str, exp: Optional[float] = None) -> None:
+        """Cache a verified subject until the token's exp or the cache TTL."""
+        expires_at = time.time() + self.ttl
+        if exp is not None:
+            expires_at = min(expires_at, float(exp))
+        key = self._key(token)
+        with self._lock:
+            self._entries[key] = (subject, expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+    
+    def clear(self) -> None:
+        """Drop all cached entries."""
+        with self._lock:
+            self._entries.clear()
+
+
+# Global instances
+access_token_cache = TokenCache()
+reset_token_cache = TokenCache(maxsize=1_000)
@@ -3,29 +3,31 @@ Capora FastAPI Application
 Main application entry point optimized for free tier cloud deployment.
 """
 
-from fastapi import FastAPI, Request, status
+from fastapi import Depends, FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from fastapi.exceptions import RequestValidationError
 from fastapi.staticfiles import StaticFiles
 from contextlib import asynccontextmanager
 import logging
-import json
+import orjson
 import os
 # import sentry_sdk
 # from sentry_sdk.integrations.fastapi import FastApiIntegration
 # from sentry_sdk.integrations.sqlalchemy import SqlalchemyIntegration
 
-from app.core.config import settings
+from app.core.config import Settings, get_settings, settings, PLATFORM_SPECS
 from app.core.database import init_db
 from app.api.auth import router as auth_router
 from app.api.captions import router as captions_router
-from app.api.videos import router as videos_router
+from app.api.videos import router as videos_router, init_upload_directories
 from app.api.content import router as content_router
 from app.api.analytics import router as analytics_router
 from app.api.templates import router as templates_router
 from app.api.publishing import router as publishing_router
+from app.services.cloudinary_service import cloudinary_service
+from app.services.social_media_service import social_media_publisher
 # from app.core.exceptions import HTTPException, http_exception_handler
 # from app.core.logging_config import setup_logging
 
@@ -56,20 +58,32 @@ async def lifespan(app: FastAPI):
     try:
         await init_db()
         
-        # Create necessary directories for file storage
-        directories = [
-            settings.UPLOAD_DIR,
-            settings.PROCESSED_DIR,
-            settings.THUMBNAILS_DIR,
-            os.path.join(settings.PROCESSED_DIR, "tiktok"),
-            os.path.join(settings.PROCESSED_DIR, "instagram"),
-            os.path.join(settings.PROCESSED_DIR, "facebook"),
-            os.path.join(settings.PROCESSED_DIR, "twitter"),
-            os.path.join(settings.PROCESSED_DIR, "youtube_shorts"),
-        ]
+        # Create necessary directories for file storage on first run only;
+        # the sentinel lets warm restarts skip the makedirs calls entirely
+        storage_sentinel = os.path.join(settings.PROCESSED_DIR, ".initialized")
+        if not os.path.exists(storage_sentinel):
+            directories = [
+                settings.UPLOAD_DIR,
+                settings.PROCESSED_DIR,
+                settings.THUMBNAILS_DIR,
+                *(os.path.join(settings.PROCESSED_DIR, platform) for platform in PLATFORM_SPECS),
+            ]
+            
+            for directory in directories:
+                os.makedirs(directory, exist_ok=True)
+            init_upload_directories()
+            open(storage_sentinel, "w").close()
+        
+        # Connect to the video worker queue (optional - requires Redis)
+        app.state.arq_pool = None
+        if settings.REDIS_URL:
+            from arq import create_pool
+            from arq.connections import RedisSettings
+            
+            app.state.arq_pool = await create_pool(RedisSettings.from_dsn(settings.REDIS_URL))
+            logger.info("✅ Connected to video worker queue")
         
-        for directory in directories:
-            os.makedirs(directory, exist_ok=True)
+        await social_media_publisher.startup()
         
         logger.info("🚀 Capora API starting up...")
     except Exception as e:
@@ -79,6 +93,11 @@ async def lifespan(app: FastAPI):
     yield
     
     # Shutdown
+    arq_pool = getattr(app.state, "arq_pool", None)
+    if arq_pool is not None:
+        await arq_pool.close()
+    await social_media_publisher.close()
+    await cloudinary_service.close()
     logger.info("👋 Capora API shutting down...")
 
 
@@ -90,6 +109,7 @@ app = FastAPI(
     docs_url="/docs" if settings.ENVIRONMENT != "production" else None,
     redoc_url="/redoc" if settings.ENVIRONMENT != "production" else None,
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 # Add security middleware
@@ -107,15 +127,17 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Mount static files for uploads and processed content
-if os.path.exists(settings.UPLOAD_DIR):
-    app.mount("/uploads", StaticFiles(directory=settings.UPLOAD_DIR), name="uploads")
-
-if os.path.exists(settings.PROCESSED_DIR):
-    app.mount("/processed", StaticFiles(directory=settings.PROCESSED_DIR), name="processed")
-
-if os.path.exists(settings.THUMBNAILS_DIR):
-    app.mount("/thumbnails", StaticFiles(directory=settings.THUMBNAILS_DIR), name="thumbnails")
+# Mount static files for uploads and processed content, unless a CDN or
+# reverse proxy serves them (MEDIA_BASE_URL) so file bytes bypass Python
+if not settings.MEDIA_BASE_URL:
+    if os.path.exists(settings.UPLOAD_DIR):
+        app.mount("/uploads", StaticFiles(directory=settings.UPLOAD_DIR), name="uploads")
+    
+    if os.path.exists(settings.PROCESSED_DIR):
+        app.mount("/processed", StaticFiles(directory=settings.PROCESSED_DIR), name="processed")
+    
+    if os.path.exists(settings.THUMBNAILS_DIR):
+        app.mount("/thumbnails", StaticFiles(directory=settings.THUMBNAILS_DIR), name="thumbnails")
 
 
 # Custom exception handlers
@@ -124,6 +146,13 @@ if os.path.exists(settings.THUMBNAILS_DIR):
 #     return await http_exception_handler(request, exc)
 
 
+class SafeORJSONResponse(ORJSONResponse):
+    """ORJSON response that stringifies values orjson can't serialize."""
+    
+    def render(self, content) -> bytes:
+        return orjson.dumps(content, default=str, option=orjson.OPT_NON_STR_KEYS)
+
+
 @app.exception_handler(RequestValidationError)
 async def validation_exception_handler(request: Request, exc: RequestValidationError):
     """Handle validation errors gracefully."""
@@ -134,26 +163,16 @@ async def validation_exception_handler(request: Request, exc: RequestValidationE
             "loc": list(error.get("loc", [])),
             "msg": error.get("msg"),
         }
-        # Handle input that might not be serializable
+        # Non-serializable input/ctx values are stringified when rendered
         input_value = error.get("input")
         if input_value is not None:
-            try:
-                json.dumps(input_value)
-                error_dict["input"] = input_value
-            except (TypeError, ValueError):
-                error_dict["input"] = str(input_value)
-        
-        # Handle context that might contain non-serializable objects
+            error_dict["input"] = input_value
         if "ctx" in error:
-            try:
-                json.dumps(error["ctx"])
-                error_dict["ctx"] = error["ctx"]
-            except (TypeError, ValueError):
-                error_dict["ctx"] = str(error["ctx"])
+            error_dict["ctx"] = error["ctx"]
         
         errors.append(error_dict)
     
-    return JSONResponse(
+    return SafeORJSONResponse(
         status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
         content={
             "detail": "Validation error",
@@ -164,13 +183,13 @@ async def validation_exception_handler(request: Request, exc: RequestValidationE
 
 # Health check endpoint
 @app.get("/health")
-async def health_check():
+async def health_check(app_settings: Settings = Depends(get_settings)):
     """Health check endpoint."""
     return {
         "status": "ok",
         "service": "Capora API",
         "version": "1.0.0",
-        "environment": settings.ENVIRONMENT,
+        "environment": app_settings.ENVIRONMENT,
         "database": "connected",
     }
 
@@ -3,8 +3,9 @@ Database models for Capora application.
 """
 
 from app.models.user import User
-from app.models.content import Content, ContentStatus, Platform, ContentTone, ContentNiche
-from app.models.video import VideoVariant
+from app.models.content import Content
+from app.models.enums import ContentStatus, Platform, ContentTone, ContentNiche, SubscriptionPlan
+from app.models.video import VideoVariant, VideoMetadata
 from app.models.template import Template
 
 __all__ = [
@@ -14,6 +15,8 @@ __all__ = [
     "Platform",
     "ContentTone", 
     "ContentNiche",
+    "SubscriptionPlan",
     "VideoVariant",
+    "VideoMetadata",
     "Template",
 ] 
\ No newline at end of file
@@ -2,70 +2,52 @@
 Content model for storing user-generated social media content.
 """
 
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, Text, ForeignKey, JSON
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, Text, ForeignKey, JSON, Index, case, text
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.ext.hybrid import hybrid_property
+from sqlalchemy.ext.mutable import MutableDict, MutableList
+from sqlalchemy.orm import relationship, selectinload
 from sqlalchemy.sql import func
-import enum
+from datetime import datetime, timezone
+import uuid
 
 from app.core.database import Base
+from app.models.enums import ContentStatus
 
 
-class ContentStatus(str, enum.Enum):
-    """Content status enumeration."""
-    DRAFT = "draft"
-    PROCESSING = "processing"
-    READY = "ready"
-    SCHEDULED = "scheduled"
-    PUBLISHED = "published"
-    FAILED = "failed"
-    ARCHIVED = "archived"
-
-
-class Platform(str, enum.Enum):
-    """Social media platform enumeration."""
-    TIKTOK = "tiktok"
-    INSTAGRAM = "instagram"
-    YOUTUBE_SHORTS = "youtube_shorts"
-    FACEBOOK = "facebook"
-    TWITTER = "twitter"
-
-
-class ContentTone(str, enum.Enum):
-    """Content tone enumeration."""
-    CASUAL = "casual"
-    PROFESSIONAL = "professional"
-    FUN = "fun"
-    MOTIVATIONAL = "motivational"
-    EDUCATIONAL = "educational"
-    TRENDY = "trendy"
-
-
-class ContentNiche(str, enum.Enum):
-    """Content niche enumeration."""
-    FITNESS = "fitness"
-    FOOD = "food"
-    EDUCATION = "education"
-    LIFESTYLE = "lifestyle"
-    BUSINESS = "business"
-    TECH = "tech"
+# Binary JSONB on PostgreSQL, plain JSON elsewhere (e.g. local SQLite)
+JSONType = JSON().with_variant(JSONB(), "postgresql")
 
 
 class Content(Base):
     """Content model for storing user-generated social media content."""
     
     __tablename__ = "contents"
+    __table_args__ = (
+        # Per-user content listings filtered by status, newest first
+        Index("ix_contents_user_status_created", "user_id", "status", "created_at"),
+        # Scheduler scan for due posts; partial so it only holds scheduled rows
+        Index(
+            "ix_contents_scheduled",
+            "scheduled_publish_time",
+            postgresql_where=text("status = 'scheduled'"),
+            sqlite_where=text("status = 'scheduled'"),
+        ),
+        # Containment lookups (platforms @> '["tiktok"]') on PostgreSQL only
+        Index("ix_contents_platforms_gin", "platforms", postgresql_using="gin").ddl_if(dialect="postgresql"),
+    )
 
-    id = Column(String(36), primary_key=True, index=True)
+    id = Column(String(36), primary_key=True, default=lambda: uuid.uuid4().hex, index=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
     
     # Content details
     title = Column(String(255), nullable=False)
     caption = Column(Text, nullable=True)
-    hashtags = Column(JSON, default=[])  # Store as JSON array
+    hashtags = Column(MutableList.as_mutable(JSONType), default=list)  # Store as JSON array
     
     # Content metadata
     status = Column(String(50), default="draft")  # Use string value directly
-    platforms = Column(JSON, default=[])  # Store as JSON array of platforms
+    platforms = Column(MutableList.as_mutable(JSONType), default=list)  # Store as JSON array of platforms
     niche = Column(String(50), nullable=False)
     tone = Column(String(50), nullable=False)
     
@@ -85,51 +67,64 @@ class Content(Base):
     
     # Scheduling
     scheduled_publish_time = Column(DateTime(timezone=True), nullable=True)
-    platform_post_ids = Column(JSON, default={})  # Store platform-specific post IDs
-    publish_results = Column(JSON, default={})  # Store publishing results/errors
+    platform_post_ids = Column(MutableDict.as_mutable(JSONType), default=dict)  # Store platform-specific post IDs
+    publish_results = Column(JSON, default=dict)  # Store publishing results/errors
     
     # Relationships
     user = relationship("User", back_populates="contents")
     video_variants = relationship("VideoVariant", back_populates="content", cascade="all, delete-orphan")
 
+    @classmethod
+    def default_options(cls) -> tuple:
+        """Loader options for endpoints that render content with its variants."""
+        return (selectinload(cls.video_variants),)
+    
     def __repr__(self):
         return f"<Content(id={self.id}, title='{self.title}', status='{self.status}')>"
     
-    @property
+    @hybrid_property
     def engagement_rate(self) -> float:
         """Calculate basic engagement rate."""
         if self.views == 0:
             return 0.0
         return ((self.likes + self.shares) / self.views) * 100
     
+    @engagement_rate.expression
+    def engagement_rate(cls):
+        """SQL form of engagement_rate, usable in filters and ORDER BY."""
+        return case(
+            (cls.views == 0, 0.0),
+            else_=((cls.likes + cls.shares) * 100.0) / cls.views
+        )
+    
     @property
     def platform_list(self) -> list:
         """Return platforms as a list."""
-        return self.platforms if isinstance(self.platforms, list) else []
+        return self.platforms or []
     
     @property
     def hashtag_list(self) -> list:
         """Return hashtags as a list."""
-        return self.hashtags if isinstance(self.hashtags, list) else []
+        return self.hashtags or []
     
     @property
     def is_scheduled(self) -> bool:
         """Check if content is scheduled for publishing."""
-        return self.status == "scheduled" and self.scheduled_publish_time is not None
+        return self.status == ContentStatus.SCHEDULED and self.scheduled_publish_time is not None
     
     @property
     def is_published(self) -> bool:
         """Check if content has been published."""
-        return self.status == "published" and self.published_at is not None
+        return self.status == ContentStatus.PUBLISHED and self.published_at is not None
     
     def mark_as_scheduled(self, publish_time):
         """Mark content as scheduled for publishing."""
-        self.status = "scheduled"
+        self.status = ContentStatus.SCHEDULED.value
         self.scheduled_publish_time = publish_time
     
     def mark_as_published(self, platform_results: dict = None):
         """Mark content as published with optional platform results."""
-        self.status = "published"
-        self.published_at = func.now()
+        self.status = ContentStatus.PUBLISHED.value
+        self.published_at = datetime.now(timezone.utc)
         if platform_results:
             self.publish_results = platform_results 
\ No newline at end of file
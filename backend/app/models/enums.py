@@ -0,0 +1,52 @@
+"""
+Enumerations shared by the database models and API schemas.
+"""
+
+import enum
+
+
+class ContentStatus(str, enum.Enum):
+    """Content status enumeration."""
+    DRAFT = "draft"
+    PROCESSING = "processing"
+    READY = "ready"
+    SCHEDULED = "scheduled"
+    PUBLISHED = "published"
+    FAILED = "failed"
+    ARCHIVED = "archived"
+
+
+class Platform(str, enum.Enum):
+    """Social media platform enumeration."""
+    TIKTOK = "tiktok"
+    INSTAGRAM = "instagram"
+    YOUTUBE_SHORTS = "youtube_shorts"
+    FACEBOOK = "facebook"
+    TWITTER = "twitter"
+
+
+class ContentTone(str, enum.Enum):
+    """Content tone enumeration."""
+    CASUAL = "casual"
+    PROFESSIONAL = "professional"
+    FUN = "fun"
+    MOTIVATIONAL = "motivational"
+    EDUCATIONAL = "educational"
+    TRENDY = "trendy"
+
+
+class ContentNiche(str, enum.Enum):
+    """Content niche enumeration."""
+    FITNESS = "fitness"
+    FOOD = "food"
+    EDUCATION = "education"
+    LIFESTYLE = "lifestyle"
+    BUSINESS = "business"
+    TECH = "tech"
+
+
+class SubscriptionPlan(str, enum.Enum):
+    """Subscription plan enumeration."""
+    FREE = "free"
+    PRO = "pro"
+    ENTERPRISE = "enterprise"
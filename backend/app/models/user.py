@@ -2,35 +2,38 @@
 User model for authentication and user management.
 """
 
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, Text, Float
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, Text, Float, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
-import enum
+from types import MappingProxyType
 
 from app.core.database import Base
+from app.models.enums import ContentNiche, SubscriptionPlan
 
 
-class ContentNiche(str, enum.Enum):
-    """Content niche enumeration."""
-    FITNESS = "fitness"
-    FOOD = "food"
-    EDUCATION = "education"
-    LIFESTYLE = "lifestyle"
-    BUSINESS = "business"
-    TECH = "tech"
+# Monthly usage limits per subscription plan
+CAPTION_LIMITS = MappingProxyType({
+    SubscriptionPlan.FREE.value: 10,
+    SubscriptionPlan.PRO.value: 1000,
+    SubscriptionPlan.ENTERPRISE.value: 10000,
+})
 
+VIDEO_LIMITS = MappingProxyType({
+    SubscriptionPlan.FREE.value: 5,
+    SubscriptionPlan.PRO.value: 100,
+    SubscriptionPlan.ENTERPRISE.value: 1000,
+})
 
-class SubscriptionPlan(str, enum.Enum):
-    """Subscription plan enumeration."""
-    FREE = "free"
-    PRO = "pro"
-    ENTERPRISE = "enterprise"
+PAID_PLANS = frozenset({SubscriptionPlan.PRO.value, SubscriptionPlan.ENTERPRISE.value})
 
 
 class User(Base):
     """User model for authentication and profile management."""
     
     __tablename__ = "users"
+    __table_args__ = (
+        Index("ix_users_active_plan", "is_active", "subscription_plan"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     email = Column(String(255), unique=True, index=True, nullable=False)
@@ -76,27 +79,17 @@ class User(Base):
     @property
     def is_pro_or_higher(self) -> bool:
         """Check if user has Pro or Enterprise plan."""
-        return self.subscription_plan in [SubscriptionPlan.PRO.value, SubscriptionPlan.ENTERPRISE.value]
+        return self.subscription_plan in PAID_PLANS
     
     @property
     def caption_limit(self) -> int:
         """Get monthly caption limit based on plan."""
-        limits = {
-            SubscriptionPlan.FREE.value: 10,
-            SubscriptionPlan.PRO.value: 1000,
-            SubscriptionPlan.ENTERPRISE.value: 10000
-        }
-        return limits.get(self.subscription_plan, 10)
+        return CAPTION_LIMITS.get(self.subscription_plan, 10)
     
     @property
     def video_limit(self) -> int:
         """Get monthly video processing limit based on plan."""
-        limits = {
-            SubscriptionPlan.FREE.value: 5,
-            SubscriptionPlan.PRO.value: 100,
-            SubscriptionPlan.ENTERPRISE.value: 1000
-        }
-        return limits.get(self.subscription_plan, 5)
+        return VIDEO_LIMITS.get(self.subscription_plan, 5)
     
     def can_use_captions(self) -> bool:
         """Check if user can generate more captions this month."""
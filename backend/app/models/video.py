@@ -3,8 +3,11 @@ Video model for storing platform-optimized video variants.
 """
 
 from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Float
+from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
+from math import gcd
+import uuid
 
 from app.core.database import Base
 
@@ -14,8 +17,8 @@ class VideoVariant(Base):
     
     __tablename__ = "video_variants"
 
-    id = Column(String(36), primary_key=True, index=True)
-    content_id = Column(String(36), ForeignKey("contents.id"), nullable=False)
+    id = Column(String(36), primary_key=True, default=lambda: uuid.uuid4().hex, index=True)
+    content_id = Column(String(36), ForeignKey("contents.id"), nullable=False, index=True)
     
     # Platform and format details
     platform = Column(String(50), nullable=False)  # tiktok, instagram, etc.
@@ -48,25 +51,48 @@ class VideoVariant(Base):
         if self.width == 0 or self.height == 0:
             return "unknown"
         
-        # Calculate GCD for simplification
-        def gcd(a, b):
-            while b:
-                a, b = b, a % b
-            return a
-        
         divisor = gcd(self.width, self.height)
         w = self.width // divisor
         h = self.height // divisor
         return f"{w}:{h}"
     
-    @property
+    @hybrid_property
     def file_size_mb(self) -> float:
         """Return file size in MB."""
         return round(self.file_size / (1024 * 1024), 2)
     
+    @file_size_mb.expression
+    def file_size_mb(cls):
+        """SQL form of file_size_mb, usable in filters and ORDER BY."""
+        return func.round(cls.file_size / (1024 * 1024.0), 2)
+    
     @property
     def duration_formatted(self) -> str:
         """Return duration in MM:SS format."""
         minutes = int(self.duration // 60)
         seconds = int(self.duration % 60)
-        return f"{minutes:02d}:{seconds:02d}" 
\ No newline at end of file
+        return f"{minutes:02d}:{seconds:02d}" 
+
+
+class VideoMetadata(Base):
+    """Cached ffprobe results, keyed by a hash of the probed path or URL."""
+    
+    __tablename__ = "video_metadata"
+    
+    url_hash = Column(String(32), primary_key=True)
+    duration = Column(Float, nullable=False)
+    width = Column(Integer, nullable=False)
+    height = Column(Integer, nullable=False)
+    fps = Column(Float, nullable=False)
+    file_size = Column(Integer, nullable=False)
+    probed_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+    
+    def to_info(self) -> dict:
+        """Return the same dict shape VideoService.get_video_info produces."""
+        return {
+            "duration": self.duration,
+            "width": self.width,
+            "height": self.height,
+            "fps": self.fps,
+            "file_size": self.file_size
+        }
@@ -0,0 +1,26 @@
+"""
+Shared base classes and field types for Pydantic schemas.
+"""
+
+from typing import Annotated
+
+from pydantic import BaseModel, ConfigDict, StringConstraints
+
+
+# Syntactic email check run by pydantic-core; no deliverability lookups
+Email = Annotated[str, StringConstraints(pattern=r'^[^@\s]+@[^@\s]+\.[^@\s]+$', max_length=254)]
+
+
+class ORMResponse(BaseModel):
+    """
+    Base for response schemas built from ORM rows.
+    
+    Instances passed to another model or to a FastAPI ``response_model`` are
+    trusted as-is rather than validated again.
+    """
+    model_config = ConfigDict(
+        from_attributes=True,
+        revalidate_instances='never',
+        extra='ignore',
+        str_strip_whitespace=False
+    )
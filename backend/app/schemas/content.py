@@ -2,11 +2,13 @@
 Content-related Pydantic schemas for API validation.
 """
 
-from pydantic import BaseModel, field_validator
-from typing import Optional, List, Dict, Any
+from pydantic import BaseModel, Field, SkipValidation, StringConstraints, computed_field
+from typing import Annotated, Optional, List
 from datetime import datetime
 
-from app.models.content import ContentStatus, Platform, ContentTone, ContentNiche
+from app.models.enums import ContentStatus, Platform, ContentTone, ContentNiche
+from app.schemas._base import ORMResponse
+from app.schemas.video import VideoUploadRequest  # noqa: F401  re-exported for older imports
 
 
 class ContentBase(BaseModel):
@@ -46,7 +48,7 @@ class ContentUpdateRequest(BaseModel):
     status: Optional[str] = None
 
 
-class ContentResponse(BaseModel):
+class ContentResponse(ORMResponse):
     """Schema for content response."""
     id: str
     title: str
@@ -60,10 +62,43 @@ class ContentResponse(BaseModel):
     tone: Optional[str] = None
     created_at: datetime
     updated_at: datetime
-    variants: List[Dict[str, Any]] = []
+    variants: Annotated[list, SkipValidation] = Field(default_factory=list)
     
-    class Config:
-        from_attributes = True
+    @classmethod
+    def from_orm_fast(cls, content, variants=None, platforms=None):
+        """
+        Build a response from a trusted Content row without re-validation.
+        
+        ``variants`` defaults to the loaded ``content.video_variants``;
+        ``platforms`` defaults to the platforms of those variants.
+        """
+        if variants is None:
+            variants = content.video_variants
+        if platforms is None:
+            platforms = [v.platform for v in variants]
+        status_value = content.status
+        return cls.model_construct(
+            id=str(content.id),
+            title=content.title,
+            caption=content.caption,
+            hashtags=content.hashtags or [],
+            video_url=content.video_url,
+            thumbnail_url=content.thumbnail_url,
+            status=getattr(status_value, "value", status_value),
+            platforms=platforms,
+            niche=content.niche,
+            tone=content.tone,
+            created_at=content.created_at,
+            updated_at=content.updated_at,
+            variants=[{
+                "id": v.id,
+                "platform": v.platform,
+                "video_url": v.video_url,
+                "thumbnail_url": v.thumbnail_url,
+                "width": v.width,
+                "height": v.height
+            } for v in variants]
+        )
 
 
 class ContentListResponse(BaseModel):
@@ -84,40 +119,35 @@ class ContentAnalytics(BaseModel):
     engagement_rate: float = 0.0
     reach: int = 0
     impressions: int = 0
-    platform_breakdown: Dict[str, Dict[str, int]] = {}
+    platform_breakdown: Annotated[dict, SkipValidation] = Field(default_factory=dict)
     performance_score: int = 0
 
 
 class CaptionGenerationRequest(BaseModel):
     """Schema for AI caption generation request."""
-    video_description: str
+    video_description: Annotated[str, StringConstraints(min_length=10, strip_whitespace=True)]
     tone: str = "casual"
     niche: str = "lifestyle"
     include_hashtags: bool = True
     max_length: Optional[int] = 2200  # Instagram limit
     platforms: List[str] = []
-    
-    @field_validator('video_description')
-    def validate_description(cls, v):
-        if len(v.strip()) < 10:
-            raise ValueError('Video description must be at least 10 characters long')
-        return v.strip()
 
 
 class CaptionGenerationResponse(BaseModel):
     """Schema for AI caption generation response."""
     caption: str
     hashtags: List[str]
-    word_count: int
-    character_count: int
     estimated_engagement: str  # "high", "medium", "low"
-
-
-class VideoUploadRequest(BaseModel):
-    """Schema for video upload request."""
-    platforms: List[str]
-    title: Optional[str] = None
-    description: Optional[str] = None
+    
+    @computed_field
+    @property
+    def word_count(self) -> int:
+        return len(self.caption.split())
+    
+    @computed_field
+    @property
+    def character_count(self) -> int:
+        return len(self.caption)
 
 
 class VideoProcessingResponse(BaseModel):
@@ -126,4 +156,4 @@ class VideoProcessingResponse(BaseModel):
     original_video_url: str
     thumbnail_url: str
     status: str
-    variants: dict  # Platform-specific variants 
\ No newline at end of file
+    variants: Annotated[dict, SkipValidation]  # Platform-specific variants 
\ No newline at end of file
@@ -2,24 +2,44 @@
 Publishing-related Pydantic schemas for API validation.
 """
 
-from pydantic import BaseModel, field_validator
-from typing import Optional, List, Dict, Any
-from datetime import datetime
+from pydantic import AfterValidator, BaseModel
+from typing import Annotated, Literal, Optional, List, Dict
+from datetime import datetime, timezone
+import time
+
+from app.schemas._base import ORMResponse
+
+
+def _require_future(v: datetime) -> datetime:
+    """Reject schedule times that are not in the future; naive values are treated as UTC."""
+    if v.tzinfo is None:
+        v = v.replace(tzinfo=timezone.utc)
+    if v.timestamp() <= time.time():
+        raise ValueError('Schedule time must be in the future')
+    return v
+
+
+FutureDatetime = Annotated[datetime, AfterValidator(_require_future)]
+
+PublishPlatform = Literal['instagram', 'tiktok', 'youtube', 'facebook', 'twitter']
 
 
 class PublishRequest(BaseModel):
     """Schema for content publishing request."""
-    platforms: List[str]
+    platforms: List[PublishPlatform]
     caption_override: Optional[str] = None
     schedule_time: Optional[datetime] = None
-    
-    @field_validator('platforms')
-    def validate_platforms(cls, v):
-        allowed_platforms = ['instagram', 'tiktok', 'youtube', 'facebook', 'twitter']
-        invalid = [p for p in v if p not in allowed_platforms]
-        if invalid:
-            raise ValueError(f'Invalid platforms: {invalid}. Allowed: {allowed_platforms}')
-        return v
+
+
+class PublishResult(BaseModel):
+    """Schema for the outcome of publishing to one platform."""
+    platform: str
+    status: str
+    message: Optional[str] = None
+    post_id: Optional[str] = None
+    post_url: Optional[str] = None
+    scheduled_for: Optional[datetime] = None
+    error: Optional[str] = None
 
 
 class PublishResponse(BaseModel):
@@ -27,7 +47,7 @@ class PublishResponse(BaseModel):
     content_id: str
     title: str
     platforms: List[str]
-    results: List[Dict[str, Any]]
+    results: List[PublishResult]
     overall_status: str
     published_at: str
 
@@ -35,14 +55,8 @@ class PublishResponse(BaseModel):
 class ScheduleRequest(BaseModel):
     """Schema for content scheduling request."""
     platforms: List[str]
-    schedule_time: datetime
+    schedule_time: FutureDatetime
     caption_override: Optional[str] = None
-    
-    @field_validator('schedule_time')
-    def validate_schedule_time(cls, v):
-        if v <= datetime.utcnow():
-            raise ValueError('Schedule time must be in the future')
-        return v
 
 
 class ScheduleResponse(BaseModel):
@@ -66,16 +80,23 @@ class PublishingAccountResponse(BaseModel):
     follower_count: int
 
 
+class PublishingLimitations(BaseModel):
+    """Schema for per-user publishing limits."""
+    max_scheduled_posts: int
+    max_platforms_per_post: int
+    rate_limits: Dict[str, int] = {}
+
+
 class PublishingStatus(BaseModel):
     """Schema for overall publishing status."""
     publishing_enabled: bool
     connected_platforms: List[str]
     available_platforms: List[str]
     features: Dict[str, str]
-    limitations: Dict[str, Any]
+    limitations: PublishingLimitations
 
 
-class ScheduledPost(BaseModel):
+class ScheduledPost(ORMResponse):
     """Schema for scheduled post."""
     schedule_id: str
     content_id: str
@@ -86,7 +107,7 @@ class ScheduledPost(BaseModel):
     created_at: datetime
 
 
-class PublishingAnalytics(BaseModel):
+class PublishingAnalytics(ORMResponse):
     """Schema for publishing analytics."""
     platform: str
     total_posts: int
@@ -2,10 +2,18 @@
 Template-related Pydantic schemas for API validation.
 """
 
-from pydantic import BaseModel, field_validator
-from typing import Optional, List
+from pydantic import BaseModel, StringConstraints
+from typing import Annotated, Literal, Optional, List
 from datetime import datetime
 
+from app.schemas._base import ORMResponse
+
+
+Tone = Literal['casual', 'professional', 'fun', 'motivational', 'educational']
+Niche = Literal['fitness', 'food', 'lifestyle', 'business', 'tech', 'education']
+TemplateTitle = Annotated[str, StringConstraints(min_length=3, strip_whitespace=True)]
+TemplateContent = Annotated[str, StringConstraints(min_length=10, strip_whitespace=True)]
+
 
 class TemplateBase(BaseModel):
     """Base template schema with common fields."""
@@ -19,57 +27,23 @@ class TemplateBase(BaseModel):
 
 class TemplateCreate(TemplateBase):
     """Schema for template creation."""
-    
-    @field_validator('title')
-    def validate_title(cls, v):
-        if len(v.strip()) < 3:
-            raise ValueError('Title must be at least 3 characters long')
-        return v.strip()
-    
-    @field_validator('content')
-    def validate_content(cls, v):
-        if len(v.strip()) < 10:
-            raise ValueError('Content must be at least 10 characters long')
-        return v.strip()
-    
-    @field_validator('tone')
-    def validate_tone(cls, v):
-        allowed_tones = ['casual', 'professional', 'fun', 'motivational', 'educational']
-        if v not in allowed_tones:
-            raise ValueError(f'Tone must be one of: {", ".join(allowed_tones)}')
-        return v
-    
-    @field_validator('niche')
-    def validate_niche(cls, v):
-        allowed_niches = ['fitness', 'food', 'lifestyle', 'business', 'tech', 'education']
-        if v not in allowed_niches:
-            raise ValueError(f'Niche must be one of: {", ".join(allowed_niches)}')
-        return v
+    title: TemplateTitle
+    content: TemplateContent
+    tone: Tone
+    niche: Niche
 
 
 class TemplateUpdate(BaseModel):
     """Schema for template updates."""
-    title: Optional[str] = None
-    content: Optional[str] = None
+    title: Optional[TemplateTitle] = None
+    content: Optional[TemplateContent] = None
     tone: Optional[str] = None
     niche: Optional[str] = None
     platforms: Optional[List[str]] = None
     is_public: Optional[bool] = None
-    
-    @field_validator('title')
-    def validate_title(cls, v):
-        if v is not None and len(v.strip()) < 3:
-            raise ValueError('Title must be at least 3 characters long')
-        return v.strip() if v else v
-    
-    @field_validator('content')
-    def validate_content(cls, v):
-        if v is not None and len(v.strip()) < 10:
-            raise ValueError('Content must be at least 10 characters long')
-        return v.strip() if v else v
 
 
-class TemplateResponse(BaseModel):
+class TemplateResponse(ORMResponse):
     """Schema for template response."""
     id: str
     title: str
@@ -84,8 +58,25 @@ class TemplateResponse(BaseModel):
     created_at: datetime
     updated_at: datetime
     
-    class Config:
-        from_attributes = True
+    @classmethod
+    def from_orm_fast(cls, template, created_by=None, is_favorite=None):
+        """Build a response from a trusted Template row without re-validation."""
+        if created_by is None:
+            created_by = template.user.name if template.user else "Capora"
+        return cls.model_construct(
+            id=str(template.id),
+            title=template.title,
+            content=template.content,
+            tone=template.tone,
+            niche=template.niche,
+            platforms=template.platforms or [],
+            usage_count=template.usage_count,
+            is_favorite=template.is_favorite if is_favorite is None else is_favorite,
+            is_public=template.is_public,
+            created_by=created_by,
+            created_at=template.created_at,
+            updated_at=template.updated_at
+        )
 
 
 class TemplateListResponse(BaseModel):
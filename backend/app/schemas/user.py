@@ -2,29 +2,27 @@
 User-related Pydantic schemas for API validation.
 """
 
-from pydantic import BaseModel, EmailStr, field_validator
-from typing import Optional
+from pydantic import BaseModel, StringConstraints
+from typing import Annotated, Optional
 from datetime import datetime
 
-from app.models.user import ContentNiche, SubscriptionPlan
+from app.models.enums import ContentNiche, SubscriptionPlan
+from app.schemas._base import Email, ORMResponse
+
+
+Password = Annotated[str, StringConstraints(min_length=8)]
 
 
 class UserBase(BaseModel):
     """Base user schema with common fields."""
-    email: EmailStr
+    email: Email
     name: str
     niche: ContentNiche = ContentNiche.LIFESTYLE
 
 
 class UserCreate(UserBase):
     """Schema for user registration."""
-    password: str
-    
-    @field_validator('password')
-    def validate_password(cls, v):
-        if len(v) < 8:
-            raise ValueError('Password must be at least 8 characters long')
-        return v
+    password: Password
 
 
 class UserUpdate(BaseModel):
@@ -36,11 +34,11 @@ class UserUpdate(BaseModel):
 
 class UserLogin(BaseModel):
     """Schema for user login."""
-    email: EmailStr
+    email: Email
     password: str
 
 
-class UserResponse(UserBase):
+class UserResponse(UserBase, ORMResponse):
     """Schema for user response (without sensitive data)."""
     id: int
     avatar: Optional[str] = None
@@ -54,7 +52,25 @@ class UserResponse(UserBase):
     updated_at: datetime
     last_login: Optional[datetime] = None
     
-    model_config = {"from_attributes": True}
+    @classmethod
+    def from_orm_fast(cls, user):
+        """Build a response from a trusted User row without re-validation."""
+        return cls.model_construct(
+            id=user.id,
+            email=user.email,
+            name=user.name,
+            niche=ContentNiche(user.niche) if user.niche else ContentNiche.LIFESTYLE,
+            avatar=user.avatar,
+            subscription_plan=user.subscription_plan or SubscriptionPlan.FREE.value,
+            subscription_ends_at=user.subscription_ends_at,
+            captions_used_this_month=user.captions_used_this_month or 0,
+            videos_processed_this_month=user.videos_processed_this_month or 0,
+            is_active=user.is_active,
+            is_verified=user.is_verified,
+            created_at=user.created_at,
+            updated_at=user.updated_at,
+            last_login=user.last_login
+        )
 
 
 class UserUsageResponse(BaseModel):
@@ -83,19 +99,13 @@ class TokenData(BaseModel):
 
 class PasswordReset(BaseModel):
     """Schema for password reset request."""
-    email: EmailStr
+    email: Email
 
 
 class PasswordResetConfirm(BaseModel):
     """Schema for password reset confirmation."""
     token: str
-    new_password: str
-    
-    @field_validator('new_password')
-    def validate_password(cls, v):
-        if len(v) < 8:
-            raise ValueError('Password must be at least 8 characters long')
-        return v
+    new_password: Password
 
 
 class SubscriptionUpgrade(BaseModel):
@@ -6,6 +6,8 @@ from pydantic import BaseModel, Field
 from typing import List, Optional
 from enum import Enum
 
+from app.schemas._base import ORMResponse
+
 
 class PlatformEnum(str, Enum):
     """Supported social media platforms."""
@@ -37,22 +39,7 @@ class VideoProcessingRequest(BaseModel):
         }
 
 
-class VideoVariant(BaseModel):
-    """Video variant model for different platforms."""
-    id: str
-    platform: str
-    video_url: str
-    thumbnail_url: Optional[str] = None
-    width: int
-    height: int
-    file_size: int
-    duration: Optional[float] = None
-    
-    class Config:
-        from_attributes = True
-
-
-class VideoVariantSchema(BaseModel):
+class VideoVariantSchema(ORMResponse):
     """Schema for video variant responses."""
     id: str
     platform: str
@@ -63,12 +50,13 @@ class VideoVariantSchema(BaseModel):
     file_size: int
     duration: Optional[float] = None
     status: str = "completed"
-    
-    class Config:
-        from_attributes = True
 
 
-class VideoAnalytics(BaseModel):
+# Former name of VideoVariantSchema, kept for existing imports
+VideoVariant = VideoVariantSchema
+
+
+class VideoAnalytics(ORMResponse):
     """Video analytics model."""
     content_id: str
     views: int = 0
@@ -77,13 +65,11 @@ class VideoAnalytics(BaseModel):
     shares: int = 0
     engagement_rate: float = 0.0
     platform: str
-    
-    class Config:
-        from_attributes = True
 
 
 class VideoUploadRequest(BaseModel):
     """Request model for video upload metadata."""
+    platforms: List[str] = []
     title: Optional[str] = None
     description: Optional[str] = None
     niche: Optional[str] = "lifestyle"
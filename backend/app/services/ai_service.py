@@ -3,14 +3,19 @@ AI service for caption generation using Google Gemini API.
 """
 
 import google.generativeai as genai
+import asyncio
+import hashlib
+from collections import OrderedDict
+from functools import lru_cache
+from types import MappingProxyType
 from typing import List, Dict, Any
 import logging
-import json
+import orjson
 import re
 
 from app.core.config import settings
 from app.schemas.content import CaptionGenerationRequest, CaptionGenerationResponse
-from app.models.content import Platform, ContentTone, ContentNiche
+from app.models.enums import ContentTone, ContentNiche
 
 logger = logging.getLogger(__name__)
 
@@ -18,138 +23,242 @@ logger = logging.getLogger(__name__)
 if settings.GEMINI_API_KEY:
     genai.configure(api_key=settings.GEMINI_API_KEY)
 
+CAPTION_CACHE_SIZE = 512
+MAX_HASHTAGS = 10
+
+_JSON_BLOCK_RE = re.compile(r'\{.*\}', re.DOTALL)
+_HASHTAG_RE = re.compile(r'#\w+')
+
+TONE_DESCRIPTIONS = MappingProxyType({
+    ContentTone.CASUAL.value: "casual, friendly, and conversational",
+    ContentTone.PROFESSIONAL.value: "professional, authoritative, and polished",
+    ContentTone.FUN.value: "fun, playful, and entertaining",
+    ContentTone.MOTIVATIONAL.value: "motivational, inspiring, and uplifting",
+    ContentTone.EDUCATIONAL.value: "educational, informative, and helpful",
+    ContentTone.TRENDY.value: "trendy, modern, and social media savvy"
+})
+
+NICHE_CONTEXT = MappingProxyType({
+    ContentNiche.FITNESS.value: "fitness, health, and wellness",
+    ContentNiche.FOOD.value: "food, cooking, and culinary experiences",
+    ContentNiche.EDUCATION.value: "education, learning, and personal development",
+    ContentNiche.LIFESTYLE.value: "lifestyle, daily life, and personal experiences",
+    ContentNiche.BUSINESS.value: "business, entrepreneurship, and professional growth",
+    ContentNiche.TECH.value: "technology, innovation, and digital trends"
+})
+
+FALLBACK_TONE_TEMPLATES = MappingProxyType({
+    ContentTone.CASUAL.value: "Just sharing this amazing moment! {description} What do you think?",
+    ContentTone.PROFESSIONAL.value: "Excited to share: {description}. Looking forward to your thoughts and feedback.",
+    ContentTone.FUN.value: "This is SO cool! {description} Who else loves this? 🔥",
+    ContentTone.MOTIVATIONAL.value: "Remember: {description}. You've got this! Keep pushing forward! 💪",
+    ContentTone.EDUCATIONAL.value: "Here's something interesting: {description}. Hope this helps you learn something new!",
+    ContentTone.TRENDY.value: "Okay but like... {description} This is everything! ✨"
+})
+
+_COMMON_FALLBACK_HASHTAGS = ("#viral", "#trending", "#follow")
+_DEFAULT_FALLBACK_HASHTAGS = ("#content", "#create", "#share") + _COMMON_FALLBACK_HASHTAGS
+
+# Niche hashtags with the common tags already appended
+FALLBACK_HASHTAGS = MappingProxyType({
+    niche: tags + _COMMON_FALLBACK_HASHTAGS
+    for niche, tags in {
+        ContentNiche.FITNESS.value: ("#fitness", "#workout", "#health", "#motivation", "#fitlife"),
+        ContentNiche.FOOD.value: ("#food", "#foodie", "#cooking", "#recipe", "#delicious"),
+        ContentNiche.EDUCATION.value: ("#education", "#learning", "#knowledge", "#skills", "#growth"),
+        ContentNiche.LIFESTYLE.value: ("#lifestyle", "#life", "#daily", "#inspiration", "#vibes"),
+        ContentNiche.BUSINESS.value: ("#business", "#entrepreneur", "#success", "#hustle", "#growth"),
+        ContentNiche.TECH.value: ("#tech", "#technology", "#innovation", "#digital", "#future")
+    }.items()
+})
+
+
+def _dedupe_hashtags(hashtags, limit: int = MAX_HASHTAGS) -> List[str]:
+    """Drop repeated hashtags, keeping first-seen order and stopping at ``limit``."""
+    seen = set()
+    unique = []
+    for tag in hashtags:
+        if tag not in seen:
+            seen.add(tag)
+            unique.append(tag)
+            if len(unique) == limit:
+                break
+    return unique
+
+
+def _escape_braces(text: str) -> str:
+    return text.replace("{", "{{").replace("}", "}}")
+
+
+@lru_cache(maxsize=128)
+def _prompt_template(tone: str, niche: str, include_hashtags: bool) -> str:
+    """
+    Return the caption prompt for a tone/niche combination as a format string.
+    
+    Only ``{description}``, ``{max_length}`` and ``{platform_context}`` are
+    left to fill in per request.
+    """
+    tone_text = _escape_braces(TONE_DESCRIPTIONS.get(tone, tone))
+    niche_text = _escape_braces(NICHE_CONTEXT.get(niche, niche))
+    audience = _escape_braces(NICHE_CONTEXT.get(niche, "the content"))
+    
+    hashtag_instruction = ""
+    if include_hashtags:
+        hashtag_instruction = f"""
+- Include 5-10 relevant hashtags
+- Mix popular and niche-specific hashtags
+- Use hashtags relevant to {audience}
+"""
+    
+    return f"""
+Create an engaging social media caption{{platform_context}} based on this content:
+
+Content Description: {{description}}
+Niche: {niche_text}
+Tone: {tone_text}
+Max Length: {{max_length}} characters
+
+Requirements:
+- Write in a {tone_text} tone
+- Make it engaging and likely to get high engagement
+- Keep it under {{max_length}} characters
+- Focus on {audience} audience
+{hashtag_instruction}
+
+Response Format (JSON):
+{{{{
+    "caption": "The main caption text",
+    "hashtags": ["hashtag1", "hashtag2", "hashtag3"],
+    "engagement": "high|medium|low"
+}}}}
+
+Generate the caption now:
+"""
+
+
 
 class AIService:
     """Service for AI-powered content generation."""
     
     def __init__(self):
         self.model = None
-        if settings.GEMINI_API_KEY:
-            try:
-                self.model = genai.GenerativeModel('gemini-pro')
-                logger.info("✅ Gemini AI model initialized successfully")
-            except Exception as e:
-                logger.error(f"❌ Failed to initialize Gemini model: {e}")
+        self._model_loaded = False
+        self._model_lock = asyncio.Lock()
+        self._caption_cache: "OrderedDict[bytes, CaptionGenerationResponse]" = OrderedDict()
+    
+    async def _get_model(self):
+        """Create the Gemini model on first use and reuse it afterwards."""
+        if self._model_loaded:
+            return self.model
+        
+        async with self._model_lock:
+            if not self._model_loaded:
+                if settings.GEMINI_API_KEY:
+                    try:
+                        self.model = genai.GenerativeModel('gemini-pro')
+                        logger.info("✅ Gemini AI model initialized successfully")
+                    except Exception as e:
+                        logger.error(f"❌ Failed to initialize Gemini model: {e}")
+                self._model_loaded = True
+        
+        return self.model
     
     async def generate_caption(self, request: CaptionGenerationRequest) -> CaptionGenerationResponse:
         """
         Generate AI-powered caption for social media content.
         """
-        if not self.model:
+        model = await self._get_model()
+        if not model:
             # Fallback response if AI is not available
             return self._fallback_caption_response(request)
         
+        cache_key = self._caption_cache_key(request)
+        cached = self._caption_cache.get(cache_key)
+        if cached is not None:
+            self._caption_cache.move_to_end(cache_key)
+            return cached
+        
         try:
             # Build the prompt
             prompt = self._build_caption_prompt(request)
             
-            # Generate content
-            response = self.model.generate_content(prompt)
+            # Generate content without blocking the event loop
+            response = await model.generate_content_async(prompt)
             
             # Parse response
             caption_data = self._parse_gemini_response(response.text, request)
             
-            return CaptionGenerationResponse(
+            result = CaptionGenerationResponse(
                 caption=caption_data["caption"],
                 hashtags=caption_data["hashtags"],
-                word_count=len(caption_data["caption"].split()),
-                character_count=len(caption_data["caption"]),
                 estimated_engagement=caption_data["engagement"]
             )
             
         except Exception as e:
             logger.error(f"Failed to generate caption: {e}")
             return self._fallback_caption_response(request)
+        
+        self._caption_cache[cache_key] = result
+        if len(self._caption_cache) > CAPTION_CACHE_SIZE:
+            self._caption_cache.popitem(last=False)
+        
+        return result
+    
+    @staticmethod
+    def _caption_cache_key(request: CaptionGenerationRequest) -> bytes:
+        """Hash the canonicalised request so identical requests share a cache entry."""
+        payload = orjson.dumps(request.model_dump(mode="json"), option=orjson.OPT_SORT_KEYS)
+        return hashlib.blake2b(payload, digest_size=16).digest()
     
     def _build_caption_prompt(self, request: CaptionGenerationRequest) -> str:
         """Build the prompt for Gemini API."""
         
         platform_context = ""
         if request.platforms:
-            platform_names = [p.value.replace("_", " ").title() for p in request.platforms]
+            platform_names = [
+                getattr(p, "value", p).replace("_", " ").title() for p in request.platforms
+            ]
             platform_context = f" for {', '.join(platform_names)}"
         
-        tone_descriptions = {
-            ContentTone.CASUAL: "casual, friendly, and conversational",
-            ContentTone.PROFESSIONAL: "professional, authoritative, and polished",
-            ContentTone.FUN: "fun, playful, and entertaining",
-            ContentTone.MOTIVATIONAL: "motivational, inspiring, and uplifting",
-            ContentTone.EDUCATIONAL: "educational, informative, and helpful",
-            ContentTone.TRENDY: "trendy, modern, and social media savvy"
-        }
-        
-        niche_context = {
-            ContentNiche.FITNESS: "fitness, health, and wellness",
-            ContentNiche.FOOD: "food, cooking, and culinary experiences",
-            ContentNiche.EDUCATION: "education, learning, and personal development",
-            ContentNiche.LIFESTYLE: "lifestyle, daily life, and personal experiences",
-            ContentNiche.BUSINESS: "business, entrepreneurship, and professional growth",
-            ContentNiche.TECH: "technology, innovation, and digital trends"
-        }
-        
-        hashtag_instruction = ""
-        if request.include_hashtags:
-            hashtag_instruction = f"""
-- Include 5-10 relevant hashtags
-- Mix popular and niche-specific hashtags
-- Use hashtags relevant to {niche_context.get(request.niche, 'the content')}
-"""
-        
-        prompt = f"""
-Create an engaging social media caption{platform_context} based on this content:
-
-Content Description: {request.video_description}
-Niche: {niche_context.get(request.niche, request.niche.value)}
-Tone: {tone_descriptions.get(request.tone, request.tone.value)}
-Max Length: {request.max_length or 2200} characters
-
-Requirements:
-- Write in a {tone_descriptions.get(request.tone, request.tone.value)} tone
-- Make it engaging and likely to get high engagement
-- Keep it under {request.max_length or 2200} characters
-- Focus on {niche_context.get(request.niche, 'the content')} audience
-{hashtag_instruction}
-
-Response Format (JSON):
-{{
-    "caption": "The main caption text",
-    "hashtags": ["hashtag1", "hashtag2", "hashtag3"],
-    "engagement": "high|medium|low"
-}}
-
-Generate the caption now:
-"""
-        
-        return prompt
+        return _prompt_template(
+            getattr(request.tone, "value", request.tone),
+            getattr(request.niche, "value", request.niche),
+            request.include_hashtags
+        ).format(
+            description=request.video_description,
+            max_length=request.max_length or 2200,
+            platform_context=platform_context
+        )
     
     def _parse_gemini_response(self, response_text: str, request: CaptionGenerationRequest) -> Dict[str, Any]:
         """Parse Gemini API response."""
         try:
-            # Try to extract JSON from the response
-            json_match = re.search(r'\{.*\}', response_text, re.DOTALL)
-            if json_match:
-                json_str = json_match.group()
-                data = json.loads(json_str)
-                
+            # Clean JSON responses parse directly; otherwise extract the JSON block
+            try:
+                data = orjson.loads(response_text)
+            except orjson.JSONDecodeError:
+                data = None
+            
+            if not isinstance(data, dict):
+                json_match = _JSON_BLOCK_RE.search(response_text)
+                data = orjson.loads(json_match.group()) if json_match else None
+            
+            if isinstance(data, dict):
                 # Validate required fields
                 if "caption" in data and "hashtags" in data:
                     return {
                         "caption": data["caption"][:request.max_length or 2200],
-                        "hashtags": data.get("hashtags", [])[:10],  # Limit to 10 hashtags
+                        "hashtags": _dedupe_hashtags(data.get("hashtags") or ()),
                         "engagement": data.get("engagement", "medium")
                     }
             
             # Fallback: treat entire response as caption
-            lines = response_text.strip().split('\n')
+            hashtags = _HASHTAG_RE.findall(response_text)
             caption_lines = []
-            hashtags = []
             
-            for line in lines:
+            for line in response_text.strip().split('\n'):
                 line = line.strip()
-                if line.startswith('#'):
-                    # Extract hashtags
-                    hashtags.extend(re.findall(r'#\w+', line))
-                elif line and not line.startswith('{') and not line.startswith('}'):
+                if line and line[0] not in '#{}':
                     caption_lines.append(line)
             
             caption = '\n'.join(caption_lines).strip()
@@ -158,7 +267,7 @@ Generate the caption now:
             
             return {
                 "caption": caption[:request.max_length or 2200],
-                "hashtags": list(set(hashtags))[:10],
+                "hashtags": _dedupe_hashtags(hashtags),
                 "engagement": "medium"
             }
             
@@ -173,43 +282,18 @@ Generate the caption now:
         return CaptionGenerationResponse(
             caption=fallback_data["caption"],
             hashtags=fallback_data["hashtags"],
-            word_count=len(fallback_data["caption"].split()),
-            character_count=len(fallback_data["caption"]),
             estimated_engagement="medium"
         )
     
     def _get_fallback_data(self, request: CaptionGenerationRequest) -> Dict[str, Any]:
         """Get fallback caption and hashtags."""
-        
-        tone_templates = {
-            ContentTone.CASUAL: "Just sharing this amazing moment! {description} What do you think?",
-            ContentTone.PROFESSIONAL: "Excited to share: {description}. Looking forward to your thoughts and feedback.",
-            ContentTone.FUN: "This is SO cool! {description} Who else loves this? 🔥",
-            ContentTone.MOTIVATIONAL: "Remember: {description}. You've got this! Keep pushing forward! 💪",
-            ContentTone.EDUCATIONAL: "Here's something interesting: {description}. Hope this helps you learn something new!",
-            ContentTone.TRENDY: "Okay but like... {description} This is everything! ✨"
-        }
-        
-        niche_hashtags = {
-            ContentNiche.FITNESS: ["#fitness", "#workout", "#health", "#motivation", "#fitlife"],
-            ContentNiche.FOOD: ["#food", "#foodie", "#cooking", "#recipe", "#delicious"],
-            ContentNiche.EDUCATION: ["#education", "#learning", "#knowledge", "#skills", "#growth"],
-            ContentNiche.LIFESTYLE: ["#lifestyle", "#life", "#daily", "#inspiration", "#vibes"],
-            ContentNiche.BUSINESS: ["#business", "#entrepreneur", "#success", "#hustle", "#growth"],
-            ContentNiche.TECH: ["#tech", "#technology", "#innovation", "#digital", "#future"]
-        }
-        
-        caption_template = tone_templates.get(request.tone, tone_templates[ContentTone.CASUAL])
-        caption = caption_template.format(description=request.video_description)
-        
-        base_hashtags = niche_hashtags.get(request.niche, ["#content", "#create", "#share"])
-        common_hashtags = ["#viral", "#trending", "#follow", "#like", "#share"]
-        
-        hashtags = base_hashtags + common_hashtags[:3]
+        caption_template = FALLBACK_TONE_TEMPLATES.get(
+            request.tone, FALLBACK_TONE_TEMPLATES[ContentTone.CASUAL.value]
+        )
         
         return {
-            "caption": caption,
-            "hashtags": hashtags,
+            "caption": caption_template.format(description=request.video_description),
+            "hashtags": list(FALLBACK_HASHTAGS.get(request.niche, _DEFAULT_FALLBACK_HASHTAGS)),
             "engagement": "medium"
         }
 
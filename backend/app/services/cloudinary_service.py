@@ -2,41 +2,381 @@
 Cloudinary service for file upload and management.
 """
 
+import asyncio
+import functools
+import hashlib
 import logging
+import aiofiles
+import aiohttp
 import cloudinary
 import cloudinary.uploader
 import cloudinary.api
+import cloudinary.utils
+from cloudinary import exceptions as cloudinary_exceptions
 from cloudinary.utils import cloudinary_url
-from typing import Dict, Any, Optional
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import AsyncIterable, Dict, Any, Iterable, List, Optional, Tuple, Union
 import os
+import random
+import re
+import time
+import uuid
 from pathlib import Path
+from urllib.parse import quote
 
 from app.core.config import settings
 
 logger = logging.getLogger(__name__)
 
+LARGE_UPLOAD_THRESHOLD = 20 * 1024 * 1024  # Above this, videos are uploaded in chunks
+LARGE_UPLOAD_CHUNK_SIZE = 6_000_000
+LARGE_UPLOAD_CONCURRENCY = 4
+
+RETRY_ATTEMPTS = 5
+RETRY_BASE_DELAY = 1.0
+RETRY_MAX_DELAY = 60.0
+RESOURCES_BY_IDS_LIMIT = 100  # Admin API maximum per request
+VIDEO_INFO_CACHE_SIZE = 4096
+VIDEO_INFO_TTL = 3600.0  # Metadata rarely changes after upload
+HTTP_KEEPALIVE_TIMEOUT = 75  # Seconds an idle TLS connection to Cloudinary is kept open
+
+# Renditions generated alongside every video upload. Each eager chain matches
+# what optimize_video_url builds, so those URLs hit the pre-generated asset.
+EAGER_VIDEO_SIZES = ((640, 360), (1280, 720))
+EAGER_VIDEO_QUALITY = "auto:good"
+EAGER_VIDEO_TRANSFORMATIONS = tuple(
+    {"transformation": [
+        {"crop": "fill", "width": width, "height": height},
+        {"quality": EAGER_VIDEO_QUALITY}
+    ]}
+    for width, height in EAGER_VIDEO_SIZES
+)
+
+# SDK errors raised for 4xx responses; retrying them cannot succeed
+_CLIENT_ERRORS = (
+    cloudinary_exceptions.BadRequest,
+    cloudinary_exceptions.AuthorizationRequired,
+    cloudinary_exceptions.NotAllowed,
+    cloudinary_exceptions.NotFound,
+    cloudinary_exceptions.AlreadyExists,
+    cloudinary_exceptions.RateLimited,
+)
+
+# Failures an API call can legitimately raise; anything else is a bug and propagates
+_SERVICE_ERRORS = (
+    cloudinary_exceptions.Error,
+    aiohttp.ClientError,
+    asyncio.TimeoutError,
+    OSError,
+)
+
+
+def _is_retryable(exc: BaseException) -> bool:
+    """Transient failures are timeouts, connection errors and 5xx responses."""
+    if isinstance(exc, asyncio.TimeoutError):
+        return True
+    if isinstance(exc, aiohttp.ClientResponseError):
+        return exc.status >= 500
+    if isinstance(exc, aiohttp.ClientError):
+        return True
+    if isinstance(exc, cloudinary_exceptions.Error):
+        return not isinstance(exc, _CLIENT_ERRORS)
+    return False
+
+
+def _sign(params: Dict[str, Any], api_secret: str) -> str:
+    """
+    Sign API parameters the same way as cloudinary.utils.api_sign_request.
+    
+    Empty values are skipped and lists are comma-joined; the sorted
+    key=value pairs plus the secret are hashed with SHA-1.
+    """
+    to_sign = "&".join(
+        f"{key}={','.join(value) if isinstance(value, list) else value}"
+        for key, value in sorted(params.items())
+        if value
+    )
+    return hashlib.sha1((to_sign + api_secret).encode()).hexdigest()
+
+
+async def _with_retry(
+    fn,
+    *args,
+    attempts: int = RETRY_ATTEMPTS,
+    base: float = RETRY_BASE_DELAY,
+    cap: float = RETRY_MAX_DELAY,
+    **kwargs
+):
+    """Await ``fn`` with exponential backoff and jitter on transient failures."""
+    for attempt in range(attempts):
+        try:
+            return await fn(*args, **kwargs)
+        except Exception as e:
+            if attempt == attempts - 1 or not _is_retryable(e):
+                raise
+            delay = min(cap, base * 2 ** attempt) + random.uniform(0, base)
+            logger.warning("Cloudinary call failed (%s), retrying in %.1fs", e, delay)
+            await asyncio.sleep(delay)
+
+
+# Example: https://res.cloudinary.com/demo/video/upload/v1234567890/capora/videos/abc123.mp4
+_PUBLIC_ID_RE = re.compile(r'/(?:image|video|raw)/upload/(?:v\d+/)?(.+?)(?:\.[^./]+)?$')
+
+
+@functools.lru_cache(maxsize=4096)
+def _extract_public_id(url: str) -> Optional[str]:
+    """Return the public_id of a Cloudinary delivery URL, without version or extension."""
+    match = _PUBLIC_ID_RE.search(url)
+    return match.group(1) if match else None
+
+
+_FAST_URL_TMPL = "https://res.cloudinary.com/{cloud}/video/upload/{path}"
+_VERSION_PREFIX_RE = re.compile(r'^v\d+/')
+
+
+@functools.lru_cache(maxsize=8192)
+def _build_optimized_video_url(
+    cloud_name: str,
+    public_id: str,
+    width: Optional[int],
+    height: Optional[int],
+    quality: Optional[str]
+) -> str:
+    """
+    Build a transformed video delivery URL; inputs fully determine the output.
+    
+    Unsigned URLs are templated directly in the same form cloudinary_url
+    produces (so eager renditions still match); the SDK is only used when
+    CLOUDINARY_SIGN_URLS requires a signature.
+    """
+    if settings.CLOUDINARY_SIGN_URLS:
+        transformations = []
+        
+        if width or height:
+            resize_params = {"crop": "fill"}
+            if width:
+                resize_params["width"] = width
+            if height:
+                resize_params["height"] = height
+            transformations.append(resize_params)
+        
+        if quality:
+            transformations.append({"quality": quality})
+        
+        optimized_url, _ = cloudinary_url(
+            public_id,
+            resource_type="video",
+            transformation=transformations,
+            secure=True,
+            sign_url=True
+        )
+        return optimized_url
+    
+    components = []
+    if width or height:
+        components.append(",".join(filter(None, (
+            "c_fill",
+            f"h_{height}" if height else None,
+            f"w_{width}" if width else None
+        ))))
+    if quality:
+        components.append(f"q_{quality}")
+    if "/" in public_id and not _VERSION_PREFIX_RE.match(public_id):
+        components.append("v1")
+    components.append(quote(public_id, safe="/:"))
+    
+    return _FAST_URL_TMPL.format(cloud=cloud_name, path="/".join(components))
+
+
+@functools.lru_cache(maxsize=1)
+def _configure_once():
+    """Apply settings to the global Cloudinary config once and return it."""
+    # Configure Cloudinary (free tier)
+    if settings.CLOUDINARY_URL:
+        cloudinary.config(cloudinary_url=settings.CLOUDINARY_URL)
+    else:
+        # Fallback configuration for demo
+        cloudinary.config(
+            cloud_name="demo",
+            api_key="your_api_key",
+            api_secret="your_api_secret"
+        )
+        logger.warning("Cloudinary not configured, using demo settings")
+    return cloudinary.config()
+
+
+class CloudinaryUploadError(Exception):
+    """
+    Raised when an upload still fails after retries.
+    
+    Uploads use a fixed public_id with overwrite=True, so callers can retry
+    the same upload without creating duplicates.
+    """
+    
+    def __init__(self, public_id: str):
+        super().__init__(f"Failed to upload {public_id} to Cloudinary")
+        self.public_id = public_id
+
 
 class CloudinaryService:
     """Service for handling file uploads to Cloudinary."""
     
     def __init__(self):
-        # Configure Cloudinary (free tier)
-        if settings.CLOUDINARY_URL:
-            cloudinary.config(cloudinary_url=settings.CLOUDINARY_URL)
-        else:
-            # Fallback configuration for demo
-            cloudinary.config(
-                cloud_name="demo",
-                api_key="your_api_key",
-                api_secret="your_api_secret"
+        # Credentials don't change after startup, so read them once
+        config = _configure_once()
+        self._cloud_name = config.cloud_name
+        self._api_key = config.api_key
+        self._api_secret = config.api_secret
+        self._configured = bool(
+            self._cloud_name and
+            self._api_key and
+            self._api_secret and
+            self._cloud_name != "demo"
+        )
+        
+        # Folder prefixes for the common case of uploading to the default folder
+        self._video_prefix = settings.CLOUDINARY_VIDEO_FOLDER + "/"
+        self._image_prefix = settings.CLOUDINARY_IMAGE_FOLDER + "/"
+        
+        self.session: Optional[aiohttp.ClientSession] = None
+        # SDK admin calls (destroy, resource) are blocking; keep them off the event loop
+        self._executor = ThreadPoolExecutor(max_workers=16, thread_name_prefix="cloudinary")
+        
+        # public_id -> (expires_at, info); Admin API calls are rate limited
+        self._info_cache: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._info_locks: Dict[str, asyncio.Lock] = {}
+        # full public_id -> pending upload; concurrent uploads of the same id share one
+        self._inflight: Dict[str, "asyncio.Future[str]"] = {}
+    
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Get or create the shared HTTP session."""
+        if self.session is None or self.session.closed:
+            self.session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=64,
+                    limit_per_host=32,
+                    keepalive_timeout=HTTP_KEEPALIVE_TIMEOUT,
+                    ttl_dns_cache=300,
+                )
+            )
+        return self.session
+    
+    async def close(self):
+        """Close HTTP session."""
+        if self.session:
+            await self.session.close()
+    
+    async def _run_blocking(self, fn, *args, **kwargs):
+        """Run a blocking Cloudinary SDK call on the service's thread pool."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, functools.partial(fn, *args, **kwargs))
+    
+    def _signed_params(self, **options) -> Dict[str, Any]:
+        """Build and sign upload API parameters with the SDK."""
+        params = cloudinary.utils.build_upload_params(**options)
+        params.setdefault("timestamp", int(time.time()))
+        return cloudinary.utils.sign_request(
+            params, {"api_key": self._api_key, "api_secret": self._api_secret}
+        )
+    
+    async def _post_upload(
+        self,
+        resource_type: str,
+        params: Dict[str, Any],
+        file_payload,
+        filename: str,
+        headers: Optional[Dict[str, str]] = None
+    ) -> Dict[str, Any]:
+        """POST one multipart request to the upload API and return its JSON."""
+        form = aiohttp.FormData()
+        for key, value in params.items():
+            form.add_field(key, str(value))
+        form.add_field(
+            "file",
+            file_payload,
+            filename=filename,
+            content_type="application/octet-stream"
+        )
+        
+        session = await self._get_session()
+        url = cloudinary.utils.cloudinary_api_url("upload", resource_type=resource_type)
+        async with session.post(url, data=form, headers=headers) as response:
+            if response.status >= 400:
+                error_text = await response.text()
+                raise aiohttp.ClientResponseError(
+                    response.request_info,
+                    response.history,
+                    status=response.status,
+                    message=f"Cloudinary upload failed: {error_text}"
+                )
+            return await response.json()
+    
+    async def _upload(self, file_path: str, resource_type: str, **options) -> Dict[str, Any]:
+        """
+        Upload a file through Cloudinary's REST API.
+        
+        Parameters are built and signed by the SDK, but the request itself
+        goes through aiohttp and the file is streamed from disk.
+        """
+        # aiohttp streams an open file in 64 KiB reads on its executor and
+        # sends a Content-Length, so memory stays flat whatever the file size
+        with open(file_path, "rb") as fp:
+            return await self._post_upload(
+                resource_type,
+                self._signed_params(**options),
+                fp,
+                os.path.basename(file_path)
             )
-            logger.warning("Cloudinary not configured, using demo settings")
+    
+    async def _upload_large_concurrent(
+        self,
+        file_path: str,
+        resource_type: str,
+        chunk_size: int = LARGE_UPLOAD_CHUNK_SIZE,
+        concurrency: int = LARGE_UPLOAD_CONCURRENCY,
+        **options
+    ) -> Dict[str, Any]:
+        """
+        Upload a large file as Content-Range chunks sent in parallel.
+        
+        All chunks share one signed parameter set and upload id. Every chunk
+        but the last is sent concurrently and retried on its own; the last
+        chunk goes once the rest have landed, and its response carries the
+        resource metadata.
+        """
+        total = os.path.getsize(file_path)
+        params = self._signed_params(**options)
+        filename = os.path.basename(file_path)
+        upload_id = uuid.uuid4().hex
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        async def _send_chunk(start: int) -> Dict[str, Any]:
+            end = min(start + chunk_size, total) - 1
+            async with semaphore:
+                async with aiofiles.open(file_path, "rb") as fp:
+                    await fp.seek(start)
+                    chunk = await fp.read(end - start + 1)
+                return await self._post_upload(
+                    resource_type,
+                    params,
+                    chunk,
+                    filename,
+                    headers={
+                        "X-Unique-Upload-Id": upload_id,
+                        "Content-Range": f"bytes {start}-{end}/{total}"
+                    }
+                )
+        
+        *starts, last_start = range(0, total, chunk_size)
+        await asyncio.gather(*(_with_retry(_send_chunk, start) for start in starts))
+        return await _with_retry(_send_chunk, last_start)
     
     async def upload_video(
         self,
         file_path: str,
         public_id: str,
-        folder: str = "capora/videos"
+        folder: Optional[str] = None
     ) -> str:
         """
         Upload video to Cloudinary.
@@ -44,45 +384,148 @@ class CloudinaryService:
         Args:
             file_path: Path to video file
             public_id: Unique identifier for the video
-            folder: Cloudinary folder to store the video
+            folder: Cloudinary folder to store the video (defaults to CLOUDINARY_VIDEO_FOLDER)
             
         Returns:
             Cloudinary URL of uploaded video
+            
+        Raises:
+            CloudinaryUploadError: If the upload fails after retries
         """
+        full_id = (self._video_prefix if folder is None else folder + "/") + public_id
+        
+        # For demo purposes, return a mock URL
+        if not self._is_configured():
+            logger.warning("Cloudinary not configured, returning mock URL")
+            return f"https://res.cloudinary.com/demo/video/upload/v1234567890/{full_id}.mp4"
+        
+        pending = self._inflight.get(full_id)
+        if pending is not None:
+            return await asyncio.shield(pending)
+        
+        future: "asyncio.Future[str]" = asyncio.get_running_loop().create_future()
+        self._inflight[full_id] = future
         try:
-            # For demo purposes, return a mock URL
-            if not self._is_configured():
-                logger.warning("Cloudinary not configured, returning mock URL")
-                return f"https://res.cloudinary.com/demo/video/upload/v1234567890/{folder}/{public_id}.mp4"
+            url = await self._upload_video(file_path, full_id)
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # Mark retrieved so a future nobody else awaited doesn't log a warning
+            future.exception()
+            raise
+        else:
+            future.set_result(url)
+            return url
+        finally:
+            self._inflight.pop(full_id, None)
+    
+    @staticmethod
+    def _video_options(full_id: str) -> Dict[str, Any]:
+        """Upload options shared by every video upload."""
+        return dict(
+            public_id=full_id,
+            quality="auto:good",
+            format="mp4",
+            overwrite=True,
+            eager=list(EAGER_VIDEO_TRANSFORMATIONS),
+            eager_async=True
+        )
+    
+    async def _upload_video(self, file_path: str, full_id: str) -> str:
+        """Upload a video under its full public_id; callers go through upload_video."""
+        try:
+            options = self._video_options(full_id)
             
-            # Upload video to Cloudinary
-            result = cloudinary.uploader.upload(
-                file_path,
-                resource_type="video",
-                public_id=f"{folder}/{public_id}",
-                quality="auto:good",
-                format="mp4",
-                overwrite=True,
-                # Free tier optimizations
-                transformation=[
-                    {"quality": "auto:good"},
-                    {"format": "mp4"}
-                ]
-            )
+            # Upload video to Cloudinary; large files go up in chunks
+            if os.path.getsize(file_path) > LARGE_UPLOAD_THRESHOLD:
+                result = await self._upload_large_concurrent(file_path, "video", **options)
+            else:
+                result = await _with_retry(self._upload, file_path, "video", **options)
             
-            logger.info(f"Video uploaded to Cloudinary: {result['secure_url']}")
+            logger.info("Video uploaded to Cloudinary: %s", result["secure_url"])
             return result["secure_url"]
             
-        except Exception as e:
-            logger.error(f"Failed to upload video to Cloudinary: {e}")
-            # Return mock URL for demo
-            return f"https://res.cloudinary.com/demo/video/upload/v1234567890/{folder}/{public_id}.mp4"
+        except _SERVICE_ERRORS as e:
+            logger.error("Failed to upload video to Cloudinary: %s", e)
+            raise CloudinaryUploadError(full_id) from e
+    
+    async def upload_video_stream(
+        self,
+        chunks: AsyncIterable[bytes],
+        public_id: str,
+        folder: Optional[str] = None
+    ) -> str:
+        """
+        Upload a video whose bytes are still being produced, e.g. FFmpeg's stdout.
+        
+        The stream is re-chunked and sent as Content-Range requests; the total
+        isn't known until the stream ends, so every chunk but the last is sent
+        with a total of -1. If the iterator raises, the final chunk is never
+        sent and Cloudinary discards the partial upload.
+        
+        Args:
+            chunks: Async iterator of video bytes
+            public_id: Unique identifier for the video
+            folder: Cloudinary folder to store the video (defaults to CLOUDINARY_VIDEO_FOLDER)
+            
+        Returns:
+            Cloudinary URL of uploaded video
+            
+        Raises:
+            CloudinaryUploadError: If a chunk fails after retries
+        """
+        full_id = (self._video_prefix if folder is None else folder + "/") + public_id
+        
+        if not self._is_configured():
+            # Drain the stream so the producer isn't blocked on a full pipe
+            async for _ in chunks:
+                pass
+            logger.warning("Cloudinary not configured, returning mock URL")
+            return f"https://res.cloudinary.com/demo/video/upload/v1234567890/{full_id}.mp4"
+        
+        params = self._signed_params(**self._video_options(full_id))
+        upload_id = uuid.uuid4().hex
+        filename = public_id + ".mp4"
+        
+        async def _send(chunk: bytes, start: int, total: int) -> Dict[str, Any]:
+            return await self._post_upload(
+                "video",
+                params,
+                chunk,
+                filename,
+                headers={
+                    "X-Unique-Upload-Id": upload_id,
+                    "Content-Range": f"bytes {start}-{start + len(chunk) - 1}/{total}"
+                }
+            )
+        
+        try:
+            buffer = bytearray()
+            sent = 0
+            async for data in chunks:
+                buffer += data
+                # Keep at least one full chunk back so the last request has data
+                while len(buffer) > LARGE_UPLOAD_CHUNK_SIZE:
+                    chunk = bytes(buffer[:LARGE_UPLOAD_CHUNK_SIZE])
+                    del buffer[:LARGE_UPLOAD_CHUNK_SIZE]
+                    await _with_retry(_send, chunk, sent, -1)
+                    sent += len(chunk)
+            
+            result = await _with_retry(_send, bytes(buffer), sent, sent + len(buffer))
+            logger.info("Video stream uploaded to Cloudinary: %s", result["secure_url"])
+            return result["secure_url"]
+            
+        except _SERVICE_ERRORS as e:
+            logger.error("Failed to upload video stream to Cloudinary: %s", e)
+            raise CloudinaryUploadError(full_id) from e
     
     async def upload_image(
         self,
         file_path: str,
         public_id: str,
-        folder: str = "capora/images"
+        folder: Optional[str] = None
     ) -> str:
         """
         Upload image to Cloudinary.
@@ -90,34 +533,38 @@ class CloudinaryService:
         Args:
             file_path: Path to image file
             public_id: Unique identifier for the image
-            folder: Cloudinary folder to store the image
+            folder: Cloudinary folder to store the image (defaults to CLOUDINARY_IMAGE_FOLDER)
             
         Returns:
             Cloudinary URL of uploaded image
+            
+        Raises:
+            CloudinaryUploadError: If the upload fails after retries
         """
+        full_id = (self._image_prefix if folder is None else folder + "/") + public_id
         try:
             # For demo purposes, return a mock URL
             if not self._is_configured():
                 logger.warning("Cloudinary not configured, returning mock URL")
-                return f"https://res.cloudinary.com/demo/image/upload/v1234567890/{folder}/{public_id}.jpg"
+                return f"https://res.cloudinary.com/demo/image/upload/v1234567890/{full_id}.jpg"
             
             # Upload image to Cloudinary
-            result = cloudinary.uploader.upload(
+            result = await _with_retry(
+                self._upload,
                 file_path,
-                resource_type="image",
-                public_id=f"{folder}/{public_id}",
+                "image",
+                public_id=full_id,
                 quality="auto:good",
                 format="jpg",
                 overwrite=True
             )
             
-            logger.info(f"Image uploaded to Cloudinary: {result['secure_url']}")
+            logger.info("Image uploaded to Cloudinary: %s", result["secure_url"])
             return result["secure_url"]
             
-        except Exception as e:
-            logger.error(f"Failed to upload image to Cloudinary: {e}")
-            # Return mock URL for demo
-            return f"https://res.cloudinary.com/demo/image/upload/v1234567890/{folder}/{public_id}.jpg"
+        except _SERVICE_ERRORS as e:
+            logger.error("Failed to upload image to Cloudinary: %s", e)
+            raise CloudinaryUploadError(full_id) from e
     
     async def delete_video(self, video_url: str) -> bool:
         """
@@ -137,25 +584,28 @@ class CloudinaryService:
             # Extract public_id from URL
             public_id = self._extract_public_id(video_url)
             if not public_id:
-                logger.warning(f"Could not extract public_id from URL: {video_url}")
+                logger.warning("Could not extract public_id from URL: %s", video_url)
                 return False
             
             # Delete from Cloudinary
-            result = cloudinary.uploader.destroy(
+            result = await _with_retry(
+                self._run_blocking,
+                cloudinary.uploader.destroy,
                 public_id,
                 resource_type="video"
             )
             
             success = result.get("result") == "ok"
             if success:
-                logger.info(f"Video deleted from Cloudinary: {public_id}")
+                self._info_cache.pop(public_id, None)
+                logger.info("Video deleted from Cloudinary: %s", public_id)
             else:
-                logger.warning(f"Failed to delete video: {result}")
+                logger.warning("Failed to delete video: %s", result)
             
             return success
             
-        except Exception as e:
-            logger.error(f"Failed to delete video from Cloudinary: {e}")
+        except _SERVICE_ERRORS as e:
+            logger.error("Failed to delete video from Cloudinary: %s", e)
             return False
     
     async def delete_image(self, image_url: str) -> bool:
@@ -176,27 +626,87 @@ class CloudinaryService:
             # Extract public_id from URL
             public_id = self._extract_public_id(image_url)
             if not public_id:
-                logger.warning(f"Could not extract public_id from URL: {image_url}")
+                logger.warning("Could not extract public_id from URL: %s", image_url)
                 return False
             
             # Delete from Cloudinary
-            result = cloudinary.uploader.destroy(
+            result = await _with_retry(
+                self._run_blocking,
+                cloudinary.uploader.destroy,
                 public_id,
                 resource_type="image"
             )
             
             success = result.get("result") == "ok"
             if success:
-                logger.info(f"Image deleted from Cloudinary: {public_id}")
+                logger.info("Image deleted from Cloudinary: %s", public_id)
             else:
-                logger.warning(f"Failed to delete image: {result}")
+                logger.warning("Failed to delete image: %s", result)
             
             return success
             
-        except Exception as e:
-            logger.error(f"Failed to delete image from Cloudinary: {e}")
+        except _SERVICE_ERRORS as e:
+            logger.error("Failed to delete image from Cloudinary: %s", e)
             return False
     
+    async def upload_many(
+        self,
+        items: Iterable[Tuple[str, str]],
+        resource_type: str = "image",
+        folder: Optional[str] = None,
+        concurrency: Optional[int] = None
+    ) -> List[Union[str, BaseException]]:
+        """
+        Upload several files concurrently.
+        
+        Args:
+            items: (file_path, public_id) pairs
+            resource_type: "image" or "video"
+            folder: Cloudinary folder, defaults to the per-type default
+            concurrency: Maximum in-flight uploads (defaults to CLOUDINARY_CONCURRENCY)
+            
+        Returns:
+            URL or raised exception per item, in input order
+        """
+        upload = self.upload_video if resource_type == "video" else self.upload_image
+        kwargs = {"folder": folder} if folder else {}
+        semaphore = asyncio.Semaphore(concurrency or settings.CLOUDINARY_CONCURRENCY)
+        
+        async def _bounded(file_path: str, public_id: str):
+            async with semaphore:
+                return await upload(file_path, public_id, **kwargs)
+        
+        return await asyncio.gather(
+            *(_bounded(file_path, public_id) for file_path, public_id in items),
+            return_exceptions=True
+        )
+    
+    async def delete_many(
+        self,
+        urls: Iterable[str],
+        resource_type: str = "video",
+        concurrency: Optional[int] = None
+    ) -> List[Union[bool, BaseException]]:
+        """
+        Delete several assets concurrently.
+        
+        Args:
+            urls: Cloudinary URLs of the assets
+            resource_type: "image" or "video"
+            concurrency: Maximum in-flight deletions (defaults to CLOUDINARY_CONCURRENCY)
+            
+        Returns:
+            Success flag or raised exception per URL, in input order
+        """
+        delete = self.delete_video if resource_type == "video" else self.delete_image
+        semaphore = asyncio.Semaphore(concurrency or settings.CLOUDINARY_CONCURRENCY)
+        
+        async def _bounded(url: str):
+            async with semaphore:
+                return await delete(url)
+        
+        return await asyncio.gather(*(_bounded(url) for url in urls), return_exceptions=True)
+    
     def generate_upload_signature(
         self,
         params: Dict[str, Any]
@@ -210,28 +720,23 @@ class CloudinaryService:
         Returns:
             Signature and additional parameters
         """
-        try:
-            if not self._is_configured():
-                return {}
-            
-            # Generate signature
-            signature = cloudinary.utils.api_sign_request(
-                params,
-                cloudinary.config().api_secret
-            )
-            
-            return {
-                "signature": signature,
-                "api_key": cloudinary.config().api_key,
-                "timestamp": params.get("timestamp"),
-                "cloud_name": cloudinary.config().cloud_name
-            }
-            
-        except Exception as e:
-            logger.error(f"Failed to generate upload signature: {e}")
+        if not self._is_configured():
             return {}
+        
+        # Generate signature
+        if settings.CLOUDINARY_FAST_SIGN:
+            signature = _sign(params, self._api_secret)
+        else:
+            signature = cloudinary.utils.api_sign_request(params, self._api_secret)
+        
+        return {
+            "signature": signature,
+            "api_key": self._api_key,
+            "timestamp": params.get("timestamp"),
+            "cloud_name": self._cloud_name
+        }
     
-    def get_video_info(self, public_id: str) -> Dict[str, Any]:
+    async def get_video_info(self, public_id: str) -> Dict[str, Any]:
         """
         Get video information from Cloudinary.
         
@@ -241,39 +746,94 @@ class CloudinaryService:
         Returns:
             Video information
         """
+        info = self._cached_info(public_id)
+        if info is not None:
+            return info
+        
+        # Coalesce concurrent misses for the same video into one lookup
+        lock = self._info_locks.setdefault(public_id, asyncio.Lock())
         try:
-            if not self._is_configured():
-                return {}
-            
-            # Get resource info from Cloudinary
-            result = cloudinary.api.resource(
-                public_id,
-                resource_type="video"
-            )
+            async with lock:
+                info = self._cached_info(public_id)
+                if info is None:
+                    infos = await self.get_videos_info([public_id])
+                    info = infos.get(public_id, {})
+        finally:
+            if not lock.locked():
+                self._info_locks.pop(public_id, None)
+        
+        return info
+    
+    async def get_videos_info(self, public_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Get information for several videos with batched Admin API calls.
+        
+        Args:
+            public_ids: Cloudinary public IDs
             
-            return {
-                "url": result.get("secure_url"),
-                "duration": result.get("duration"),
-                "width": result.get("width"),
-                "height": result.get("height"),
-                "format": result.get("format"),
-                "bytes": result.get("bytes"),
-                "created_at": result.get("created_at")
-            }
+        Returns:
+            Video information keyed by public ID; missing videos are omitted
+        """
+        try:
+            if not self._is_configured() or not public_ids:
+                return {}
             
-        except Exception as e:
-            logger.error(f"Failed to get video info: {e}")
+            infos = {}
+            missing = []
+            for public_id in public_ids:
+                info = self._cached_info(public_id)
+                if info is None:
+                    missing.append(public_id)
+                else:
+                    infos[public_id] = info
+            
+            for start in range(0, len(missing), RESOURCES_BY_IDS_LIMIT):
+                result = await _with_retry(
+                    self._run_blocking,
+                    cloudinary.api.resources_by_ids,
+                    missing[start:start + RESOURCES_BY_IDS_LIMIT],
+                    resource_type="video"
+                )
+                for resource in result.get("resources", []):
+                    infos[resource["public_id"]] = self._cache_info(resource["public_id"], {
+                        "url": resource.get("secure_url"),
+                        "duration": resource.get("duration"),
+                        "width": resource.get("width"),
+                        "height": resource.get("height"),
+                        "format": resource.get("format"),
+                        "bytes": resource.get("bytes"),
+                        "created_at": resource.get("created_at")
+                    })
+            
+            return infos
+            
+        except _SERVICE_ERRORS as e:
+            logger.error("Failed to get video info: %s", e)
             return {}
     
+    def _cached_info(self, public_id: str) -> Optional[Dict[str, Any]]:
+        """Return cached video info, or None on miss/expiry."""
+        entry = self._info_cache.get(public_id)
+        if entry is None:
+            return None
+        expires_at, info = entry
+        if expires_at <= time.monotonic():
+            del self._info_cache[public_id]
+            return None
+        self._info_cache.move_to_end(public_id)
+        return info
+    
+    def _cache_info(self, public_id: str, info: Dict[str, Any]) -> Dict[str, Any]:
+        """Store video info for VIDEO_INFO_TTL seconds and return it."""
+        self._info_cache[public_id] = (time.monotonic() + VIDEO_INFO_TTL, info)
+        self._info_cache.move_to_end(public_id)
+        while len(self._info_cache) > VIDEO_INFO_CACHE_SIZE:
+            self._info_cache.popitem(last=False)
+        return info
+    
     def _is_configured(self) -> bool:
         """Check if Cloudinary is properly configured."""
-        config = cloudinary.config()
-        return bool(
-            config.cloud_name and 
-            config.api_key and 
-            config.api_secret and
-            config.cloud_name != "demo"
-        )
+        return self._configured
     
     def _extract_public_id(self, url: str) -> Optional[str]:
         """
@@ -285,34 +845,7 @@ class CloudinaryService:
         Returns:
             Public ID or None if extraction fails
         """
-        try:
-            # Parse Cloudinary URL to extract public_id
-            # Example: https://res.cloudinary.com/demo/video/upload/v1234567890/capora/videos/abc123.mp4
-            parts = url.split("/")
-            
-            # Find the upload part
-            upload_index = -1
-            for i, part in enumerate(parts):
-                if part == "upload":
-                    upload_index = i
-                    break
-            
-            if upload_index == -1:
-                return None
-            
-            # Public ID starts after version (v1234567890)
-            public_id_parts = parts[upload_index + 2:]  # Skip 'upload' and version
-            public_id = "/".join(public_id_parts)
-            
-            # Remove file extension
-            if "." in public_id:
-                public_id = public_id.rsplit(".", 1)[0]
-            
-            return public_id
-            
-        except Exception as e:
-            logger.error(f"Failed to extract public_id from URL {url}: {e}")
-            return None
+        return _extract_public_id(url)
     
     def optimize_video_url(
         self,
@@ -333,41 +866,14 @@ class CloudinaryService:
         Returns:
             Optimized video URL
         """
-        try:
-            if not self._is_configured():
-                return url
-            
-            public_id = self._extract_public_id(url)
-            if not public_id:
-                return url
-            
-            # Build transformation parameters
-            transformations = []
-            
-            if width or height:
-                resize_params = {"crop": "fill"}
-                if width:
-                    resize_params["width"] = width
-                if height:
-                    resize_params["height"] = height
-                transformations.append(resize_params)
-            
-            if quality:
-                transformations.append({"quality": quality})
-            
-            # Generate optimized URL
-            optimized_url, _ = cloudinary_url(
-                public_id,
-                resource_type="video",
-                transformation=transformations,
-                secure=True
-            )
-            
-            return optimized_url
-            
-        except Exception as e:
-            logger.error(f"Failed to optimize video URL: {e}")
+        if not self._is_configured():
             return url
+        
+        public_id = self._extract_public_id(url)
+        if not public_id:
+            return url
+        
+        return _build_optimized_video_url(self._cloud_name, public_id, width, height, quality)
 
 
 # Global instance
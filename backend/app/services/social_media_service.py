@@ -4,24 +4,223 @@ Social Media Publishing Service for posting content to various platforms.
 
 import os
 import logging
-from typing import Dict, List, Optional, Any
-from datetime import datetime
+import time
+from collections import OrderedDict, deque
+from typing import Dict, List, Optional, Any, Tuple
+from datetime import datetime, timezone
+from itertools import islice
+import aiofiles
 import aiohttp
 import asyncio
-from urllib.parse import urlparse
-import base64
+import orjson
+from types import MappingProxyType
 
-from app.core.config import settings
-from app.models.content import Platform
+from app.models.enums import Platform
 
 logger = logging.getLogger(__name__)
 
+# One pooled session is shared by every publish; keep TLS connections warm
+HTTP_POOL_LIMIT = 100
+HTTP_POOL_LIMIT_PER_HOST = 20
+HTTP_KEEPALIVE_TIMEOUT = 60
+HTTP_TIMEOUT = aiohttp.ClientTimeout(total=60, connect=10)
+MAX_CONCURRENT_PUBLISHES = 5  # Per batch; more just trips platform rate limits
+MAX_CONCURRENT_POSTS = 4  # Independent posts to one platform sharing a connection
+BREAKER_FAILURE_THRESHOLD = 5
+BREAKER_RECOVERY_TIMEOUT = 30.0  # Seconds an open circuit waits before a trial publish
+PUBLISH_DEDUPE_TTL = 30.0  # Seconds an identical successful publish is reused
+UPLOAD_CHUNK_SIZE = 8 * 1024 * 1024  # Direct video uploads are sent in 8 MiB pieces
+TIKTOK_MIN_CHUNK_SIZE = 5 * 1024 * 1024  # Content Posting API limits
+TIKTOK_MAX_CHUNK_SIZE = 64 * 1024 * 1024
+TIKTOK_UPLOAD_CONCURRENCY = 4
+IG_CONTAINER_POLL_DELAYS = (0.5, 1, 2, 4, 8)  # Backoff while a Reels container processes
+TOKEN_CACHE_SIZE = 4096
+TOKEN_CACHE_TTL = 3500.0  # Just under the usual one-hour OAuth access token lifetime
+
+_PLATFORM_NAMES = MappingProxyType({platform: platform.value for platform in Platform})
+
+# Request body pieces that never change between calls
+_IG_REELS_CONTAINER = MappingProxyType({"media_type": "REELS"})
+_TIKTOK_POST_INFO_DEFAULTS = MappingProxyType({
+    "privacy_level": "PUBLIC_TO_EVERYONE",
+    "disable_duet": False,
+    "disable_comment": False,
+    "disable_stitch": False,
+    "video_cover_timestamp_ms": 1000
+})
+_YOUTUBE_CATEGORY_PEOPLE_BLOGS = "22"
+_YOUTUBE_SNIPPET_DEFAULTS = MappingProxyType({
+    "categoryId": _YOUTUBE_CATEGORY_PEOPLE_BLOGS,
+    "defaultLanguage": "en"
+})
+_YOUTUBE_STATUS = MappingProxyType({
+    "privacyStatus": "public",
+    "madeForKids": False,
+    "selfDeclaredMadeForKids": False
+})
+_YOUTUBE_UPLOAD_PARAMS = MappingProxyType({"part": "snippet,status", "uploadType": "resumable"})
+
+# Token keys each platform needs, and how to describe them when missing
+_REQUIRED_TOKENS = MappingProxyType({
+    Platform.INSTAGRAM: (("instagram_access_token", "instagram_page_id"), "Instagram access token or page ID"),
+    Platform.TIKTOK: (("tiktok_access_token",), "TikTok access token"),
+    Platform.YOUTUBE_SHORTS: (("youtube_access_token",), "YouTube access token"),
+    Platform.TWITTER: (("twitter_access_token",), "Twitter access token"),
+    Platform.FACEBOOK: (("facebook_access_token", "facebook_page_id"), "Facebook access token or page ID"),
+})
+
+# (requests, per seconds, burst) per platform, kept just under each API's published quota
+PLATFORM_RATE_LIMITS = MappingProxyType({
+    Platform.INSTAGRAM: (200, 3600, 5),
+    Platform.FACEBOOK: (200, 3600, 5),
+    Platform.TWITTER: (300, 900, 10),
+    Platform.TIKTOK: (6, 60, 6),
+    Platform.YOUTUBE_SHORTS: (60, 60, 10),
+})
+
+
+def _tiktok_chunking(file_size: int) -> Tuple[int, int]:
+    """
+    Pick (chunk_size, total_chunk_count) for a TikTok upload.
+    
+    Aims for about ten chunks within the API's 5-64 MB bounds. The count is
+    rounded down; TikTok folds the remainder into the last chunk.
+    """
+    if file_size <= TIKTOK_MIN_CHUNK_SIZE:
+        return file_size, 1
+    chunk_size = min(TIKTOK_MAX_CHUNK_SIZE, max(TIKTOK_MIN_CHUNK_SIZE, -(-file_size // 10)))
+    return chunk_size, file_size // chunk_size
+
+
+def _trunc(text: str, limit: int) -> str:
+    """Cut text to a platform limit, returning it as-is (no copy) when it fits."""
+    return text if len(text) <= limit else text[:limit]
+
+
+def _is_outage(exc: BaseException) -> bool:
+    """
+    Whether a failure says the platform itself is unhealthy.
+    
+    Only 5xx answers, connection failures and timeouts count; 4xx errors
+    (an expired token, a rejected caption) are one user's problem.
+    """
+    if isinstance(exc, aiohttp.ClientResponseError):
+        return exc.status >= 500
+    return isinstance(exc, (aiohttp.ClientConnectionError, asyncio.TimeoutError))
+
+
+def _json_dumps(obj: Any) -> str:
+    """aiohttp JSON serializer; orjson is several times faster than stdlib json."""
+    return orjson.dumps(obj).decode()
+
+
+class PlatformAPIError(aiohttp.ClientResponseError):
+    """A platform API call answered with an error status; str() is the step and body."""
+    
+    def __str__(self) -> str:
+        return self.message
+
+
+class TokenBucket:
+    """
+    Client-side rate limiter: ``rate`` calls per second, bursts up to ``capacity``.
+    
+    acquire() takes a token immediately and, if the bucket went negative,
+    sleeps until that token would have been refilled. Waiters therefore
+    queue up without a lock, since nothing awaits between refill and take.
+    """
+    
+    __slots__ = ("rate", "capacity", "tokens", "last_refill")
+    
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.last_refill = time.monotonic()
+    
+    async def acquire(self):
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.last_refill) * self.rate)
+        self.last_refill = now
+        self.tokens -= 1
+        if self.tokens < 0:
+            await asyncio.sleep(-self.tokens / self.rate)
+
+
+class CircuitBreaker:
+    """
+    Per-platform circuit breaker over a rolling window of publish outcomes.
+    
+    The circuit opens once the window holds ``failure_threshold`` failures
+    making up at least half of it. While open, calls are refused until
+    ``recovery_timeout`` has passed; then a single trial call is let through
+    (half-open), and its outcome closes or re-opens the circuit.
+    """
+    
+    __slots__ = ("failure_threshold", "recovery_timeout", "_results", "_opened_at", "_probing")
+    
+    def __init__(
+        self,
+        failure_threshold: int = BREAKER_FAILURE_THRESHOLD,
+        recovery_timeout: float = BREAKER_RECOVERY_TIMEOUT,
+        window: int = 20
+    ):
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self._results: "deque[bool]" = deque(maxlen=window)
+        self._opened_at: Optional[float] = None
+        self._probing = False
+    
+    def allow(self) -> bool:
+        if self._opened_at is None:
+            return True
+        if self._probing or time.monotonic() - self._opened_at < self.recovery_timeout:
+            return False
+        self._probing = True
+        return True
+    
+    def record(self, ok: Optional[bool]):
+        """Record a call's outcome; None means it said nothing about the platform."""
+        if self._opened_at is not None:
+            # Outcome of the half-open trial call
+            self._probing = False
+            if ok is None:
+                # Inconclusive trial: stay open and let the next call probe
+                return
+            if ok:
+                self._opened_at = None
+                self._results.clear()
+            else:
+                self._opened_at = time.monotonic()
+            return
+        
+        if ok is None:
+            return
+        self._results.append(ok)
+        failures = self._results.count(False)
+        if failures >= self.failure_threshold and failures * 2 >= len(self._results):
+            self._opened_at = time.monotonic()
+            logger.warning("Circuit opened after %s failed publishes", failures)
+
 
 class SocialMediaPublisher:
     """Service for publishing content to social media platforms."""
     
     def __init__(self):
-        self.session = None
+        self.session: Optional[aiohttp.ClientSession] = None
+        self._session_lock = asyncio.Lock()
+        self._max_concurrent_publishes = MAX_CONCURRENT_PUBLISHES
+        # Identical publishes (retries, double clicks) share one in-flight or recent result
+        self._publishes: Dict[tuple, "asyncio.Future[Dict[str, Any]]"] = {}
+        # (user_id, platform) -> (expires_at, tokens)
+        self._token_cache: "OrderedDict[Tuple[Any, Platform], Tuple[float, Dict[str, str]]]" = OrderedDict()
+        # Per-process limits; waiting locally is cheaper than a round trip ending in 429
+        self._limiters = {
+            platform: TokenBucket(requests / per_seconds, burst)
+            for platform, (requests, per_seconds, burst) in PLATFORM_RATE_LIMITS.items()
+        }
+        # Fail fast while a platform is down instead of holding pool slots until timeout
+        self._breakers = {platform: CircuitBreaker() for platform in Platform}
         self.platform_configs = {
             Platform.INSTAGRAM: {
                 "base_url": "https://graph.facebook.com/v19.0",
@@ -44,23 +243,88 @@ class SocialMediaPublisher:
                 "required_scopes": ["pages_manage_posts", "pages_read_engagement"]
             }
         }
+        
+        self._dispatch = {
+            Platform.INSTAGRAM: self._publish_to_instagram,
+            Platform.TIKTOK: self._publish_to_tiktok,
+            Platform.YOUTUBE_SHORTS: self._publish_to_youtube,
+            Platform.TWITTER: self._publish_to_twitter,
+            Platform.FACEBOOK: self._publish_to_facebook,
+        }
+        
+        # Endpoint bases and fully static endpoints, resolved once
+        self._ig_base = self.platform_configs[Platform.INSTAGRAM]["base_url"]
+        self._fb_base = self.platform_configs[Platform.FACEBOOK]["base_url"]
+        self._tiktok_init_url = f"{self.platform_configs[Platform.TIKTOK]['base_url']}/v2/post/publish/video/init/"
+        self._yt_videos_url = f"{self.platform_configs[Platform.YOUTUBE_SHORTS]['base_url']}/videos"
+        self._tweets_url = f"{self.platform_configs[Platform.TWITTER]['base_url']}/tweets"
     
-    async def _get_session(self) -> aiohttp.ClientSession:
-        """Get or create HTTP session."""
-        if not self.session:
-            self.session = aiohttp.ClientSession()
-        return self.session
+    async def startup(self):
+        """Create the pooled HTTP session; called once from the app lifespan."""
+        if self.session is not None and not self.session.closed:
+            return
+        async with self._session_lock:
+            # Re-check: another caller may have created it while we waited
+            if self.session is None or self.session.closed:
+                connector = aiohttp.TCPConnector(
+                    limit=HTTP_POOL_LIMIT,
+                    limit_per_host=HTTP_POOL_LIMIT_PER_HOST,
+                    ttl_dns_cache=300,
+                    keepalive_timeout=HTTP_KEEPALIVE_TIMEOUT,
+                    enable_cleanup_closed=True
+                )
+                self.session = aiohttp.ClientSession(
+                    connector=connector,
+                    timeout=HTTP_TIMEOUT,
+                    json_serialize=_json_dumps
+                )
     
     async def close(self):
         """Close HTTP session."""
-        if self.session:
-            await self.session.close()
+        async with self._session_lock:
+            if self.session:
+                await self.session.close()
+                self.session = None
+    
+    async def _resolve_tokens(
+        self,
+        user_id: Any,
+        platform: Platform,
+        user_tokens: Optional[Dict[str, str]] = None
+    ) -> Dict[str, str]:
+        """
+        Return a user's tokens for a platform, caching them for TOKEN_CACHE_TTL.
+        
+        Tokens passed in replace the cached entry; otherwise the cached ones
+        are used while fresh, so repeat publishes skip the token lookup.
+        """
+        key = (user_id, platform)
+        now = time.monotonic()
+        
+        if user_tokens is not None:
+            self._token_cache[key] = (now + TOKEN_CACHE_TTL, user_tokens)
+            self._token_cache.move_to_end(key)
+            while len(self._token_cache) > TOKEN_CACHE_SIZE:
+                self._token_cache.popitem(last=False)
+            return user_tokens
+        
+        entry = self._token_cache.get(key)
+        if entry is None:
+            return {}
+        expires_at, tokens = entry
+        if expires_at <= now:
+            del self._token_cache[key]
+            return {}
+        self._token_cache.move_to_end(key)
+        return tokens
     
     async def publish_content(
         self,
         platform: Platform,
         content_data: Dict[str, Any],
-        user_tokens: Dict[str, str]
+        user_tokens: Optional[Dict[str, str]] = None,
+        user_id: Any = None,
+        published_at: Optional[str] = None
     ) -> Dict[str, Any]:
         """
         Publish content to specified platform.
@@ -69,103 +333,336 @@ class SocialMediaPublisher:
             platform: Target platform
             content_data: Content information (caption, video_url, etc.)
             user_tokens: User's platform access tokens
+            user_id: Owner of the tokens; when given, tokens are cached per
+                user and platform and may be omitted on later calls
+            published_at: ISO timestamp to report; defaults to now (UTC)
             
         Returns:
             Publishing result with platform-specific data
         """
+        if user_id is not None:
+            user_tokens = await self._resolve_tokens(user_id, platform, user_tokens)
+        elif user_tokens is None:
+            user_tokens = {}
+        
+        # Every field a handler sends, so distinct posts never share a result
+        key = (
+            platform,
+            content_data.get("video_url"),
+            content_data.get("file_path"),
+            content_data.get("file_size"),
+            content_data.get("caption"),
+            content_data.get("title"),
+            tuple(content_data.get("hashtags") or ()),
+            content_data.get("in_reply_to_tweet_id"),
+            tuple(sorted(user_tokens.items()))
+        )
+        pending = self._publishes.get(key)
+        if pending is not None:
+            return await asyncio.shield(pending)
+        
+        loop = asyncio.get_running_loop()
+        future: "asyncio.Future[Dict[str, Any]]" = loop.create_future()
+        self._publishes[key] = future
         try:
-            if platform == Platform.INSTAGRAM:
-                return await self._publish_to_instagram(content_data, user_tokens)
-            elif platform == Platform.TIKTOK:
-                return await self._publish_to_tiktok(content_data, user_tokens)
-            elif platform == Platform.YOUTUBE_SHORTS:
-                return await self._publish_to_youtube(content_data, user_tokens)
-            elif platform == Platform.TWITTER:
-                return await self._publish_to_twitter(content_data, user_tokens)
-            elif platform == Platform.FACEBOOK:
-                return await self._publish_to_facebook(content_data, user_tokens)
-            else:
+            result = await self._publish(platform, content_data, user_tokens, published_at)
+        except asyncio.CancelledError:
+            future.cancel()
+            self._publishes.pop(key, None)
+            raise
+        except Exception as e:
+            # Waiters see the real error; mark it retrieved in case there are none
+            future.set_exception(e)
+            future.exception()
+            self._publishes.pop(key, None)
+            raise
+        
+        future.set_result(result)
+        if result.get("success"):
+            loop.call_later(PUBLISH_DEDUPE_TTL, self._publishes.pop, key, None)
+        else:
+            # Failures aren't remembered so an explicit retry goes through
+            self._publishes.pop(key, None)
+        return result
+    
+    async def _publish(
+        self,
+        platform: Platform,
+        content_data: Dict[str, Any],
+        user_tokens: Dict[str, str],
+        published_at: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Dispatch a publish to the platform-specific implementation."""
+        if published_at is None:
+            published_at = datetime.now(timezone.utc).isoformat()
+        try:
+            handler = self._dispatch.get(platform)
+            if handler is None:
                 raise ValueError(f"Unsupported platform: {platform}")
+            
+            # Missing credentials say nothing about the platform's health
+            _, error = self._validate_tokens(platform, user_tokens)
+            if error:
+                return error
+            
+            breaker = self._breakers[platform]
+            if not breaker.allow():
+                return {
+                    "success": False,
+                    "error": "circuit_open",
+                    "platform": _PLATFORM_NAMES[platform]
+                }
+            
+            # Only successes and outages move the breaker; handlers return
+            # client errors as results and raise outage errors (see _is_outage)
+            outcome = None
+            try:
+                limiter = self._limiters.get(platform)
+                if limiter is not None:
+                    await limiter.acquire()
+                
+                result = await handler(content_data, user_tokens, published_at)
+                if result.get("success"):
+                    outcome = True
+                return result
+            except Exception as e:
+                if _is_outage(e):
+                    outcome = False
+                raise
+            finally:
+                breaker.record(outcome)
                 
         except Exception as e:
-            logger.error(f"Failed to publish to {platform}: {e}")
+            logger.error("Failed to publish to %s: %s", platform, e)
             return {
                 "success": False,
                 "error": str(e),
-                "platform": platform.value
+                "platform": _PLATFORM_NAMES[platform]
+            }
+    
+    async def _do_post(self, url: str, step: str, **kwargs) -> Dict[str, Any]:
+        """
+        POST to a platform API and return the decoded JSON body.
+        
+        Raises:
+            PlatformAPIError: On a non-2xx status, with the response body as
+                the message (aiohttp's own raise_for_status keeps only the reason)
+        """
+        async with self.session.post(url, **kwargs) as response:
+            if response.status not in (200, 201):
+                error_text = await response.text()
+                raise PlatformAPIError(
+                    response.request_info,
+                    response.history,
+                    status=response.status,
+                    message=f"{step} failed: {error_text}"
+                )
+            return await response.json(loads=orjson.loads)
+    
+    async def _put_chunks(
+        self,
+        upload_url: str,
+        file_path: str,
+        file_size: int,
+        chunk_size: int,
+        chunk_count: int,
+        concurrency: int = TIKTOK_UPLOAD_CONCURRENCY
+    ):
+        """PUT a file to a chunked upload URL as parallel Content-Range requests."""
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        async def _put(index: int):
+            start = index * chunk_size
+            # The last chunk absorbs whatever is left over
+            end = file_size - 1 if index == chunk_count - 1 else start + chunk_size - 1
+            async with semaphore:
+                async with aiofiles.open(file_path, "rb") as fp:
+                    await fp.seek(start)
+                    chunk = await fp.read(end - start + 1)
+                async with self.session.put(upload_url, data=chunk, headers={
+                    "Content-Type": "video/mp4",
+                    "Content-Range": f"bytes {start}-{end}/{file_size}"
+                }) as response:
+                    response.raise_for_status()
+        
+        await asyncio.gather(*(_put(index) for index in range(chunk_count)))
+    
+    def _validate_tokens(
+        self,
+        platform: Platform,
+        user_tokens: Dict[str, str]
+    ) -> Tuple[Optional[Tuple[str, ...]], Optional[Dict[str, Any]]]:
+        """Return (credentials, None), or (None, error result) if any are missing."""
+        keys, label = _REQUIRED_TOKENS[platform]
+        creds = tuple(user_tokens.get(key) for key in keys)
+        if not all(creds):
+            return None, {
+                "success": False,
+                "error": f"Missing {label}",
+                "platform": _PLATFORM_NAMES[platform]
             }
+        return creds, None
+    
+    async def _upload_chunked(
+        self,
+        url: str,
+        file_path: str,
+        headers: Dict[str, str],
+        chunk_size: int = UPLOAD_CHUNK_SIZE
+    ) -> Dict[str, Any]:
+        """
+        Stream a local file to a resumable upload endpoint in sequential chunks.
+        
+        Each chunk carries ``offset``/``file_size`` headers (Meta's rupload
+        protocol); only one chunk is held in memory at a time.
+        """
+        total = os.path.getsize(file_path)
+        result: Dict[str, Any] = {}
+        async with aiofiles.open(file_path, "rb") as fp:
+            offset = 0
+            while chunk := await fp.read(chunk_size):
+                chunk_headers = {**headers, "offset": str(offset), "file_size": str(total)}
+                async with self.session.post(url, data=chunk, headers=chunk_headers) as response:
+                    response.raise_for_status()
+                    result = await response.json(loads=orjson.loads)
+                offset += len(chunk)
+        return result
+    
+    async def _upload_facebook_video(
+        self,
+        upload_url: str,
+        file_path: str,
+        access_token: str,
+        description: str
+    ) -> Dict[str, Any]:
+        """Upload a local video with the Graph API's start/transfer/finish phases."""
+        session = self.session
+        
+        async with session.post(upload_url, data={
+            "upload_phase": "start",
+            "file_size": str(os.path.getsize(file_path)),
+            "access_token": access_token
+        }) as response:
+            response.raise_for_status()
+            start = await response.json(loads=orjson.loads)
+        
+        upload_session_id = start["upload_session_id"]
+        start_offset, end_offset = int(start["start_offset"]), int(start["end_offset"])
+        
+        # The server picks each chunk's range; keep sending until it says we're done
+        async with aiofiles.open(file_path, "rb") as fp:
+            while start_offset < end_offset:
+                await fp.seek(start_offset)
+                chunk = await fp.read(end_offset - start_offset)
+                form = aiohttp.FormData()
+                form.add_field("upload_phase", "transfer")
+                form.add_field("upload_session_id", upload_session_id)
+                form.add_field("start_offset", str(start_offset))
+                form.add_field("access_token", access_token)
+                form.add_field("video_file_chunk", chunk, filename=os.path.basename(file_path))
+                async with session.post(upload_url, data=form) as response:
+                    response.raise_for_status()
+                    transfer = await response.json(loads=orjson.loads)
+                start_offset, end_offset = int(transfer["start_offset"]), int(transfer["end_offset"])
+        
+        async with session.post(upload_url, data={
+            "upload_phase": "finish",
+            "upload_session_id": upload_session_id,
+            "description": description,
+            "published": "true",
+            "access_token": access_token
+        }) as response:
+            response.raise_for_status()
+            await response.json(loads=orjson.loads)
+        
+        return {"id": start.get("video_id")}
     
     async def _publish_to_instagram(
         self,
         content_data: Dict[str, Any],
-        user_tokens: Dict[str, str]
+        user_tokens: Dict[str, str],
+        published_at: str
     ) -> Dict[str, Any]:
         """Publish content to Instagram Reels."""
+        creds, error = self._validate_tokens(Platform.INSTAGRAM, user_tokens)
+        if error:
+            return error
+        access_token, page_id = creds
+        
         try:
-            session = await self._get_session()
-            access_token = user_tokens.get("instagram_access_token")
-            page_id = user_tokens.get("instagram_page_id")
+            session = self.session
             
-            if not access_token or not page_id:
-                return {
-                    "success": False,
-                    "error": "Missing Instagram access token or page ID",
-                    "platform": "instagram"
-                }
-            
-            # Step 1: Create media container
-            container_url = f"{self.platform_configs[Platform.INSTAGRAM]['base_url']}/{page_id}/media"
+            # Step 1: Create media container. With a local file we upload it
+            # ourselves (resumable) instead of waiting for Meta to fetch the URL
+            container_url = f"{self._ig_base}/{page_id}/media"
+            file_path = content_data.get("file_path")
             
             container_data = {
-                "media_type": "REELS",
-                "video_url": content_data["video_url"],
+                **_IG_REELS_CONTAINER,
                 "caption": content_data["caption"],
                 "access_token": access_token
             }
+            if file_path:
+                container_data["upload_type"] = "resumable"
+            else:
+                container_data["video_url"] = content_data["video_url"]
             
-            async with session.post(container_url, data=container_data) as response:
-                if response.status != 200:
-                    error_text = await response.text()
-                    logger.error(f"Instagram container creation failed: {error_text}")
+            container_response = await self._do_post(
+                container_url, "Container creation", data=container_data
+            )
+            container_id = container_response.get("id")
+            
+            if file_path:
+                await self._upload_chunked(
+                    container_response["uri"],
+                    file_path,
+                    {"Authorization": f"OAuth {access_token}"}
+                )
+            
+            # The container processes asynchronously; publishing before it is
+            # FINISHED just fails, so wait for it with a short backoff
+            status_url = f"{self._ig_base}/{container_id}"
+            status_params = {"fields": "status_code", "access_token": access_token}
+            for delay in IG_CONTAINER_POLL_DELAYS:
+                await asyncio.sleep(delay)
+                async with session.get(status_url, params=status_params) as response:
+                    if response.status != 200:
+                        continue
+                    status_code = (await response.json(loads=orjson.loads)).get("status_code")
+                if status_code == "FINISHED":
+                    break
+                if status_code in ("ERROR", "EXPIRED"):
+                    logger.error("Instagram container %s failed: %s", container_id, status_code)
                     return {
                         "success": False,
-                        "error": f"Container creation failed: {error_text}",
+                        "error": f"Container processing failed: {status_code}",
                         "platform": "instagram"
                     }
-                
-                container_response = await response.json()
-                container_id = container_response.get("id")
             
             # Step 2: Publish the media
-            publish_url = f"{self.platform_configs[Platform.INSTAGRAM]['base_url']}/{page_id}/media_publish"
+            publish_url = f"{self._ig_base}/{page_id}/media_publish"
             
             publish_data = {
                 "creation_id": container_id,
                 "access_token": access_token
             }
             
-            async with session.post(publish_url, data=publish_data) as response:
-                if response.status != 200:
-                    error_text = await response.text()
-                    logger.error(f"Instagram publishing failed: {error_text}")
-                    return {
-                        "success": False,
-                        "error": f"Publishing failed: {error_text}",
-                        "platform": "instagram"
-                    }
-                
-                publish_response = await response.json()
-                
-                return {
-                    "success": True,
-                    "platform": "instagram",
-                    "post_id": publish_response.get("id"),
-                    "post_url": f"https://www.instagram.com/p/{publish_response.get('id')}",
-                    "published_at": datetime.utcnow().isoformat()
-                }
-                
+            publish_response = await self._do_post(
+                publish_url, "Publishing", data=publish_data
+            )
+            
+            return {
+                "success": True,
+                "platform": "instagram",
+                "post_id": publish_response.get("id"),
+                "post_url": f"https://www.instagram.com/p/{publish_response.get('id')}",
+                "published_at": published_at
+            }
+            
         except Exception as e:
-            logger.error(f"Instagram publishing error: {e}")
+            if _is_outage(e):
+                raise  # Counted by the circuit breaker in _publish
+            logger.error("Instagram publishing error: %s", e)
             return {
                 "success": False,
                 "error": str(e),
@@ -175,68 +672,70 @@ class SocialMediaPublisher:
     async def _publish_to_tiktok(
         self,
         content_data: Dict[str, Any],
-        user_tokens: Dict[str, str]
+        user_tokens: Dict[str, str],
+        published_at: str
     ) -> Dict[str, Any]:
         """Publish content to TikTok."""
+        creds, error = self._validate_tokens(Platform.TIKTOK, user_tokens)
+        if error:
+            return error
+        (access_token,) = creds
+        
         try:
-            session = await self._get_session()
-            access_token = user_tokens.get("tiktok_access_token")
-            
-            if not access_token:
-                return {
-                    "success": False,
-                    "error": "Missing TikTok access token",
-                    "platform": "tiktok"
-                }
-            
             # TikTok requires video upload first, then publish
-            upload_url = f"{self.platform_configs[Platform.TIKTOK]['base_url']}/v2/post/publish/video/init/"
+            upload_url = self._tiktok_init_url
             
             headers = {
                 "Authorization": f"Bearer {access_token}",
                 "Content-Type": "application/json"
             }
             
+            file_path = content_data.get("file_path")
+            if file_path:
+                file_size = os.path.getsize(file_path)
+                chunk_size, chunk_count = _tiktok_chunking(file_size)
+            else:
+                # The caller uploads the bytes itself, in one piece
+                file_size = chunk_size = content_data.get("file_size", 0)
+                chunk_count = 1
+            
             upload_data = {
                 "post_info": {
-                    "title": content_data["caption"][:150],  # TikTok title limit
-                    "privacy_level": "PUBLIC_TO_EVERYONE",
-                    "disable_duet": False,
-                    "disable_comment": False,
-                    "disable_stitch": False,
-                    "video_cover_timestamp_ms": 1000
+                    **_TIKTOK_POST_INFO_DEFAULTS,
+                    "title": _trunc(content_data["caption"], 150)  # TikTok title limit
                 },
                 "source_info": {
                     "source": "FILE_UPLOAD",
-                    "video_size": content_data.get("file_size", 0),
-                    "chunk_size": content_data.get("file_size", 0),
-                    "total_chunk_count": 1
+                    "video_size": file_size,
+                    "chunk_size": chunk_size,
+                    "total_chunk_count": chunk_count
                 }
             }
             
-            async with session.post(upload_url, json=upload_data, headers=headers) as response:
-                if response.status != 200:
-                    error_text = await response.text()
-                    logger.error(f"TikTok upload init failed: {error_text}")
-                    return {
-                        "success": False,
-                        "error": f"Upload initialization failed: {error_text}",
-                        "platform": "tiktok"
-                    }
-                
-                upload_response = await response.json()
-                
-                return {
-                    "success": True,
-                    "platform": "tiktok",
-                    "publish_id": upload_response.get("data", {}).get("publish_id"),
-                    "upload_url": upload_response.get("data", {}).get("upload_url"),
-                    "status": "pending_upload",
-                    "published_at": datetime.utcnow().isoformat()
-                }
-                
+            upload_response = await self._do_post(
+                upload_url, "Upload initialization", json=upload_data, headers=headers
+            )
+            video_upload_url = upload_response.get("data", {}).get("upload_url")
+            
+            # With the file at hand, send the bytes now instead of leaving it to the caller
+            status = "pending_upload"
+            if file_path and video_upload_url:
+                await self._put_chunks(video_upload_url, file_path, file_size, chunk_size, chunk_count)
+                status = "processing"
+            
+            return {
+                "success": True,
+                "platform": "tiktok",
+                "publish_id": upload_response.get("data", {}).get("publish_id"),
+                "upload_url": video_upload_url,
+                "status": status,
+                "published_at": published_at
+            }
+            
         except Exception as e:
-            logger.error(f"TikTok publishing error: {e}")
+            if _is_outage(e):
+                raise  # Counted by the circuit breaker in _publish
+            logger.error("TikTok publishing error: %s", e)
             return {
                 "success": False,
                 "error": str(e),
@@ -246,22 +745,18 @@ class SocialMediaPublisher:
     async def _publish_to_youtube(
         self,
         content_data: Dict[str, Any],
-        user_tokens: Dict[str, str]
+        user_tokens: Dict[str, str],
+        published_at: str
     ) -> Dict[str, Any]:
         """Publish content to YouTube Shorts."""
+        creds, error = self._validate_tokens(Platform.YOUTUBE_SHORTS, user_tokens)
+        if error:
+            return error
+        (access_token,) = creds
+        
         try:
-            session = await self._get_session()
-            access_token = user_tokens.get("youtube_access_token")
-            
-            if not access_token:
-                return {
-                    "success": False,
-                    "error": "Missing YouTube access token",
-                    "platform": "youtube_shorts"
-                }
-            
             # YouTube Shorts upload
-            upload_url = f"{self.platform_configs[Platform.YOUTUBE_SHORTS]['base_url']}/videos"
+            upload_url = self._yt_videos_url
             
             headers = {
                 "Authorization": f"Bearer {access_token}",
@@ -270,47 +765,34 @@ class SocialMediaPublisher:
             
             video_data = {
                 "snippet": {
-                    "title": content_data.get("title", "YouTube Short")[:100],
-                    "description": content_data["caption"][:5000],
-                    "tags": content_data.get("hashtags", [])[:20],  # Max 20 tags
-                    "categoryId": "22",  # People & Blogs category
-                    "defaultLanguage": "en"
+                    "title": _trunc(content_data.get("title", "YouTube Short"), 100),
+                    "description": _trunc(content_data["caption"], 5000),
+                    "tags": list(islice(content_data.get("hashtags") or (), 20)),  # Max 20 tags
+                    **_YOUTUBE_SNIPPET_DEFAULTS
                 },
-                "status": {
-                    "privacyStatus": "public",
-                    "madeForKids": False,
-                    "selfDeclaredMadeForKids": False
-                }
+                # orjson only serializes real dicts
+                "status": dict(_YOUTUBE_STATUS)
             }
             
-            params = {
-                "part": "snippet,status",
-                "uploadType": "resumable"
+            params = _YOUTUBE_UPLOAD_PARAMS
+            
+            upload_response = await self._do_post(
+                upload_url, "Upload", json=video_data, headers=headers, params=params
+            )
+            
+            return {
+                "success": True,
+                "platform": "youtube_shorts",
+                "video_id": upload_response.get("id"),
+                "video_url": f"https://www.youtube.com/watch?v={upload_response.get('id')}",
+                "status": "uploaded",
+                "published_at": published_at
             }
             
-            async with session.post(upload_url, json=video_data, headers=headers, params=params) as response:
-                if response.status not in [200, 201]:
-                    error_text = await response.text()
-                    logger.error(f"YouTube upload failed: {error_text}")
-                    return {
-                        "success": False,
-                        "error": f"Upload failed: {error_text}",
-                        "platform": "youtube_shorts"
-                    }
-                
-                upload_response = await response.json()
-                
-                return {
-                    "success": True,
-                    "platform": "youtube_shorts",
-                    "video_id": upload_response.get("id"),
-                    "video_url": f"https://www.youtube.com/watch?v={upload_response.get('id')}",
-                    "status": "uploaded",
-                    "published_at": datetime.utcnow().isoformat()
-                }
-                
         except Exception as e:
-            logger.error(f"YouTube publishing error: {e}")
+            if _is_outage(e):
+                raise  # Counted by the circuit breaker in _publish
+            logger.error("YouTube publishing error: %s", e)
             return {
                 "success": False,
                 "error": str(e),
@@ -320,20 +802,16 @@ class SocialMediaPublisher:
     async def _publish_to_twitter(
         self,
         content_data: Dict[str, Any],
-        user_tokens: Dict[str, str]
+        user_tokens: Dict[str, str],
+        published_at: str
     ) -> Dict[str, Any]:
         """Publish content to Twitter/X."""
+        creds, error = self._validate_tokens(Platform.TWITTER, user_tokens)
+        if error:
+            return error
+        (access_token,) = creds
+        
         try:
-            session = await self._get_session()
-            access_token = user_tokens.get("twitter_access_token")
-            
-            if not access_token:
-                return {
-                    "success": False,
-                    "error": "Missing Twitter access token",
-                    "platform": "twitter"
-                }
-            
             # Twitter v2 API for media upload and tweet creation
             headers = {
                 "Authorization": f"Bearer {access_token}",
@@ -344,35 +822,31 @@ class SocialMediaPublisher:
             media_upload_url = "https://upload.twitter.com/1.1/media/upload.json"
             
             # Create tweet with text (video upload is more complex)
-            tweet_url = f"{self.platform_configs[Platform.TWITTER]['base_url']}/tweets"
+            tweet_url = self._tweets_url
             
             tweet_data = {
-                "text": content_data["caption"][:280]  # Twitter character limit
+                "text": _trunc(content_data["caption"], 280)  # Twitter character limit
+            }
+            if content_data.get("in_reply_to_tweet_id"):
+                tweet_data["reply"] = {"in_reply_to_tweet_id": content_data["in_reply_to_tweet_id"]}
+            
+            tweet_response = await self._do_post(
+                tweet_url, "Tweet creation", json=tweet_data, headers=headers
+            )
+            tweet_id = tweet_response.get("data", {}).get("id")
+            
+            return {
+                "success": True,
+                "platform": "twitter",
+                "tweet_id": tweet_id,
+                "tweet_url": f"https://twitter.com/i/web/status/{tweet_id}",
+                "published_at": published_at
             }
             
-            async with session.post(tweet_url, json=tweet_data, headers=headers) as response:
-                if response.status not in [200, 201]:
-                    error_text = await response.text()
-                    logger.error(f"Twitter post failed: {error_text}")
-                    return {
-                        "success": False,
-                        "error": f"Tweet creation failed: {error_text}",
-                        "platform": "twitter"
-                    }
-                
-                tweet_response = await response.json()
-                tweet_id = tweet_response.get("data", {}).get("id")
-                
-                return {
-                    "success": True,
-                    "platform": "twitter",
-                    "tweet_id": tweet_id,
-                    "tweet_url": f"https://twitter.com/i/web/status/{tweet_id}",
-                    "published_at": datetime.utcnow().isoformat()
-                }
-                
         except Exception as e:
-            logger.error(f"Twitter publishing error: {e}")
+            if _is_outage(e):
+                raise  # Counted by the circuit breaker in _publish
+            logger.error("Twitter publishing error: %s", e)
             return {
                 "success": False,
                 "error": str(e),
@@ -382,24 +856,32 @@ class SocialMediaPublisher:
     async def _publish_to_facebook(
         self,
         content_data: Dict[str, Any],
-        user_tokens: Dict[str, str]
+        user_tokens: Dict[str, str],
+        published_at: str
     ) -> Dict[str, Any]:
         """Publish content to Facebook."""
+        creds, error = self._validate_tokens(Platform.FACEBOOK, user_tokens)
+        if error:
+            return error
+        access_token, page_id = creds
+        
         try:
-            session = await self._get_session()
-            access_token = user_tokens.get("facebook_access_token")
-            page_id = user_tokens.get("facebook_page_id")
+            # Facebook video upload
+            upload_url = f"{self._fb_base}/{page_id}/videos"
             
-            if not access_token or not page_id:
+            file_path = content_data.get("file_path")
+            if file_path:
+                upload_response = await self._upload_facebook_video(
+                    upload_url, file_path, access_token, content_data["caption"]
+                )
                 return {
-                    "success": False,
-                    "error": "Missing Facebook access token or page ID",
-                    "platform": "facebook"
+                    "success": True,
+                    "platform": "facebook",
+                    "post_id": upload_response.get("id"),
+                    "post_url": f"https://www.facebook.com/{page_id}/videos/{upload_response.get('id')}",
+                    "published_at": published_at
                 }
             
-            # Facebook video upload
-            upload_url = f"{self.platform_configs[Platform.FACEBOOK]['base_url']}/{page_id}/videos"
-            
             video_data = {
                 "description": content_data["caption"],
                 "file_url": content_data["video_url"],
@@ -407,34 +889,81 @@ class SocialMediaPublisher:
                 "published": True
             }
             
-            async with session.post(upload_url, data=video_data) as response:
-                if response.status not in [200, 201]:
-                    error_text = await response.text()
-                    logger.error(f"Facebook upload failed: {error_text}")
-                    return {
-                        "success": False,
-                        "error": f"Upload failed: {error_text}",
-                        "platform": "facebook"
-                    }
-                
-                upload_response = await response.json()
-                
-                return {
-                    "success": True,
-                    "platform": "facebook",
-                    "post_id": upload_response.get("id"),
-                    "post_url": f"https://www.facebook.com/{page_id}/videos/{upload_response.get('id')}",
-                    "published_at": datetime.utcnow().isoformat()
-                }
-                
+            upload_response = await self._do_post(
+                upload_url, "Upload", data=video_data
+            )
+            
+            return {
+                "success": True,
+                "platform": "facebook",
+                "post_id": upload_response.get("id"),
+                "post_url": f"https://www.facebook.com/{page_id}/videos/{upload_response.get('id')}",
+                "published_at": published_at
+            }
+            
         except Exception as e:
-            logger.error(f"Facebook publishing error: {e}")
+            if _is_outage(e):
+                raise  # Counted by the circuit breaker in _publish
+            logger.error("Facebook publishing error: %s", e)
             return {
                 "success": False,
                 "error": str(e),
                 "platform": "facebook"
             }
     
+    async def publish_twitter_thread(
+        self,
+        tweets: List[Dict[str, Any]],
+        user_tokens: Dict[str, str]
+    ) -> List[Dict[str, Any]]:
+        """
+        Publish tweets as a thread, each replying to the one before.
+        
+        Replies need the parent's id, so tweets go out one at a time over the
+        shared session; the thread stops at the first failure.
+        """
+        published_at = datetime.now(timezone.utc).isoformat()
+        limiter = self._limiters[Platform.TWITTER]
+        results = []
+        reply_to = None
+        
+        for tweet in tweets:
+            await limiter.acquire()
+            try:
+                result = await self._publish_to_twitter(
+                    {**tweet, "in_reply_to_tweet_id": reply_to} if reply_to else tweet,
+                    user_tokens,
+                    published_at
+                )
+            except Exception as e:
+                logger.error("Twitter publishing error: %s", e)
+                result = {"success": False, "error": str(e), "platform": "twitter"}
+            results.append(result)
+            if not result.get("success"):
+                break
+            reply_to = result["tweet_id"]
+        
+        return results
+    
+    async def publish_many(
+        self,
+        platform: Platform,
+        posts: List[Dict[str, Any]],
+        user_tokens: Dict[str, str],
+        concurrency: int = MAX_CONCURRENT_POSTS
+    ) -> List[Dict[str, Any]]:
+        """Publish independent posts (tweets, Facebook videos, ...) to one platform concurrently."""
+        semaphore = asyncio.Semaphore(concurrency)
+        published_at = datetime.now(timezone.utc).isoformat()
+        
+        async def _bounded(content_data: Dict[str, Any]) -> Dict[str, Any]:
+            async with semaphore:
+                return await self.publish_content(
+                    platform, content_data, user_tokens, published_at=published_at
+                )
+        
+        return await asyncio.gather(*(_bounded(post) for post in posts))
+    
     async def get_publishing_status(
         self,
         platform: Platform,
@@ -443,69 +972,79 @@ class SocialMediaPublisher:
     ) -> Dict[str, Any]:
         """Check the status of a published post."""
         try:
-            session = await self._get_session()
+            session = self.session
+            headers = None
             
             if platform == Platform.INSTAGRAM:
                 access_token = user_tokens.get("instagram_access_token")
-                status_url = f"{self.platform_configs[Platform.INSTAGRAM]['base_url']}/{post_id}"
+                status_url = f"{self._ig_base}/{post_id}"
                 params = {"fields": "id,media_type,permalink", "access_token": access_token}
                 
             elif platform == Platform.YOUTUBE_SHORTS:
                 access_token = user_tokens.get("youtube_access_token")
-                status_url = f"{self.platform_configs[Platform.YOUTUBE_SHORTS]['base_url']}/videos"
+                status_url = self._yt_videos_url
                 params = {"part": "status", "id": post_id}
                 headers = {"Authorization": f"Bearer {access_token}"}
                 
             else:
                 return {"success": False, "error": "Status check not implemented for this platform"}
             
-            async with session.get(status_url, params=params) as response:
-                if response.status == 200:
-                    status_data = await response.json()
-                    return {
-                        "success": True,
-                        "platform": platform.value,
-                        "status": "published",
-                        "data": status_data
-                    }
-                else:
+            async with session.get(status_url, params=params, headers=headers) as response:
+                if response.status != 200:
+                    # Drain the (small) error body so the connection stays in the pool
+                    await response.read()
                     return {
                         "success": False,
                         "error": f"Status check failed: {response.status}",
-                        "platform": platform.value
+                        "platform": _PLATFORM_NAMES[platform]
                     }
-                    
+                
+                return {
+                    "success": True,
+                    "platform": _PLATFORM_NAMES[platform],
+                    "status": "published",
+                    "data": await response.json(loads=orjson.loads, content_type=None)
+                }
+            
         except Exception as e:
-            logger.error(f"Status check error for {platform}: {e}")
+            logger.error("Status check error for %s: %s", platform, e)
             return {
                 "success": False,
                 "error": str(e),
-                "platform": platform.value
+                "platform": _PLATFORM_NAMES[platform]
             }
     
     async def batch_publish(
         self,
         platforms: List[Platform],
         content_data: Dict[str, Any],
-        user_tokens: Dict[str, str]
+        user_tokens: Optional[Dict[str, str]] = None,
+        user_id: Any = None
     ) -> List[Dict[str, Any]]:
-        """Publish content to multiple platforms simultaneously."""
-        tasks = []
+        """Publish content to multiple platforms, a few at a time."""
+        semaphore = asyncio.Semaphore(self._max_concurrent_publishes)
+        # The batch shares one publish moment
+        published_at = datetime.now(timezone.utc).isoformat()
         
-        for platform in platforms:
-            task = self.publish_content(platform, content_data, user_tokens)
-            tasks.append(task)
+        async def _bounded(platform: Platform) -> Dict[str, Any]:
+            async with semaphore:
+                return await self.publish_content(
+                    platform, content_data, user_tokens, user_id, published_at
+                )
         
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        results = await asyncio.gather(
+            *(_bounded(platform) for platform in platforms),
+            return_exceptions=True
+        )
         
         # Process results and handle exceptions
         processed_results = []
         for i, result in enumerate(results):
-            if isinstance(result, Exception):
+            if isinstance(result, BaseException):
                 processed_results.append({
                     "success": False,
                     "error": str(result),
-                    "platform": platforms[i].value
+                    "platform": _PLATFORM_NAMES[platforms[i]]
                 })
             else:
                 processed_results.append(result)
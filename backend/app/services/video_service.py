@@ -2,15 +2,21 @@
 Video processing service for platform-specific optimization.
 """
 
+import functools
 import os
 import subprocess
 import tempfile
 import logging
+from collections import OrderedDict, deque
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Callable, Dict, Any, List, Mapping, Optional, Tuple
 import aiofiles
+import aiofiles.os
+import aiohttp
 import asyncio
+import orjson
 import hashlib
+import shutil
 from urllib.parse import urlparse
 
 from app.core.config import settings
@@ -18,6 +24,57 @@ from app.services.cloudinary_service import cloudinary_service
 
 logger = logging.getLogger(__name__)
 
+# Hardware H.264 encoders in order of preference
+HW_ENCODERS = ("h264_nvenc", "h264_vaapi", "h264_qsv")
+VAAPI_DEVICE = "/dev/dri/renderD128"
+DEFAULT_VARIANT_BITRATE = "2M"
+VIDEO_INFO_CACHE_SIZE = 1024
+DOWNLOAD_CHUNK_SIZE = 1 << 20  # 1 MiB
+PIPE_READ_SIZE = 1 << 20  # Bytes read from FFmpeg's stdout at a time
+DOWNLOAD_TIMEOUT = aiohttp.ClientTimeout(total=None, connect=15, sock_read=60)
+SIZE_CHECK_TIMEOUT = aiohttp.ClientTimeout(total=10)
+DEFAULT_MAX_SIZE = 50 * 1024 * 1024
+# ffprobe is single-threaded; more concurrent probes than cores just thrash
+MAX_CONCURRENT_PROBES = min(8, os.cpu_count() or 1)
+
+
+@functools.lru_cache(maxsize=1)
+def _ffmpeg_available() -> bool:
+    """Check once per process whether FFmpeg is installed; spawning it costs tens of ms."""
+    try:
+        subprocess.run(
+            ["ffmpeg", "-version"],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            check=True
+        )
+        return True
+    except (subprocess.CalledProcessError, FileNotFoundError):
+        return False
+
+
+async def _run_command(cmd: List[str]) -> subprocess.CompletedProcess:
+    """
+    Run a short-lived command to completion on a worker thread.
+    
+    subprocess.run in a thread spawns faster than asyncio's subprocess
+    transport and needs no child watcher; commands whose output is streamed
+    while they run still use asyncio.create_subprocess_exec.
+    """
+    return await asyncio.to_thread(subprocess.run, cmd, capture_output=True, check=False)
+
+
+@functools.lru_cache(maxsize=1024)
+def _url_hash(url: str) -> str:
+    """Short, stable suffix for public_ids derived from a source URL or path."""
+    return hashlib.md5(url.encode(), usedforsecurity=False).hexdigest()[:8]
+
+
+@functools.lru_cache(maxsize=1024)
+def _download_key(url: str) -> str:
+    """Name of the shared temp file a URL is downloaded to."""
+    return hashlib.sha256(url.encode()).hexdigest()[:16]
+
 
 class VideoService:
     """Service for video processing and optimization."""
@@ -25,6 +82,121 @@ class VideoService:
     def __init__(self):
         self.temp_dir = Path(settings.TEMP_DIR)
         self.temp_dir.mkdir(exist_ok=True)
+        self._hw_encoder = self._detect_hw_encoder()
+        # url_hash -> info; backed by the video_metadata table across restarts
+        self._info_cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        # url_hash -> (download task, callers still using the file)
+        self._downloads: Dict[str, Tuple[asyncio.Task, int]] = {}
+        self._download_lock = asyncio.Lock()
+    
+    def _detect_hw_encoder(self) -> Optional[str]:
+        """
+        Find a usable hardware H.264 encoder, or None to stay on libx264.
+        
+        ffmpeg lists encoders it was built with whether or not the hardware
+        is present, so each candidate also has to encode a few test frames.
+        Runs once, from __init__.
+        """
+        if not _ffmpeg_available():
+            return None
+        try:
+            listing = subprocess.run(
+                ["ffmpeg", "-hide_banner", "-encoders"],
+                capture_output=True,
+                text=True,
+                check=True
+            ).stdout
+        except (subprocess.CalledProcessError, FileNotFoundError):
+            return None
+        
+        for encoder in HW_ENCODERS:
+            if encoder not in listing:
+                continue
+            input_args, filter_suffix, codec_args = self._encoder_args(encoder)
+            # The synthetic input isn't decoded, so only keep device options
+            device_args = input_args[input_args.index("-vaapi_device"):] if "-vaapi_device" in input_args else []
+            trial = subprocess.run(
+                [
+                    "ffmpeg", "-hide_banner", "-loglevel", "error",
+                    *device_args,
+                    "-f", "lavfi", "-i", "color=size=256x256:duration=0.2",
+                    *(["-vf", filter_suffix.lstrip(",")] if filter_suffix else []),
+                    *codec_args,
+                    "-f", "null", "-"
+                ],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL
+            )
+            if trial.returncode == 0:
+                logger.info("Using hardware video encoder: %s", encoder)
+                return encoder
+        return None
+    
+    @staticmethod
+    def _encoder_args(
+        encoder: Optional[str],
+        bitrate: Optional[str] = None
+    ) -> Tuple[List[str], str, List[str]]:
+        """
+        Return (input args, filter chain suffix, codec args) for an encoder.
+        
+        Decoding and encoding run on the GPU, but scale+crop stays a CPU filter:
+        scale_cuda/scale_vaapi can't crop, and the platform specs need exact
+        output dimensions. Quality is constant (CQ 23) unless a bitrate is given.
+        """
+        if encoder == "h264_nvenc":
+            rate = ["-b:v", bitrate] if bitrate else ["-cq", "23", "-b:v", "0"]
+            return (
+                ["-hwaccel", "cuda"],
+                "",
+                ["-c:v", "h264_nvenc", "-preset", "p4", *rate]
+            )
+        if encoder == "h264_vaapi":
+            rate = ["-b:v", bitrate] if bitrate else ["-qp", "23"]
+            return (
+                ["-hwaccel", "vaapi", "-hwaccel_device", VAAPI_DEVICE, "-vaapi_device", VAAPI_DEVICE],
+                ",format=nv12,hwupload",
+                ["-c:v", "h264_vaapi", *rate]
+            )
+        if encoder == "h264_qsv":
+            rate = ["-b:v", bitrate] if bitrate else ["-global_quality", "23"]
+            return (
+                ["-hwaccel", "qsv"],
+                "",
+                ["-c:v", "h264_qsv", *rate]
+            )
+        rate = ["-b:v", bitrate] if bitrate else ["-crf", "23"]
+        # fastdecode lowers playback cost on phones; the GPU encoders have no equivalent
+        return [], "", ["-c:v", "libx264", "-preset", "veryfast", "-tune", "fastdecode", *rate]
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=64)
+    def _resize_args(
+        encoder: Optional[str],
+        width: int,
+        height: int,
+        max_duration: int
+    ) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+        """
+        Return the (input, output) FFmpeg args for one resize target.
+        
+        Platform specs are a small fixed set, so each argv is built once and
+        only the input path varies per call. The output is a fragmented MP4
+        written to a pipe (see _resize_video_stream).
+        """
+        input_args, filter_suffix, codec_args = VideoService._encoder_args(encoder)
+        output_args = (
+            "-vf", f"scale={width}:{height}:force_original_aspect_ratio=increase,crop={width}:{height}{filter_suffix}",
+            "-t", str(max_duration),  # Limit duration
+            *codec_args,
+            "-c:a", "aac",
+            "-b:a", "128k",
+            # A pipe can't be seeked back to move the moov atom, so write an
+            # empty moov up front and the samples as fragments
+            "-movflags", "frag_keyframe+empty_moov+default_base_moof",
+            "-f", "mp4",
+        )
+        return tuple(input_args), output_args
     
     async def process_for_platform(
         self,
@@ -47,23 +219,23 @@ class VideoService:
             # Download video from URL
             temp_input = await self._download_video(video_url)
             
-            # Process video according to platform specs
-            temp_output = await self._resize_video(
-                temp_input,
-                platform_spec["width"],
-                platform_spec["height"],
-                platform_spec.get("max_duration", 60)
-            )
-            
-            # Upload processed video
-            processed_url = await cloudinary_service.upload_video(
-                str(temp_output),
-                f"{platform}_{hashlib.md5(video_url.encode()).hexdigest()[:8]}"
-            )
-            
-            # Cleanup temp files
-            temp_input.unlink(missing_ok=True)
-            temp_output.unlink(missing_ok=True)
+            try:
+                public_id = f"{platform}_{_url_hash(video_url)}"
+                if self._is_ffmpeg_available():
+                    # Encode straight into the upload; no temp output file
+                    processed_url = await self._resize_video_stream(
+                        temp_input,
+                        platform_spec["width"],
+                        platform_spec["height"],
+                        platform_spec.get("max_duration", 60),
+                        public_id
+                    )
+                else:
+                    # Fallback (for demo): upload the original video unchanged
+                    logger.warning("FFmpeg not available, using original video")
+                    processed_url = await cloudinary_service.upload_video(str(temp_input), public_id)
+            finally:
+                await self._release_download(video_url)
             
             return processed_url
             
@@ -71,121 +243,388 @@ class VideoService:
             logger.error(f"Failed to process video for {platform}: {e}")
             raise
     
-    async def _download_video(self, video_url: str) -> Path:
-        """Download video from URL to temporary file."""
-        try:
-            # For Cloudinary URLs, we can process directly
-            # In a production environment, you might want to download the file
-            # For now, we'll assume the video_url is accessible
-            
-            # Parse URL to get file extension
-            parsed_url = urlparse(video_url)
-            file_extension = Path(parsed_url.path).suffix or '.mp4'
-            
-            # Create temporary file
-            temp_file = self.temp_dir / f"input_{os.urandom(8).hex()}{file_extension}"
+    async def process_for_platforms(
+        self,
+        video_url: str,
+        platform_specs: Mapping[str, Mapping[str, Any]],
+        thumbnail_timestamp: Optional[float] = None
+    ) -> Dict[str, str]:
+        """
+        Process a video for several platforms from a single decode.
+        
+        The source is fetched once, every variant (and the thumbnail, if
+        requested) is encoded by one FFmpeg run (see transcode_all_variants),
+        and the results upload in parallel. The local copy is also probed
+        meanwhile, so get_video_info(video_url) is served from cache afterwards.
+        
+        Args:
+            video_url: URL of the source video
+            platform_specs: Platform name to its specifications
+            thumbnail_timestamp: Also grab a thumbnail at this many seconds
             
-            # For demo purposes, we'll return the URL as-is
-            # In production, implement actual download logic
-            return Path(video_url)  # This would be the downloaded file path
+        Returns:
+            Mapping of platform to the URL of its processed video, plus
+            "thumbnail" when a thumbnail was requested and produced
+        """
+        if not platform_specs:
+            return {}
+        
+        url_hash = _url_hash(video_url)
+        temp_input = await self._download_video(video_url)
+        thumbnail = None
+        if thumbnail_timestamp is not None:
+            thumbnail = (str(self.temp_dir / f"thumb_{os.urandom(8).hex()}.jpg"), thumbnail_timestamp)
+        outputs = [
+            (
+                platform,
+                str(self.temp_dir / f"output_{os.urandom(8).hex()}.mp4"),
+                spec["width"],
+                spec["height"],
+                spec.get("bitrate", DEFAULT_VARIANT_BITRATE),
+                spec.get("max_duration", 60)
+            )
+            for platform, spec in platform_specs.items()
+        ]
+        
+        try:
+            await asyncio.gather(
+                self.transcode_all_variants(str(temp_input), outputs, thumbnail=thumbnail),
+                self.get_video_info(video_url, probe_path=str(temp_input))
+            )
+            # Uploads are non-blocking aiohttp requests, so gathering them on
+            # the event loop already sends them in parallel
+            uploads = [
+                cloudinary_service.upload_video(output[1], f"{output[0]}_{url_hash}")
+                for output in outputs
+            ]
+            if thumbnail and Path(thumbnail[0]).exists():
+                uploads.append(cloudinary_service.upload_image(thumbnail[0], f"thumb_{url_hash}"))
+            urls = await asyncio.gather(*uploads)
+            results = {output[0]: url for output, url in zip(outputs, urls)}
+            if len(urls) > len(outputs):
+                results["thumbnail"] = urls[-1]
+            return results
             
         except Exception as e:
+            logger.error(f"Failed to process video for {', '.join(platform_specs)}: {e}")
+            raise
+        finally:
+            for output in outputs:
+                Path(output[1]).unlink(missing_ok=True)
+            if thumbnail:
+                Path(thumbnail[0]).unlink(missing_ok=True)
+            await self._release_download(video_url)
+    
+    async def _download_video(self, video_url: str) -> Path:
+        """
+        Download video from URL to a temporary file shared by concurrent callers.
+        
+        The file is keyed by URL, so every variant encoded from the same source
+        reads one local copy instead of FFmpeg re-fetching the URL per variant.
+        Each call must be paired with _release_download(), which deletes the
+        file once the last caller is done. Local paths are returned as-is.
+        """
+        parsed_url = urlparse(video_url)
+        if parsed_url.scheme not in ("http", "https"):
+            return Path(video_url)
+        
+        key = _download_key(video_url)
+        async with self._download_lock:
+            task, refs = self._downloads.get(key, (None, 0))
+            if task is None:
+                file_extension = Path(parsed_url.path).suffix or '.mp4'
+                temp_file = self.temp_dir / f"input_{key}{file_extension}"
+                task = asyncio.create_task(self._fetch(video_url, temp_file))
+            self._downloads[key] = (task, refs + 1)
+        
+        try:
+            return await asyncio.shield(task)
+        except Exception as e:
+            await self._release_download(video_url)
             logger.error(f"Failed to download video from {video_url}: {e}")
             raise
     
-    async def _resize_video(
+    @staticmethod
+    async def _fetch(video_url: str, temp_file: Path) -> Path:
+        """Stream a URL to disk, renaming into place only once it is complete."""
+        partial = temp_file.with_name(temp_file.name + ".part")
+        try:
+            async with aiohttp.ClientSession(timeout=DOWNLOAD_TIMEOUT) as session:
+                async with session.get(video_url) as resp:
+                    resp.raise_for_status()
+                    async with aiofiles.open(partial, "wb") as f:
+                        async for chunk in resp.content.iter_chunked(DOWNLOAD_CHUNK_SIZE):
+                            await f.write(chunk)
+            os.replace(partial, temp_file)
+        except BaseException:
+            partial.unlink(missing_ok=True)
+            raise
+        return temp_file
+    
+    async def _release_download(self, video_url: str):
+        """Drop one reference to a downloaded source; the last one deletes the file."""
+        key = _download_key(video_url)
+        async with self._download_lock:
+            task, refs = self._downloads.get(key, (None, 0))
+            if task is None:
+                return
+            if refs > 1:
+                self._downloads[key] = (task, refs - 1)
+                return
+            del self._downloads[key]
+        
+        if not task.done():
+            # Every caller gave up; stop the transfer (_fetch removes the partial file)
+            task.cancel()
+        elif not task.cancelled() and task.exception() is None:
+            task.result().unlink(missing_ok=True)
+    
+    async def _resize_video_stream(
         self,
         input_path: Path,
         width: int,
         height: int,
-        max_duration: int = 60
-    ) -> Path:
+        max_duration: int,
+        public_id: str
+    ) -> str:
         """
-        Resize video using FFmpeg.
+        Resize a video and upload FFmpeg's output as it is produced.
+        
+        Skips writing and re-reading a temp file. The upload's final chunk
+        is only sent once FFmpeg has exited cleanly, so a failed encode never
+        becomes a truncated asset.
         
-        Args:
-            input_path: Path to input video
-            width: Target width
-            height: Target height
-            max_duration: Maximum duration in seconds
-            
         Returns:
-            Path to resized video
+            Cloudinary URL of the processed video
         """
+        input_args, output_args = self._resize_args(self._hw_encoder, width, height, max_duration)
+        process = await asyncio.create_subprocess_exec(
+            "ffmpeg",
+            *input_args,
+            "-i", str(input_path),
+            *output_args,
+            "pipe:1",
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE
+        )
+        # Drain stderr alongside stdout so neither pipe fills up and stalls FFmpeg
+        stderr_task = asyncio.create_task(process.stderr.read())
+        
+        async def _output():
+            while chunk := await process.stdout.read(PIPE_READ_SIZE):
+                yield chunk
+            await process.wait()
+            if process.returncode != 0:
+                stderr = (await stderr_task).decode(errors="replace")
+                logger.error(f"FFmpeg error: {stderr}")
+                raise Exception(f"Video processing failed: {stderr}")
+        
         try:
-            # Create output file path
-            output_path = self.temp_dir / f"output_{os.urandom(8).hex()}.mp4"
-            
-            # For demo purposes, we'll simulate video processing
-            # In production, implement actual FFmpeg processing
+            url = await cloudinary_service.upload_video_stream(_output(), public_id)
+            logger.info(f"Video processed and streamed to Cloudinary: {public_id}")
+            return url
+        finally:
+            if process.returncode is None:
+                process.kill()
+                await process.wait()
+            stderr_task.cancel()
+    
+    async def transcode_all_variants(
+        self,
+        input_path: str,
+        outputs: List[Tuple],
+        on_progress: Optional[Callable[[float], None]] = None,
+        thumbnail: Optional[Tuple[str, float]] = None
+    ) -> Dict[str, str]:
+        """
+        Transcode every platform variant from a single decode of the input.
+        
+        The input is decoded once and fanned out with the ``split`` filter,
+        so N platforms cost one decode plus N encodes instead of N decodes.
+        A thumbnail is one more branch of the same split rather than a
+        separate generate_thumbnail pass.
+        
+        Args:
+            input_path: Path to the source video
+            outputs: List of (platform, output_path, width, height, bitrate),
+                optionally followed by a max duration in seconds
+            on_progress: Optional callback receiving seconds of output encoded
+            thumbnail: Optional (jpeg_path, timestamp) to grab a frame into
             
-            # FFmpeg command for video resizing and duration limiting
-            ffmpeg_cmd = [
-                "ffmpeg",
-                "-i", str(input_path),
-                "-vf", f"scale={width}:{height}:force_original_aspect_ratio=increase,crop={width}:{height}",
-                "-t", str(max_duration),  # Limit duration
-                "-c:v", "libx264",
-                "-preset", "fast",
-                "-crf", "23",
+        Returns:
+            Mapping of platform to output path
+        """
+        if not outputs:
+            return {}
+        
+        if not self._is_ffmpeg_available():
+            # Fallback: copy the original for each platform (for demo)
+            logger.warning("FFmpeg not available, copying original video for all variants")
+            for output in outputs:
+                shutil.copy2(input_path, output[1])
+            return {output[0]: output[1] for output in outputs}
+        
+        count = len(outputs)
+        branches = count + 1 if thumbnail else count
+        input_args, filter_suffix, _ = self._encoder_args(self._hw_encoder)
+        filters = ["[0:v]split={}{}".format(branches, "".join(f"[v{i}]" for i in range(branches)))]
+        for i, (_, _, width, height, *_) in enumerate(outputs):
+            filters.append(
+                f"[v{i}]scale={width}:{height}:force_original_aspect_ratio=increase,"
+                f"crop={width}:{height}{filter_suffix}[o{i}]"
+            )
+        if thumbnail:
+            filters.append(f"[v{count}]trim=start={thumbnail[1]},setpts=PTS-STARTPTS[thumb]")
+        
+        ffmpeg_cmd = [
+            "ffmpeg",
+            "-hide_banner",
+            "-loglevel", "error",
+            "-nostats",
+            "-progress", "pipe:2",  # Machine-readable progress on stderr
+            *input_args,
+            "-i", str(input_path),
+            "-filter_complex", ";".join(filters),
+        ]
+        for i, (_, output_path, _, _, bitrate, *rest) in enumerate(outputs):
+            ffmpeg_cmd += [
+                "-map", f"[o{i}]",
+                "-map", "0:a?",
+                *self._encoder_args(self._hw_encoder, bitrate)[2],
                 "-c:a", "aac",
                 "-b:a", "128k",
-                "-y",  # Overwrite output file
-                str(output_path)
+                "-movflags", "+faststart",
             ]
-            
-            # For demo purposes, we'll just copy the input to output
-            # In production, uncomment the FFmpeg execution below
-            
-            # Check if FFmpeg is available
-            if self._is_ffmpeg_available():
-                # Execute FFmpeg command
-                process = await asyncio.create_subprocess_exec(
-                    *ffmpeg_cmd,
-                    stdout=asyncio.subprocess.PIPE,
-                    stderr=asyncio.subprocess.PIPE
-                )
-                stdout, stderr = await process.communicate()
-                
-                if process.returncode != 0:
-                    logger.error(f"FFmpeg error: {stderr.decode()}")
-                    raise Exception(f"Video processing failed: {stderr.decode()}")
-                
-                logger.info(f"Video processed successfully: {output_path}")
-            else:
-                # Fallback: just copy the file (for demo)
-                logger.warning("FFmpeg not available, using original video")
-                output_path = input_path
-            
-            return output_path
-            
-        except Exception as e:
-            logger.error(f"Failed to resize video: {e}")
-            raise
+            if rest and rest[0]:
+                ffmpeg_cmd += ["-t", str(rest[0])]
+            ffmpeg_cmd += ["-y", str(output_path)]
+        if thumbnail:
+            ffmpeg_cmd += ["-map", "[thumb]", "-frames:v", "1", "-q:v", "2", "-y", str(thumbnail[0])]
+        
+        process = await asyncio.create_subprocess_exec(
+            *ffmpeg_cmd,
+            stdout=asyncio.subprocess.DEVNULL,
+            stderr=asyncio.subprocess.PIPE
+        )
+        
+        # Stream stderr: progress lines drive the callback, the rest is kept for errors
+        error_lines = deque(maxlen=20)
+        async for raw_line in process.stderr:
+            line = raw_line.decode(errors="replace").strip()
+            if line.startswith("out_time_ms="):
+                if on_progress:
+                    try:
+                        on_progress(int(line.split("=", 1)[1]) / 1_000_000)
+                    except ValueError:
+                        pass
+            elif "=" not in line and line:
+                error_lines.append(line)
+        
+        await process.wait()
+        if process.returncode != 0:
+            stderr_tail = "\n".join(error_lines)
+            logger.error(f"FFmpeg error: {stderr_tail}")
+            raise Exception(f"Video processing failed: {stderr_tail}")
+        
+        logger.info(f"Transcoded {count} variants in one pass: {input_path}")
+        return {output[0]: output[1] for output in outputs}
     
     def _is_ffmpeg_available(self) -> bool:
         """Check if FFmpeg is available in the system."""
+        return _ffmpeg_available()
+    
+    @staticmethod
+    def _info_key(video_path: str) -> str:
+        """
+        Cache key for a probe target.
+        
+        Remote URLs are immutable once uploaded (Cloudinary URLs are versioned);
+        local files also key on size and mtime so a rewritten file is re-probed.
+        """
         try:
-            subprocess.run(
-                ["ffmpeg", "-version"],
-                stdout=subprocess.DEVNULL,
-                stderr=subprocess.DEVNULL,
-                check=True
-            )
-            return True
-        except (subprocess.CalledProcessError, FileNotFoundError):
-            return False
+            stat = os.stat(video_path)
+            source = f"{video_path}:{stat.st_size}:{stat.st_mtime_ns}"
+        except OSError:
+            source = video_path
+        return hashlib.md5(source.encode(), usedforsecurity=False).hexdigest()
+    
+    def _remember_info(self, key: str, info: Dict[str, Any]) -> Dict[str, Any]:
+        self._info_cache[key] = info
+        self._info_cache.move_to_end(key)
+        while len(self._info_cache) > VIDEO_INFO_CACHE_SIZE:
+            self._info_cache.popitem(last=False)
+        return info
+    
+    @staticmethod
+    def _load_info(key: str) -> Optional[Dict[str, Any]]:
+        from app.core.database import SessionLocal
+        from app.models.video import VideoMetadata
+        
+        db = SessionLocal()
+        try:
+            row = db.get(VideoMetadata, key)
+            return row.to_info() if row else None
+        finally:
+            db.close()
+    
+    @staticmethod
+    def _store_info(key: str, info: Dict[str, Any]):
+        from app.core.database import SessionLocal
+        from app.models.video import VideoMetadata
+        
+        db = SessionLocal()
+        try:
+            db.merge(VideoMetadata(url_hash=key, **info))
+            db.commit()
+        finally:
+            db.close()
     
-    async def get_video_info(self, video_path: str) -> Dict[str, Any]:
+    async def get_video_info(self, video_path: str, probe_path: Optional[str] = None) -> Dict[str, Any]:
         """
-        Get video information using FFprobe.
+        Get video information, probing with FFprobe only on a cache miss.
+        
+        Results are cached in memory and in the video_metadata table, so a
+        video is probed once no matter how often it is validated.
         
         Args:
             video_path: Path to video file
+            probe_path: Local copy of video_path to probe instead, if any
             
         Returns:
             Dictionary with video information
         """
+        key = self._info_key(video_path)
+        info = self._info_cache.get(key)
+        if info is not None:
+            self._info_cache.move_to_end(key)
+            return info
+        
+        try:
+            info = await asyncio.to_thread(self._load_info, key)
+        except Exception as e:
+            logger.warning(f"Video metadata lookup failed: {e}")
+            info = None
+        if info is not None:
+            return self._remember_info(key, info)
+        
+        info = await self._probe_video_info(probe_path or video_path)
+        if info and self._is_ffmpeg_available():
+            try:
+                await asyncio.to_thread(self._store_info, key, info)
+            except Exception as e:
+                logger.warning(f"Failed to store video metadata: {e}")
+            self._remember_info(key, info)
+        return info
+    
+    @staticmethod
+    def _parse_rational(value: str) -> float:
+        """Parse an FFprobe rational such as "30000/1001"; 0.0 when undefined."""
+        num, _, den = value.partition("/")
+        den = int(den) if den else 1
+        return int(num) / den if den else 0.0
+    
+    async def _probe_video_info(self, video_path: str) -> Dict[str, Any]:
+        """Run FFprobe on a video and extract the fields get_video_info returns."""
         try:
             if not self._is_ffmpeg_available():
                 return {
@@ -206,19 +645,13 @@ class VideoService:
                 video_path
             ]
             
-            process = await asyncio.create_subprocess_exec(
-                *cmd,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE
-            )
-            stdout, stderr = await process.communicate()
+            result = await _run_command(cmd)
             
-            if process.returncode != 0:
-                logger.error(f"FFprobe error: {stderr.decode()}")
+            if result.returncode != 0:
+                logger.error(f"FFprobe error: {result.stderr.decode()}")
                 return {}
             
-            import json
-            info = json.loads(stdout.decode())
+            info = orjson.loads(result.stdout)
             
             # Extract video stream info
             video_stream = next(
@@ -233,7 +666,7 @@ class VideoService:
                 "duration": float(info["format"].get("duration", 0)),
                 "width": int(video_stream.get("width", 0)),
                 "height": int(video_stream.get("height", 0)),
-                "fps": eval(video_stream.get("r_frame_rate", "0/1")),
+                "fps": self._parse_rational(video_stream.get("r_frame_rate", "0/1")),
                 "file_size": int(info["format"].get("size", 0))
             }
             
@@ -271,21 +704,16 @@ class VideoService:
                 str(thumbnail_path)
             ]
             
-            process = await asyncio.create_subprocess_exec(
-                *cmd,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE
-            )
-            await process.communicate()
+            result = await _run_command(cmd)
             
-            if process.returncode != 0 or not thumbnail_path.exists():
+            if result.returncode != 0 or not thumbnail_path.exists():
                 logger.error("Failed to generate thumbnail")
                 return None
             
             # Upload thumbnail to Cloudinary
             thumbnail_url = await cloudinary_service.upload_image(
                 str(thumbnail_path),
-                f"thumb_{hashlib.md5(video_path.encode()).hexdigest()[:8]}"
+                f"thumb_{_url_hash(video_path)}"
             )
             
             # Cleanup
@@ -297,10 +725,33 @@ class VideoService:
             logger.error(f"Failed to generate thumbnail: {e}")
             return None
     
+    @staticmethod
+    async def _cheap_size(file_path: str) -> Optional[int]:
+        """
+        Size of a local file or remote URL without probing it.
+        
+        Raises FileNotFoundError when the file or URL doesn't exist; returns
+        None when a remote size can't be determined.
+        """
+        if urlparse(file_path).scheme not in ("http", "https"):
+            return (await aiofiles.os.stat(file_path)).st_size
+        
+        try:
+            async with aiohttp.ClientSession(timeout=SIZE_CHECK_TIMEOUT) as session:
+                async with session.head(file_path, allow_redirects=True) as resp:
+                    if resp.status == 404:
+                        raise FileNotFoundError(file_path)
+                    return resp.content_length if resp.status < 400 else None
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            return None
+    
     async def validate_video(self, file_path: str, platform_spec: Dict[str, Any]) -> Dict[str, Any]:
         """
         Validate video against platform specifications.
         
+        The file size is checked first (stat or HEAD), so a missing or
+        oversized file is rejected without spawning FFprobe.
+        
         Args:
             file_path: Path to video file
             platform_spec: Platform specifications
@@ -308,6 +759,24 @@ class VideoService:
         Returns:
             Validation result with any issues
         """
+        max_size = platform_spec.get("max_size", DEFAULT_MAX_SIZE)
+        try:
+            size = await self._cheap_size(file_path)
+        except FileNotFoundError:
+            return {
+                "valid": False,
+                "issues": [f"Video not found: {file_path}"],
+                "info": {}
+            }
+        except OSError:
+            size = None
+        if size is not None and size > max_size:
+            return {
+                "valid": False,
+                "issues": [f"File too large: {size} bytes > {max_size} bytes"],
+                "info": {"file_size": size}
+            }
+        
         try:
             info = await self.get_video_info(file_path)
             
@@ -318,8 +787,8 @@ class VideoService:
                 issues.append(f"Video too long: {info['duration']}s > {platform_spec['max_duration']}s")
             
             # Check file size
-            if info.get("file_size", 0) > platform_spec.get("max_size", 50 * 1024 * 1024):
-                issues.append(f"File too large: {info['file_size']} bytes > {platform_spec['max_size']} bytes")
+            if info.get("file_size", 0) > max_size:
+                issues.append(f"File too large: {info['file_size']} bytes > {max_size} bytes")
             
             # Check aspect ratio (basic check)
             width = info.get("width", 0)
@@ -345,6 +814,33 @@ class VideoService:
                 "info": {}
             }
 
+    
+    async def validate_videos_bulk(
+        self,
+        file_paths: List[str],
+        platform_spec: Dict[str, Any]
+    ) -> List[Dict[str, Any]]:
+        """
+        Validate several videos against the same platform specifications.
+        
+        Runs validate_video concurrently, with at most MAX_CONCURRENT_PROBES
+        probes in flight; cached videos return without spawning FFprobe.
+        
+        Args:
+            file_paths: Paths or URLs of the videos
+            platform_spec: Platform specifications
+            
+        Returns:
+            Validation results, in the same order as file_paths
+        """
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_PROBES)
+        
+        async def _validate(file_path: str) -> Dict[str, Any]:
+            async with semaphore:
+                return await self.validate_video(file_path, platform_spec)
+        
+        return await asyncio.gather(*(_validate(path) for path in file_paths))
+
 
 # Global instance
 video_service = VideoService() 
\ No newline at end of file
@@ -0,0 +1,12 @@
+"""
+Background workers for Capora.
+
+Run with: arq app.workers.WorkerSettings
+"""
+
+from app.workers.video import WorkerSettings, task_create_variants
+
+__all__ = [
+    "WorkerSettings",
+    "task_create_variants",
+]
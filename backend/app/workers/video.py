@@ -0,0 +1,35 @@
+"""
+Video processing worker tasks executed outside the API process.
+"""
+
+from typing import List
+
+from arq.connections import RedisSettings
+
+from app.core.config import settings
+from app.api.videos import create_video_variants_optimized, init_upload_directories
+
+
+async def task_create_variants(
+    ctx: dict,
+    content_id: str,
+    original_path: str,
+    platforms: List[str]
+) -> None:
+    """Create all platform variants for an uploaded video."""
+    # In-memory status lives in the API process, so don't hold the job open for polling
+    await create_video_variants_optimized(content_id, original_path, platforms, status_ttl=0)
+
+
+async def startup(ctx: dict) -> None:
+    """Prepare the worker's output directories once."""
+    init_upload_directories()
+
+
+class WorkerSettings:
+    """arq worker configuration."""
+    
+    functions = [task_create_variants]
+    on_startup = startup
+    redis_settings = RedisSettings.from_dsn(settings.REDIS_URL) if settings.REDIS_URL else RedisSettings()
+    max_jobs = 2  # Transcoding is CPU bound - keep concurrency low